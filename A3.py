@@ -1,6 +1,5 @@
 import json
 import re
-import matplotlib.pyplot as plt
 from datetime import datetime
 
 
@@ -452,6 +451,7 @@ class VisualizationDecorator:
     
     def generate_bar_chart(self, title, filename):
         """Generate bar chart for project categories"""
+        import matplotlib.pyplot as plt  # loaded only when a chart is drawn
         categories = {}
         for project in self.projects:
             cat = project.get_category()
@@ -470,6 +470,7 @@ class VisualizationDecorator:
     
     def generate_pie_chart(self, title, filename):
         """Generate pie chart for funding distribution"""
+        import matplotlib.pyplot as plt
         total_funding = {}
         for project in self.projects:
             cat = project.get_category()
@@ -497,6 +498,7 @@ class VisualizationDecorator:
     
     def generate_line_chart(self, title, filename):
         """Generate line chart for projects over years"""
+        import matplotlib.pyplot as plt
         years = {}
         for project in self.projects:
             year = project._Project__year_started
@@ -386,29 +386,23 @@ class TestVisualizationDecorator(unittest.TestCase):
         
         self.visualizer = VisualizationDecorator(self.projects)
     
-    @patch('matplotlib.pyplot.show')
-    @patch('matplotlib.pyplot.savefig')
-    def test_bar_chart_generation(self, mock_savefig, mock_show):
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_bar_chart_generation(self, mock_savefig):
         """Test bar chart generation"""
         self.visualizer.generate_bar_chart("Test", "test_output")
         mock_savefig.assert_called_once_with('test_output_bar_chart.png')
-        mock_show.assert_called_once()
     
-    @patch('matplotlib.pyplot.show')
-    @patch('matplotlib.pyplot.savefig')
-    def test_pie_chart_generation(self, mock_savefig, mock_show):
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_pie_chart_generation(self, mock_savefig):
         """Test pie chart generation"""
         self.visualizer.generate_pie_chart("Test", "test_output")
         mock_savefig.assert_called_once_with('test_output_pie_chart.png')
-        mock_show.assert_called_once()
     
-    @patch('matplotlib.pyplot.show')
-    @patch('matplotlib.pyplot.savefig')
-    def test_line_chart_generation(self, mock_savefig, mock_show):
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_line_chart_generation(self, mock_savefig):
         """Test line chart generation"""
         self.visualizer.generate_line_chart("Test", "test_output")
         mock_savefig.assert_called_once_with('test_output_line_chart.png')
-        mock_show.assert_called_once()
 
 class TestFunctionality(unittest.TestCase):
     
@@ -449,9 +443,8 @@ class TestFunctionality(unittest.TestCase):
         self.assertIsInstance(project, EnhancedCurrentProject)
     
     @patch('builtins.open', new_callable=mock_open)
-    @patch('matplotlib.pyplot.show')
-    @patch('matplotlib.pyplot.savefig')
-    def test_generate_summary_report(self, mock_savefig, mock_show, mock_file):
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_generate_summary_report(self, mock_savefig, mock_file):
         """Test generating summary report"""
         generate_summary_report([self.project1, self.project2], "category", "Solar energy")
         
@@ -460,7 +453,6 @@ class TestFunctionality(unittest.TestCase):
         
         # Check that visualizations were generated
         self.assertEqual(mock_savefig.call_count, 3)  # bar, pie, line charts
-        self.assertEqual(mock_show.call_count, 3)
 
 class TestFileOperations(unittest.TestCase):
     
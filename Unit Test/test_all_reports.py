@@ -0,0 +1,76 @@
+import unittest
+import os
+import tempfile
+from unittest.mock import patch
+from A3 import (
+    Project, EnhancedProject, ProjectManager, Location, generate_summary_report, generate_all_reports
+)
+from A3.reporting import group_projects
+
+class TestAllReports(unittest.TestCase):
+
+    def setUp(self):
+        """Set up projects across two categories and three states"""
+        ProjectManager._instance = None
+        self.temp_dir = tempfile.TemporaryDirectory()
+        states = [("Victoria", "Geelong"), ("Tasmania", "Hobart"), ("Queensland", "Cairns")]
+        self.projects = []
+        for i in range(12):
+            state, city = states[i % 3]
+            project = EnhancedProject(f"P{i}", "Solar energy" if i % 2 else "Wind energy", str(2015 + i % 4),
+                                      Location(state, city), "$1.00m")
+            project.set_funding(1000.0 * i)
+            self.projects.append(project)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        ProjectManager._instance = None
+        Project.projects = []
+
+    def run_in(self, name, function):
+        directory = os.path.join(self.temp_dir.name, name)
+        os.mkdir(directory)
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            with patch('matplotlib.figure.Figure.savefig') as mock_savefig:
+                function()
+        finally:
+            os.chdir(cwd)
+        contents = {}
+        for filename in os.listdir(directory):
+            with open(os.path.join(directory, filename)) as file:
+                contents[filename] = file.read()
+        return contents, sorted(call.args[0] for call in mock_savefig.call_args_list)
+
+    def test_group_projects_single_pass(self):
+        """Test grouping keeps first-seen order and project order"""
+        by_category, by_state = group_projects(self.projects)
+        self.assertEqual(list(by_category), ["Wind energy", "Solar energy"])
+        self.assertEqual(list(by_state), ["Victoria", "Tasmania", "Queensland"])
+        self.assertEqual([p.get_name() for p in by_state["Tasmania"]], ["P1", "P4", "P7", "P10"])
+
+    def test_matches_looped_reports(self):
+        """Test the batch mode writes the same reports and charts as one call per value"""
+        def looped():
+            for category in ["Wind energy", "Solar energy"]:
+                generate_summary_report(self.projects, "category", category)
+            for state in ["Victoria", "Tasmania", "Queensland"]:
+                generate_summary_report(self.projects, "state", state)
+
+        expected, expected_charts = self.run_in("looped", looped)
+        batch, batch_charts = self.run_in("batch", lambda: generate_all_reports(self.projects))
+        self.assertEqual(len(expected), 5)
+        self.assertEqual(batch, expected)
+        self.assertEqual(batch_charts, expected_charts)
+
+    def test_from_manager(self):
+        """Test the batch mode accepts the ProjectManager"""
+        manager = ProjectManager()
+        manager.projects = self.projects
+        reports, charts = self.run_in("manager", lambda: self.assertEqual(generate_all_reports(manager), 5))
+        self.assertIn("Total Projects Found: 4", reports["ARENA_report_Queensland.txt"])
+        self.assertEqual(len(charts), 15)
+
+if __name__ == '__main__':
+    unittest.main()
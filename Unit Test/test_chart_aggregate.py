@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import patch
+from A3 import EnhancedProject, Location, ProjectTable, ChartAggregate, VisualizationDecorator
+
+class CountingList(list):
+    """A list that counts how many times it is iterated"""
+
+    iterations = 0
+
+    def __iter__(self):
+        self.iterations += 1
+        return super().__iter__()
+
+class TestChartAggregate(unittest.TestCase):
+
+    def setUp(self):
+        """Set up projects with and without funding"""
+        location = Location("Victoria", "Melbourne")
+        self.projects = CountingList([
+            EnhancedProject("Solar 1", "Solar energy", "2020", location),
+            EnhancedProject("Wind 1", "Wind energy", "2021", location),
+            EnhancedProject("Solar 2", "Solar energy", "2021", location),
+        ])
+        self.projects[0].set_funding(100.0)
+        self.projects[2].set_funding(50.0)
+
+    def test_one_pass_for_all_three_charts(self):
+        """Test the chart jobs share one aggregation pass"""
+        with patch('matplotlib.figure.Figure.savefig'):
+            visualizer = VisualizationDecorator(self.projects)
+            jobs = visualizer.chart_jobs("T", "out")
+        self.assertEqual(self.projects.iterations, 1)
+        self.assertEqual([job[1] for job in jobs], [
+            {"Solar energy": 2, "Wind energy": 1},
+            {"Solar energy": 150.0},
+            {"2020": 1, "2021": 2},
+        ])
+
+    def test_pie_falls_back_to_counts(self):
+        """Test unfunded projects chart their counts without another pass"""
+        for project in self.projects:
+            project.set_funding(0)
+        self.projects.iterations = 0
+        aggregate = ChartAggregate.from_projects(self.projects)
+        self.assertEqual(aggregate.pie_data(), {"Solar energy": 2, "Wind energy": 1})
+        self.assertEqual(self.projects.iterations, 1)
+
+    def test_matches_table_and_reuse(self):
+        """Test list and table aggregates agree and a given aggregate is reused"""
+        from_list = ChartAggregate.from_projects(self.projects)
+        from_table = ChartAggregate.from_projects(ProjectTable.from_projects(self.projects))
+        self.assertEqual(from_list.count_by_category, from_table.count_by_category)
+        self.assertEqual(from_list.count_by_year, from_table.count_by_year)
+        self.assertEqual(from_list.pie_data(), from_table.pie_data())
+
+        visualizer = VisualizationDecorator(self.projects, aggregate=from_list)
+        self.assertIs(visualizer.aggregate(), from_list)
+        self.assertEqual(visualizer._count_by_year(), {"2020": 1, "2021": 2})
+        self.assertEqual(self.projects.iterations, 2)
+
+if __name__ == '__main__':
+    unittest.main()
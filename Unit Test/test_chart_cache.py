@@ -0,0 +1,68 @@
+import unittest
+import os
+import tempfile
+from unittest.mock import patch
+from A3 import ChartCache
+from A3.visualization import render_charts
+
+class TestChartCache(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a cache in a scratch directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+        self.cache = ChartCache(self.cache_dir, max_entries=3)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def job(self, data, name="report", title="Solar Analysis"):
+        return ("bar", data, title, self.path(name))
+
+    def test_hit_reuses_png_under_new_name(self):
+        """Test identical inputs are copied from the cache instead of re-rendered"""
+        render_charts([self.job({"Solar energy": 3})], cache=self.cache)
+        with patch('matplotlib.figure.Figure.savefig') as mock_savefig:
+            paths = render_charts([self.job({"Solar energy": 3}, name="other")], cache=self.cache)
+        mock_savefig.assert_not_called()
+        with open(self.path("report_bar_chart.png"), 'rb') as first, open(paths[0], 'rb') as second:
+            self.assertEqual(first.read(), second.read())
+        self.assertEqual(self.cache.stats(), {'hits': 1, 'misses': 1, 'evictions': 0, 'entries': 1})
+
+    def test_key_covers_data_order_and_title(self):
+        """Test changed data, ordering or title produce different keys"""
+        base = self.cache.key(self.job({"A": 1, "B": 2}))
+        self.assertEqual(base, self.cache.key(self.job({"A": 1, "B": 2}, name="elsewhere")))
+        self.assertNotEqual(base, self.cache.key(self.job({"B": 2, "A": 1})))
+        self.assertNotEqual(base, self.cache.key(self.job({"A": 1, "B": 3})))
+        self.assertNotEqual(base, self.cache.key(self.job({"A": 1, "B": 2}, title="Wind Analysis")))
+        self.assertNotEqual(base, self.cache.key(("pie", {"A": 1, "B": 2}, "Solar Analysis", "x")))
+
+    def test_lru_eviction_is_bounded(self):
+        """Test the least recently used chart is evicted once the cache is full"""
+        for count in range(3):
+            render_charts([self.job({"A": count + 1})], cache=self.cache)
+        render_charts([self.job({"A": 1})], cache=self.cache)   # refresh the oldest
+        render_charts([self.job({"A": 9})], cache=self.cache)   # evicts {"A": 2}
+
+        self.assertEqual(len(self.cache), 3)
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 3)
+        self.assertTrue(self.cache.fetch(self.cache.key(self.job({"A": 1})), self.path("check.png")))
+        self.assertFalse(self.cache.fetch(self.cache.key(self.job({"A": 2})), self.path("check.png")))
+
+    def test_reloads_existing_entries_and_hardlinks(self):
+        """Test a new cache instance finds earlier charts and can hard-link them"""
+        render_charts([self.job({"A": 1})], cache=self.cache)
+        cache = ChartCache(self.cache_dir, hardlink=True)
+        self.assertEqual(len(cache), 1)
+        render_charts([self.job({"A": 1}, name="linked")], cache=cache)
+        self.assertEqual(cache.hits, 1)
+        linked = os.stat(self.path("linked_bar_chart.png"))
+        self.assertEqual(linked.st_nlink, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout, redirect_stderr
+from unittest.mock import patch
+from A3 import Project, EnhancedProject, ProjectManager, Location, run_cli
+from A3.journal import ChangeJournal
+
+class TestRunCli(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a working directory holding a small JSON data file"""
+        ProjectManager._instance = None
+        self.cwd = os.getcwd()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.temp_dir.name)
+        manager = ProjectManager()
+        solar = EnhancedProject("Solar 1", "Solar energy", "2020", Location("Victoria", "Melbourne"),
+                                "$1.00m", "01/01/2020 – 31/12/2021")
+        wind = EnhancedProject("Wind 1", "Wind energy", "2021", Location("Tasmania", "Hobart"))
+        manager.projects = [solar, wind]
+        manager.save_to_json()
+        ProjectManager._instance = None
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.temp_dir.cleanup()
+        ProjectManager._instance = None
+        Project.projects = []
+
+    def run_cli(self, *argv, stdin=None):
+        """Run a command in a fresh manager; return its status and JSON Lines output"""
+        ProjectManager._instance = None
+        out = io.StringIO()
+        with redirect_stdout(out), redirect_stderr(io.StringIO()), \
+                patch('sys.stdin', io.StringIO(stdin or "")):
+            status = run_cli(list(argv))
+        return status, [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_list_and_search(self):
+        """Test list and search print one project record per line"""
+        status, records = self.run_cli("list")
+        self.assertEqual(status, 0)
+        self.assertEqual([record['name'] for record in records], ["Solar 1", "Wind 1"])
+
+        self.assertEqual(self.run_cli("search", "--state", "Tasmania")[1][0]['name'], "Wind 1")
+        self.assertEqual(self.run_cli("search", "--name", "Solar 1")[1][0]['budget'], "$1.00m")
+        self.assertEqual([r['name'] for r in self.run_cli("search", "--active", "01/06/2021")[1]], ["Solar 1"])
+        self.assertEqual(self.run_cli("search", "--active", "June")[0], 1)
+
+    def test_create_from_jsonl(self):
+        """Test valid records are created and saved and bad lines are reported"""
+        stdin = "\n".join([
+            json.dumps({"name": "Battery 1", "category": "Battery storage", "year_started": "2022",
+                        "location": "Hobart, Tasmania", "funding": 10.0}),
+            json.dumps({"name": "Bad", "category": "Nope", "year_started": "2022", "location": "Hobart, Tasmania"}),
+            "{not json",
+        ])
+        status, results = self.run_cli("create", "--from-jsonl", "-", stdin=stdin)
+        self.assertEqual(status, 1)
+        self.assertEqual(results[0], {"line": 1, "name": "Battery 1"})
+        self.assertEqual(results[1], {"line": 2, "errors": ["Invalid category: Nope"]})
+        self.assertEqual(results[2]['line'], 3)
+
+        # Saved once for the batch, with nothing left to replay from the journal
+        names = [record['name'] for record in self.run_cli("list")[1]]
+        self.assertEqual(names, ["Solar 1", "Wind 1", "Battery 1"])
+        self.assertEqual(len(ChangeJournal("ARENA_projects.journal")), 0)
+
+    def test_read_only_commands_write_no_journal(self):
+        """Test list, search and export to stdout leave the working directory unchanged"""
+        before = sorted(os.listdir("."))
+        for argv in (["list"], ["search", "--state", "Victoria"], ["export", "-"]):
+            with self.subTest(argv=argv):
+                self.assertEqual(self.run_cli(*argv)[0], 0)
+                self.assertEqual(sorted(os.listdir(".")), before)
+
+    def test_list_output_round_trips_through_create(self):
+        """Test records printed by list, with and without budget or period, are accepted by create"""
+        listed = self.run_cli("list")[1]
+        with open("listed.jsonl", "w") as file:
+            file.writelines(json.dumps(record) + "\n" for record in listed)
+
+        status, results = self.run_cli("create", "--from-jsonl", "listed.jsonl")
+        self.assertEqual(status, 0)
+        self.assertEqual(results, [{"line": 1, "name": "Solar 1"}, {"line": 2, "name": "Wind 1"}])
+        self.assertEqual(self.run_cli("list")[1], listed + listed)
+
+    def test_export_and_import(self):
+        """Test exports round-trip through list and import appends text exports"""
+        self.assertEqual(self.run_cli("export", "projects.jsonl")[1], [
+            {"file": "projects.jsonl", "format": "jsonl", "count": 2}])
+        with open("projects.jsonl") as file:
+            self.assertEqual([json.loads(line) for line in file], self.run_cli("list")[1])
+
+        self.run_cli("export", "projects.txt", "--format", "text")
+        status, results = self.run_cli("import", "projects.txt")
+        self.assertEqual((status, results[0]['count'], results[0]['error']), (0, 2, None))
+        self.assertEqual(len(self.run_cli("list")[1]), 4)
+
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_report(self, mock_savefig):
+        """Test report prints the files written and a null report for no match"""
+        status, results = self.run_cli("report", "state", "Victoria", "--no-cache")
+        self.assertEqual(status, 0)
+        self.assertEqual(results[0]['report'], "ARENA_report_Victoria.txt")
+        self.assertEqual(len(results[0]['charts']), 3)
+
+        self.assertEqual(len(self.run_cli("report", "all", "--no-cache")[1]), 4)
+        status, results = self.run_cli("report", "category", "Bioenergy")
+        self.assertEqual((status, results[0]['report']), (1, None))
+
+    def test_usage_errors(self):
+        """Test bad arguments exit with argparse's usage error"""
+        for argv in (["report", "state"], ["export", "-", "--format", "text"], ["search"], ["fly"]):
+            with self.subTest(argv=argv), redirect_stderr(io.StringIO()):
+                with self.assertRaises(SystemExit) as raised:
+                    run_cli(argv)
+                self.assertEqual(raised.exception.code, 2)
+
+if __name__ == '__main__':
+    unittest.main()
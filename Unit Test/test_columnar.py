@@ -0,0 +1,85 @@
+import unittest
+import os
+import tempfile
+from unittest.mock import patch
+from A3 import (
+    Project, Location, ProjectManager, ProjectTable, EnhancedProject, EnhancedPastProject,
+    VisualizationDecorator, generate_summary_report
+)
+from A3.columnar import open_columnar, write_columnar, ColumnarFormatError
+
+class TestColumnarFile(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, "projects.columns")
+        self.projects = [
+            EnhancedProject("Solar Café", "Solar energy", "2020", Location("New South Wales", "Sydney"),
+                            "$1.50m", "01/01/2020 – 31/12/2025"),
+            EnhancedPastProject("Wind", "Wind energy", "2018", Location("Victoria", "Melbourne")),
+            EnhancedProject("Solar 2", "Solar energy", "2021", Location("Victoria", "Geelong")),
+        ]
+        for project, funding in zip(self.projects, [10.0, 20.0, 30.0]):
+            project.set_funding(funding)
+            project.set_total_cost(funding * 3)
+        write_columnar(self.filename, self.projects)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_columns_are_read_only_views(self):
+        """Test numeric columns are zero-copy, read-only arrays"""
+        table = open_columnar(self.filename)
+        self.assertEqual(len(table), 3)
+        self.assertFalse(table.funding.flags.writeable)
+        with self.assertRaises(ValueError):
+            table.funding[0] = 1.0
+
+    def test_rows_materialise_on_access(self):
+        """Test rows rebuild the original projects"""
+        table = open_columnar(self.filename)
+        restored = table.get_projects()
+        self.assertEqual([p.to_dict() for p in restored], [p.to_dict() for p in self.projects])
+        self.assertIsInstance(restored[1], EnhancedPastProject)
+
+    def test_aggregates_match_in_memory_table(self):
+        """Test filters and aggregations match a ProjectTable built in memory"""
+        mapped = open_columnar(self.filename)
+        in_memory = ProjectTable.from_projects(self.projects)
+        for table in (mapped, in_memory):
+            table_victoria = table.select(table.state_mask("Victoria"))
+            self.assertEqual(table_victoria.count_by_category(), {"Wind energy": 1, "Solar energy": 1})
+            self.assertEqual(table_victoria.count_by_year(), {"2018": 1, "2021": 1})
+        self.assertEqual(VisualizationDecorator(mapped)._funding_by_category(),
+                         VisualizationDecorator(self.projects)._funding_by_category())
+
+    def test_empty_and_invalid_files(self):
+        """Test empty datasets open and foreign files are rejected"""
+        write_columnar(self.filename, [])
+        self.assertEqual(len(open_columnar(self.filename)), 0)
+
+        with open(self.filename, 'wb') as file:
+            file.write(b"definitely not columnar data")
+        with self.assertRaises(ColumnarFormatError):
+            open_columnar(self.filename)
+
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_summary_report_over_mapped_file(self, mock_savefig):
+        """Test a report runs directly over the mapped view"""
+        ProjectManager._instance = None
+        manager = ProjectManager()
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        try:
+            generate_summary_report(manager.open_columnar(self.filename), "category", "Solar energy")
+            with open("ARENA_report_Solar_energy.txt") as file:
+                content = file.read()
+        finally:
+            os.chdir(cwd)
+            ProjectManager._instance = None
+            Project.projects = []
+        self.assertIn("Total Projects Found: 2", content)
+        self.assertIn("Solar Café", content)
+
+if __name__ == '__main__':
+    unittest.main()
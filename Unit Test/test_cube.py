@@ -0,0 +1,106 @@
+import unittest
+import os
+import tempfile
+from unittest.mock import patch
+from A3 import (
+    Project, EnhancedProject, ProjectManager, AggregateCube, Location,
+    InvalidBudgetException, generate_summary_report
+)
+from A3.visualization import ChartAggregate
+
+class TestAggregateCube(unittest.TestCase):
+
+    def setUp(self):
+        """Set up projects across two categories, states and years"""
+        self.projects = [
+            EnhancedProject("Solar 1", "Solar energy", "2020", Location("Victoria", "Melbourne")),
+            EnhancedProject("Solar 2", "Solar energy", "2021", Location("Tasmania", "Hobart")),
+            EnhancedProject("Wind 1", "Wind energy", "2021", Location("Victoria", "Geelong")),
+        ]
+        for project, funding in zip(self.projects, [0.1, 0.2, 1000.0]):
+            project.set_funding(funding)
+            project.set_total_cost(funding * 2)
+        self.projects[0].set_budget("$1.50m")
+        self.cube = AggregateCube(self.projects)
+
+    def test_rollup_and_slice(self):
+        """Test roll-ups sum cells and slices keep only matching cells"""
+        self.assertEqual(self.cube.rollup(), [3, 200060, 100030, 150000000])
+        self.assertEqual(self.cube.rollup('state'), {"Victoria": [2, 200020, 100010, 150000000],
+                                                     "Tasmania": [1, 40, 20, 0]})
+        self.assertEqual(self.cube.rollup('category', 'year')[("Solar energy", "2021")], [1, 40, 20, 0])
+
+        victoria = self.cube.slice(state="Victoria")
+        self.assertEqual(len(victoria), 2)
+        self.assertEqual(victoria.count_by_category(), {"Solar energy": 1, "Wind energy": 1})
+        self.assertEqual(self.cube.split("category")["Wind energy"].total_funding_cents(), 100000)
+
+    def test_matches_chart_aggregate(self):
+        """Test the cube gives the same chart data as a pass over the projects"""
+        from_cube = ChartAggregate.from_projects(self.cube)
+        from_list = ChartAggregate.from_projects(self.projects)
+        self.assertEqual(from_cube.count_by_category, from_list.count_by_category)
+        self.assertEqual(from_cube.count_by_year, from_list.count_by_year)
+        self.assertAlmostEqual(from_cube.funding_by_category["Solar energy"], 0.3)
+
+    def test_remove_leaves_no_residue(self):
+        """Test removing every project empties the cube exactly"""
+        for project in self.projects:
+            self.cube.remove(project)
+        self.assertEqual(self.cube.cells, {})
+        self.assertEqual(self.cube.rollup(), [0, 0, 0, 0])
+
+class TestManagerCube(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a manager holding two projects"""
+        ProjectManager._instance = None
+        self.manager = ProjectManager()
+        self.solar = EnhancedProject("Solar 1", "Solar energy", "2020", Location("Victoria", "Melbourne"))
+        self.wind = EnhancedProject("Wind 1", "Wind energy", "2021", Location("Victoria", "Geelong"))
+        self.solar.set_funding(500.0)
+        self.manager.projects = [self.solar, self.wind]
+
+    def tearDown(self):
+        ProjectManager._instance = None
+        Project.projects = []
+
+    def test_edits_move_cells(self):
+        """Test creates and edits through the manager update the cube"""
+        self.manager.set_category(self.wind, "Solar energy")
+        self.manager.set_year_started(self.solar, "2019")
+        self.manager.set_location(self.wind, Location("Tasmania", "Hobart"))
+        self.manager.set_budget(self.solar, "$2k")
+        project = EnhancedProject("Hydro 1", "Hydro energy", "2022", Location("Tasmania", "Hobart"))
+        self.manager.add_project(project)
+
+        self.assertEqual(self.manager.cube.cells, AggregateCube(self.manager.projects).cells)
+        self.assertEqual(self.manager.cube.count_by_category(), {"Solar energy": 2, "Hydro energy": 1})
+        self.assertEqual(self.manager.cube.slice(state="Tasmania").count_by_year(), {"2021": 1, "2022": 1})
+        self.assertEqual(self.manager.cube.total_budget_cents(), 200000)
+
+    def test_invalid_edit_keeps_cell(self):
+        """Test a rejected budget leaves the project counted once"""
+        with self.assertRaises(InvalidBudgetException):
+            self.manager.set_budget(self.solar, "lots")
+        self.assertEqual(len(self.manager.cube), 2)
+
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_report_reads_cube(self, mock_savefig):
+        """Test a manager report takes its chart data from the cube"""
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                with patch.object(ChartAggregate, 'from_projects', wraps=ChartAggregate.from_projects) as built:
+                    generate_summary_report(self.manager, "state", "Victoria")
+                with open("ARENA_report_Victoria.txt") as file:
+                    content = file.read()
+            finally:
+                os.chdir(cwd)
+        self.assertIsInstance(built.call_args[0][0], AggregateCube)
+        self.assertIn("Total Projects Found: 2", content)
+        self.assertEqual(mock_savefig.call_count, 3)
+
+if __name__ == '__main__':
+    unittest.main()
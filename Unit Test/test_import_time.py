@@ -0,0 +1,33 @@
+import unittest
+import os
+import subprocess
+import sys
+import A3
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(A3.__file__))
+
+def loaded_modules(statement):
+    """Top-level modules loaded by a fresh interpreter after running ``statement``"""
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(PACKAGE_DIR))
+    code = f"{statement}\nimport sys\nprint(' '.join(sorted({{name.split('.')[0] for name in sys.modules}})))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+    return result.stdout.split()
+
+class TestLazyMatplotlib(unittest.TestCase):
+
+    def test_package_import_skips_matplotlib(self):
+        """Test importing the package and the legacy module does not load matplotlib"""
+        package = os.path.basename(PACKAGE_DIR)
+        modules = loaded_modules(f"import {package}, {package}.A3")
+        self.assertIn(package, modules)
+        self.assertNotIn("matplotlib", modules)
+
+    def test_cache_key_skips_matplotlib(self):
+        """Test a chart cache lookup reads the matplotlib version without importing it"""
+        package = os.path.basename(PACKAGE_DIR)
+        statement = (f"from {package}.visualization import ChartCache\n"
+                     f"ChartCache.key(None, ('bar', {{'Solar': 1}}, 'T', 'out'))")
+        self.assertNotIn("matplotlib", loaded_modules(statement))
+
+if __name__ == '__main__':
+    unittest.main()
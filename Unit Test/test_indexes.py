@@ -0,0 +1,107 @@
+import unittest
+import os
+import tempfile
+from unittest.mock import patch
+from A3 import Project, EnhancedProject, ProjectManager, Location, generate_summary_report
+
+class TestNameIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a fresh manager with a duplicate name"""
+        ProjectManager._instance = None
+        self.manager = ProjectManager()
+        self.sydney = EnhancedProject("Solar Farm", "Solar energy", "2020", Location("New South Wales", "Sydney"))
+        self.perth = EnhancedProject("Solar Farm", "Solar energy", "2021", Location("Western Australia", "Perth"))
+        self.wind = EnhancedProject("Wind Farm", "Wind energy", "2019", Location("Victoria", "Melbourne"))
+        self.manager.projects = [self.sydney, self.perth, self.wind]
+
+    def tearDown(self):
+        ProjectManager._instance = None
+        Project.projects = []
+
+    def test_search_returns_all_matches(self):
+        """Test duplicate names return every match in insertion order"""
+        self.assertEqual(self.manager.search_by_name("Solar Farm"), [self.sydney, self.perth])
+        self.assertEqual(self.manager.search_by_name("Wind Farm"), [self.wind])
+        self.assertEqual(self.manager.search_by_name("Missing"), [])
+
+    def test_add_project_is_indexed(self):
+        """Test projects appended through the manager are searchable"""
+        project = EnhancedProject("New Battery", "Battery storage", "2022", Location("Queensland", "Cairns"))
+        self.manager.add_project(project)
+        self.assertEqual(self.manager.search_by_name("New Battery"), [project])
+        self.assertIs(Project.projects, self.manager.projects)
+
+    def test_rename_moves_index_entry(self):
+        """Test renaming a project updates the index"""
+        self.manager.rename_project(self.perth, "Perth Solar")
+        self.assertEqual(self.perth.get_name(), "Perth Solar")
+        self.assertEqual(self.manager.search_by_name("Solar Farm"), [self.sydney])
+        self.assertEqual(self.manager.search_by_name("Perth Solar"), [self.perth])
+
+    def test_replacing_projects_rebuilds_index(self):
+        """Test assigning a new project list rebuilds the index"""
+        self.manager.projects = [self.wind]
+        self.assertEqual(self.manager.search_by_name("Solar Farm"), [])
+        self.assertEqual(self.manager.search_by_name("Wind Farm"), [self.wind])
+
+class TestInvertedIndexes(unittest.TestCase):
+
+    def setUp(self):
+        """Set up projects in states whose names overlap"""
+        ProjectManager._instance = None
+        self.manager = ProjectManager()
+        self.nsw = EnhancedProject("NSW Solar", "Solar energy", "2020", Location("New South Wales", "Sydney"))
+        self.sa = EnhancedProject("SA Wind", "Wind energy", "2021", Location("South Australia", "Adelaide"))
+        self.wa = EnhancedProject("WA Solar", "Solar energy", "2022", Location("Western Australia", "Perth"))
+        self.manager.projects = [self.nsw, self.sa, self.wa]
+
+    def tearDown(self):
+        ProjectManager._instance = None
+        Project.projects = []
+
+    def test_category_lookup(self):
+        """Test category filtering is an index lookup in project order"""
+        self.assertEqual(self.manager.ids_for_category("Solar energy"), [0, 2])
+        self.assertEqual(self.manager.filter_projects("category", "Solar energy"), [self.nsw, self.wa])
+
+    def test_state_lookup_is_exact(self):
+        """Test state filtering does not match substrings"""
+        self.assertEqual(self.manager.filter_projects("state", "South Australia"), [self.sa])
+        self.assertEqual(self.manager.filter_projects("state", "Australia"), [])
+        self.assertEqual(self.manager.filter_projects("state", "Sydney, New South Wales"), [])
+
+    def test_set_category_updates_index(self):
+        """Test category edits through the manager move the project id"""
+        self.manager.set_category(self.sa, "Solar energy")
+        self.assertEqual(self.sa.get_category(), "Solar energy")
+        self.assertEqual(self.manager.ids_for_category("Solar energy"), [0, 1, 2])
+        self.assertEqual(self.manager.ids_for_category("Wind energy"), [])
+
+    def test_set_location_and_add_update_index(self):
+        """Test location edits and new projects are reflected in the state index"""
+        self.manager.set_location(self.wa, Location("Tasmania", "Hobart"))
+        self.assertEqual(self.manager.filter_projects("state", "Tasmania"), [self.wa])
+        self.assertEqual(self.manager.filter_projects("state", "Western Australia"), [])
+
+        project = EnhancedProject("Hobart Wind", "Wind energy", "2023", Location("Tasmania", "Hobart"))
+        self.manager.add_project(project)
+        self.assertEqual(self.manager.ids_for_state("Tasmania"), [2, 3])
+
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_summary_report_from_manager(self, mock_savefig):
+        """Test generate_summary_report filters through the manager indexes"""
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                generate_summary_report(self.manager, "state", "South Australia")
+                with open("ARENA_report_South_Australia.txt") as file:
+                    content = file.read()
+            finally:
+                os.chdir(cwd)
+        self.assertIn("Total Projects Found: 1", content)
+        self.assertIn("SA Wind", content)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import os
+import random
+import tempfile
+from datetime import date
+from unittest.mock import patch
+from A3 import Project, EnhancedProject, ProjectManager, Location, generate_summary_report
+from A3.intervals import IntervalIndex
+
+def day(text):
+    """Ordinal of a DD/MM/YYYY date"""
+    d, m, y = map(int, text.split('/'))
+    return date(y, m, d).toordinal()
+
+class TestIntervalIndex(unittest.TestCase):
+
+    def test_matches_brute_force_with_updates(self):
+        """Test point and range queries agree with a linear scan while intervals change"""
+        rng = random.Random(7)
+        intervals = {}
+        for key in range(500):
+            start = rng.randint(0, 1000)
+            intervals[key] = (start, start + rng.randint(0, 200))
+        index = IntervalIndex((key, start, end) for key, (start, end) in intervals.items())
+
+        for step in range(300):
+            key = rng.randint(0, 599)
+            if step % 5 == 0:
+                intervals.pop(key, None)
+                index.remove(key)
+            else:
+                start = rng.randint(0, 1000)
+                intervals[key] = (start, start + rng.randint(0, 200))
+                index.add(key, *intervals[key])
+            low = rng.randint(-10, 1210)
+            high = low + rng.choice([0, 0, 5, 50])
+            expected = sorted(k for k, (start, end) in intervals.items() if start <= high and end >= low)
+            self.assertEqual(index.overlapping(low, high), expected)
+        self.assertEqual(len(index), len(intervals))
+
+    def test_point_query_includes_endpoints(self):
+        """Test intervals are closed at both ends"""
+        index = IntervalIndex([(1, 10, 20), (2, 20, 30), (3, 31, 40)])
+        self.assertEqual(index.overlapping(20), [1, 2])
+        self.assertEqual(index.overlapping(30, 31), [2, 3])
+        self.assertEqual(index.overlapping(41), [])
+
+class TestManagerActiveQueries(unittest.TestCase):
+
+    def setUp(self):
+        """Set up projects with overlapping periods"""
+        ProjectManager._instance = None
+        self.manager = ProjectManager()
+        location = Location("Victoria", "Melbourne")
+        self.early = EnhancedProject("Early", "Solar energy", "2015", location, "$1.00m", "01/01/2015 – 31/12/2017")
+        self.middle = EnhancedProject("Middle", "Wind energy", "2017", location, "$1.00m", "01/06/2017 - 30/06/2019")
+        self.late = EnhancedProject("Late", "Bioenergy", "2020", location, "$1.00m", "01/01/2020 – 31/12/2022")
+        self.undated = EnhancedProject("Undated", "Bioenergy", "2020", location)
+        self.manager.projects = [self.early, self.middle, self.late, self.undated]
+
+    def tearDown(self):
+        ProjectManager._instance = None
+        Project.projects = []
+
+    def test_point_and_window_queries(self):
+        """Test active-on-date and overlap queries return projects in order"""
+        self.assertEqual(self.manager.projects_active_between(day("01/07/2017")), [self.early, self.middle])
+        self.assertEqual(self.manager.projects_active_between(day("01/01/2019"), day("01/01/2020")),
+                         [self.middle, self.late])
+        self.assertEqual(self.manager.filter_projects("active", "15/03/2021"), [self.late])
+        with self.assertRaises(ValueError):
+            self.manager.filter_projects("active", "sometime")
+
+    def test_index_follows_edits_and_additions(self):
+        """Test set_project_period and add_project update the built index"""
+        self.assertEqual(self.manager.ids_active_between(day("01/01/2024")), [])
+        self.manager.set_project_period(self.early, "01/01/2023 – 31/12/2024")
+        self.manager.add_project(EnhancedProject("New", "Hydrogen", "2024", Location("Tasmania", "Hobart"),
+                                                 "", "01/02/2024 – 01/03/2025"))
+        self.assertEqual(self.manager.ids_active_between(day("01/03/2024")), [0, 4])
+        self.assertEqual(self.manager.ids_active_between(day("01/07/2016")), [])
+
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_active_report(self, mock_savefig):
+        """Test generate_summary_report supports the active search type"""
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                generate_summary_report(self.manager, "active", "01/01/2018 – 31/12/2020")
+                with open("ARENA_report_active_01-01-2018_–_31-12-2020.txt") as file:
+                    content = file.read()
+                generate_summary_report(self.manager.projects, "active", "01/07/2017")
+                with open("ARENA_report_active_01-07-2017.txt") as file:
+                    list_content = file.read()
+            finally:
+                os.chdir(cwd)
+        self.assertIn("Total Projects Found: 2", content)
+        self.assertIn("Middle", content)
+        self.assertIn("Late", content)
+        self.assertIn("Early", list_content)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+import unittest
+import os
+import tempfile
+from unittest.mock import patch
+from A3 import Project, EnhancedProject, EnhancedCurrentProject, ProjectManager, Location
+from A3.fileio import atomic_write
+from A3.journal import ChangeJournal
+
+class TestAtomicWrite(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, "data.txt")
+        with open(self.filename, 'w') as file:
+            file.write("old")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_replaces_file(self):
+        """Test the new contents appear only after a successful write"""
+        with atomic_write(self.filename) as file:
+            file.write("new")
+            with open(self.filename) as current:
+                self.assertEqual(current.read(), "old")
+        with open(self.filename) as file:
+            self.assertEqual(file.read(), "new")
+
+    def test_error_keeps_old_file(self):
+        """Test a failure mid-write leaves the original and no temp files"""
+        with self.assertRaises(RuntimeError):
+            with atomic_write(self.filename) as file:
+                file.write("partial")
+                raise RuntimeError("crash")
+        with open(self.filename) as file:
+            self.assertEqual(file.read(), "old")
+        self.assertEqual(os.listdir(self.temp_dir.name), ["data.txt"])
+
+class TestChangeJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, "changes.journal")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_append_and_entries(self):
+        """Test entries are read back in order with the snapshot stamp"""
+        journal = ChangeJournal(self.filename)
+        journal.start([10, 20])
+        journal.append({'op': 'edit', 'id': 0})
+        journal.append({'op': 'edit', 'id': 1})
+
+        reopened = ChangeJournal(self.filename)
+        self.assertEqual(len(reopened), 2)
+        self.assertEqual(reopened.snapshot_stamp, [10, 20])
+        self.assertEqual([e['id'] for e in reopened.entries()], [0, 1])
+
+    def test_torn_last_line_is_dropped(self):
+        """Test a partially written entry is discarded and later appends stay readable"""
+        journal = ChangeJournal(self.filename)
+        journal.start(None)
+        journal.append({'op': 'edit', 'id': 0})
+        with open(self.filename, 'a') as file:
+            file.write('{"op": "ed')
+
+        reopened = ChangeJournal(self.filename)
+        reopened.append({'op': 'edit', 'id': 2})
+        self.assertEqual([e['id'] for e in reopened.entries()], [0, 2])
+
+class TestManagerJournal(unittest.TestCase):
+
+    def setUp(self):
+        ProjectManager._instance = None
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.json_file = os.path.join(self.temp_dir.name, "projects.json")
+        self.journal_file = os.path.join(self.temp_dir.name, "projects.journal")
+
+        manager = ProjectManager()
+        manager.projects = [EnhancedProject("Base", "Solar energy", "2020", Location("Victoria", "Melbourne"))]
+        manager.save_to_json(self.json_file)
+        ProjectManager._instance = None
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        ProjectManager._instance = None
+        Project.projects = []
+
+    def start_session(self, compact_every=1000):
+        """Simulate a CLI start: load the snapshot, then replay the journal"""
+        ProjectManager._instance = None
+        manager = ProjectManager()
+        manager.load_from_json(self.json_file)
+        replayed = manager.open_journal(self.journal_file, self.json_file, compact_every)
+        return manager, replayed
+
+    def test_changes_survive_a_crash(self):
+        """Test creates and edits are recovered without a snapshot save"""
+        manager, replayed = self.start_session()
+        self.assertEqual(replayed, 0)
+        manager.add_project(EnhancedCurrentProject("New", "Wind energy", "2022", Location("Tasmania", "Hobart")))
+        manager.set_category(manager.projects[0], "Bioenergy")
+        manager.set_budget(manager.projects[0], "$1.50m")
+        manager.set_location(manager.projects[1], Location("Queensland", "Cairns"))
+        manager.rename_project(manager.projects[1], "Renamed")
+
+        # No checkpoint: the process "crashes" here
+        manager, replayed = self.start_session()
+        self.assertEqual(replayed, 5)
+        base, new = manager.projects
+        self.assertEqual(base.get_category(), "Bioenergy")
+        self.assertEqual(base.get_budget(), "$1.50m")
+        self.assertIsInstance(new, EnhancedCurrentProject)
+        self.assertEqual(new.get_name(), "Renamed")
+        self.assertEqual(manager.filter_projects("state", "Queensland"), [new])
+        self.assertTrue(manager.dirty)
+
+    def test_checkpoint_compacts_journal(self):
+        """Test a checkpoint folds the journal into the snapshot exactly once"""
+        manager, _ = self.start_session()
+        manager.set_year_started(manager.projects[0], "2021")
+        self.assertTrue(manager.checkpoint())
+        self.assertEqual(len(manager.journal), 0)
+        self.assertFalse(manager.dirty)
+
+        manager, replayed = self.start_session()
+        self.assertEqual(replayed, 0)
+        self.assertEqual(manager.projects[0]._get_year_started_value(), "2021")
+
+    def test_periodic_compaction(self):
+        """Test the journal is compacted after compact_every entries"""
+        manager, _ = self.start_session(compact_every=2)
+        manager.set_year_started(manager.projects[0], "2021")
+        self.assertEqual(len(manager.journal), 1)
+        manager.set_year_started(manager.projects[0], "2022")
+        self.assertEqual(len(manager.journal), 0)
+
+    def test_stale_journal_is_not_replayed(self):
+        """Test a crash after the snapshot rename but before the journal reset"""
+        manager, _ = self.start_session()
+        manager.add_project(EnhancedProject("Once", "Wind energy", "2022", Location("Tasmania", "Hobart")))
+        with patch.object(ChangeJournal, 'start'):
+            manager.checkpoint()
+
+        manager, replayed = self.start_session()
+        self.assertEqual(replayed, 0)
+        self.assertEqual([p.get_name() for p in manager.projects], ["Base", "Once"])
+
+    def test_replacing_the_list_checkpoints(self):
+        """Test edits after importing a new list are replayed against that list"""
+        text_file = os.path.join(self.temp_dir.name, "other.txt")
+        Project.projects = [EnhancedProject("Imported", "Wind energy", "2019", Location("Tasmania", "Hobart"))]
+        Project.write_project_to_file(text_file)
+
+        manager, _ = self.start_session()
+        manager.import_from_text(text_file)
+        manager.set_category(manager.projects[0], "Bioenergy")
+
+        manager, replayed = self.start_session()
+        self.assertEqual(replayed, 1)
+        self.assertEqual([(p.get_name(), p.get_category()) for p in manager.projects], [("Imported", "Bioenergy")])
+
+    def test_imported_files_are_checkpointed(self):
+        """Test edits of projects imported from files survive a crash"""
+        source = os.path.join(self.temp_dir.name, "in")
+        os.mkdir(source)
+        Project.projects = [EnhancedProject("Imported", "Wind energy", "2019", Location("Tasmania", "Hobart"))]
+        Project.write_project_to_file(os.path.join(source, "a.txt"))
+
+        manager, _ = self.start_session()
+        manager.import_from_files(source)
+        manager.set_category(manager.projects[-1], "Bioenergy")
+
+        manager, replayed = self.start_session()
+        self.assertEqual(replayed, 1)
+        self.assertEqual([p.get_name() for p in manager.projects], ["Base", "Imported"])
+        self.assertEqual(manager.projects[-1].get_category(), "Bioenergy")
+
+    def test_unknown_id_is_skipped(self):
+        """Test a journal entry for a project the snapshot lacks does not stop startup"""
+        manager, _ = self.start_session()
+        manager.journal.append({'op': 'edit', 'id': 5, 'attribute': 'category', 'value': "Bioenergy"})
+        manager.set_category(manager.projects[0], "Hydrogen")
+
+        manager, replayed = self.start_session()
+        self.assertEqual(replayed, 1)
+        self.assertEqual(manager.projects[0].get_category(), "Hydrogen")
+
+if __name__ == '__main__':
+    unittest.main()
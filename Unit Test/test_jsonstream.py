@@ -0,0 +1,114 @@
+import unittest
+import io
+import json
+import os
+import tempfile
+from A3 import Project, EnhancedProject, EnhancedPastProject, ProjectManager, Location
+from A3.jsonstream import iter_json_array, write_json_array
+
+class TestIterJsonArray(unittest.TestCase):
+
+    def test_matches_json_load_for_any_chunk_size(self):
+        """Test streamed elements equal json.load regardless of chunk boundaries"""
+        data = [{"name": "A", "total_cost": 12345.5, "nested": [1, 2, {"x": "]"}]},
+                1234567, "text, with comma", None, True, [], {}]
+        document = json.dumps(data, indent=2)
+        for chunk_size in (1, 2, 3, 7, 64, 1 << 16):
+            with self.subTest(chunk_size=chunk_size):
+                streamed = list(iter_json_array(io.StringIO(document), chunk_size))
+                self.assertEqual(streamed, data)
+
+    def test_numbers_split_at_any_chunk_edge(self):
+        """Test numbers cut after '.', 'e' or a sign decode whole"""
+        document = "[1.25, 2, -3e-2, 4E+10, 0.5]"
+        for chunk_size in range(1, len(document) + 1):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(list(iter_json_array(io.StringIO(document), chunk_size)), json.loads(document))
+
+    def test_empty_array(self):
+        """Test an empty array yields nothing"""
+        self.assertEqual(list(iter_json_array(io.StringIO("  [ ]  "), 1)), [])
+
+    def test_malformed_documents_raise(self):
+        """Test malformed input raises JSONDecodeError"""
+        for document in ['{"a": 1}', '[{"a": 1} {"b": 2}]', '[{"a": 1}, {"b": ', '']:
+            with self.subTest(document=document):
+                with self.assertRaises(json.JSONDecodeError):
+                    list(iter_json_array(io.StringIO(document), 4))
+
+class TestWriteJsonArray(unittest.TestCase):
+
+    def setUp(self):
+        self.data = [{"name": "A\nB", "values": [1, 2.5, {"k": None}], "empty": {}},
+                     {"name": "Café", "values": []}, 7]
+
+    def test_indented_output_matches_json_dump(self):
+        """Test indented output is byte-identical to json.dump(indent=2)"""
+        for chunk_size in (1, 2, 1000):
+            with self.subTest(chunk_size=chunk_size):
+                out = io.StringIO()
+                write_json_array(out, iter(self.data), indent=2, chunk_size=chunk_size)
+                self.assertEqual(out.getvalue(), json.dumps(self.data, indent=2))
+
+    def test_compact_output(self):
+        """Test compact output has no whitespace and round-trips"""
+        out = io.StringIO()
+        write_json_array(out, self.data, chunk_size=2)
+        self.assertEqual(out.getvalue(), json.dumps(self.data, separators=(',', ':')))
+
+    def test_empty(self):
+        """Test empty input writes an empty array in both modes"""
+        for indent in (None, 2):
+            out = io.StringIO()
+            write_json_array(out, [], indent=indent)
+            self.assertEqual(out.getvalue(), "[]")
+
+class TestStreamingLoad(unittest.TestCase):
+
+    def setUp(self):
+        ProjectManager._instance = None
+        self.manager = ProjectManager()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.json_file = os.path.join(self.temp_dir.name, "projects.json")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        ProjectManager._instance = None
+        Project.projects = []
+
+    def test_iter_from_json_dispatches_types(self):
+        """Test streamed records go through EnhancedProject.from_dict"""
+        past = EnhancedPastProject("Past", "Bioenergy", "2015", Location("Tasmania", "Hobart"))
+        current = EnhancedProject("Now", "Solar energy", "2024", Location("Victoria", "Melbourne"))
+        self.manager.projects = [past, current]
+        self.manager.save_to_json(self.json_file)
+
+        projects = list(self.manager.iter_from_json(self.json_file))
+        self.assertIsInstance(projects[0], EnhancedPastProject)
+        self.assertEqual([p.get_name() for p in projects], ["Past", "Now"])
+
+    def test_compact_save_round_trips(self):
+        """Test save_to_json(compact=True) writes a smaller file that loads back"""
+        projects = [EnhancedProject(f"P{i}", "Solar energy", "2020", Location("Victoria", "Melbourne"))
+                    for i in range(5)]
+        self.manager.projects = projects
+        self.manager.save_to_json(self.json_file)
+        indented_size = os.path.getsize(self.json_file)
+        self.manager.save_to_json(self.json_file, compact=True)
+        self.assertLess(os.path.getsize(self.json_file), indented_size)
+
+        self.assertTrue(self.manager.load_from_json(self.json_file))
+        self.assertEqual([p.get_name() for p in self.manager.projects], [f"P{i}" for i in range(5)])
+
+    def test_malformed_file_keeps_existing_projects(self):
+        """Test a malformed file returns False and leaves the projects untouched"""
+        existing = EnhancedProject("Keep", "Solar energy", "2020", Location("Victoria", "Melbourne"))
+        self.manager.projects = [existing]
+        with open(self.json_file, 'w') as file:
+            file.write('[{"name": "Broken", ')
+
+        self.assertFalse(self.manager.load_from_json(self.json_file))
+        self.assertEqual(self.manager.projects, [existing])
+
+if __name__ == '__main__':
+    unittest.main()
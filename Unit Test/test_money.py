@@ -0,0 +1,94 @@
+import unittest
+import os
+import sqlite3
+import tempfile
+from unittest.mock import patch
+from A3 import Project, EnhancedProject, ProjectManager, ProjectTable, Location, generate_summary_report
+from A3.money import parse_budget_cents, to_cents, format_cents
+from A3.sqlite_store import SQLiteProjectStore
+
+class TestCents(unittest.TestCase):
+
+    def test_parse_budget_cents(self):
+        """Test budget strings become exact integer cents"""
+        self.assertEqual(parse_budget_cents("$4.81m"), 481_000_000)
+        self.assertEqual(parse_budget_cents("$500k"), 50_000_000)
+        self.assertEqual(parse_budget_cents("$0.10K"), 10_000)
+        self.assertIsNone(parse_budget_cents(""))
+        self.assertIsNone(parse_budget_cents("4.81m"))
+        self.assertIsNone(parse_budget_cents(None))
+
+    def test_project_cents_accessors(self):
+        """Test projects expose budget, funding and cost as integer cents"""
+        project = EnhancedProject("P", "Bioenergy", "2020", Location("Tasmania", "Hobart"), "$1.25m")
+        project.set_funding(0.1 + 0.2)
+        project.set_total_cost(None)
+        self.assertEqual(project.get_budget_cents(), 125_000_000)
+        self.assertEqual(project.get_funding_cents(), 30)
+        self.assertEqual(project.get_total_cost_cents(), 0)
+        self.assertEqual(to_cents(19.99), 1999)
+        self.assertEqual(format_cents(-123456789), "-$1,234,567.89")
+
+class TestCentsAggregation(unittest.TestCase):
+
+    def setUp(self):
+        """Set up projects whose float sums would drift"""
+        self.projects = []
+        for i in range(10):
+            project = EnhancedProject(f"P{i}", "Solar energy" if i % 2 else "Wind energy", "2020",
+                                      Location("Victoria", "Geelong"), "$0.10k" if i % 2 else "")
+            project.set_funding(0.1)
+            self.projects.append(project)
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        ProjectManager._instance = None
+        Project.projects = []
+
+    def test_table_cents_columns(self):
+        """Test the table sums cents exactly"""
+        table = ProjectTable.from_projects(self.projects)
+        self.assertEqual(table.budget_cents.tolist()[:2], [0, 10_000])
+        self.assertEqual(table.total_budget_cents(), 50_000)
+        self.assertEqual(table.budget_cents_by_category(), {"Solar energy": 50_000})
+        self.assertEqual(table.total_funding_cents(), 100)
+        self.assertNotEqual(sum(p._get_funding_value() for p in self.projects), 1.0)
+
+    def test_store_cents_and_migration(self):
+        """Test the store keeps budget cents and adds the column to older databases"""
+        db_file = os.path.join(self.temp_dir.name, "projects.db")
+        store = SQLiteProjectStore(db_file)
+        store.insert_many(self.projects)
+        self.assertEqual(store.select().total_budget_cents(), 50_000)
+        self.assertEqual(store.select().total_funding_cents(), 100)
+        store.close()
+
+        # Simulate a database written before the column existed
+        connection = sqlite3.connect(db_file)
+        connection.execute("ALTER TABLE projects DROP COLUMN budget_cents")
+        connection.commit()
+        connection.close()
+        store = SQLiteProjectStore(db_file)
+        selection = store.select("category = ?", ("Solar energy",))
+        self.assertEqual(selection.budget_cents_by_category(), {"Solar energy": 50_000})
+        project = selection.get_projects()[0]
+        store.update(project, 'budget', "$1.00m")
+        self.assertEqual(selection.total_budget_cents(), 40_000 + 100_000_000)
+        store.close()
+
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_report_total_budget(self, mock_savefig):
+        """Test the summary report states the exact total budget"""
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        try:
+            generate_summary_report(self.projects, "state", "Victoria")
+            with open("ARENA_report_Victoria.txt") as file:
+                content = file.read()
+        finally:
+            os.chdir(cwd)
+        self.assertIn("Total Budget: $500.00", content)
+
+if __name__ == '__main__':
+    unittest.main()
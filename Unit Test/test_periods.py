@@ -0,0 +1,60 @@
+import unittest
+from datetime import date, datetime
+from A3 import EnhancedProject, EnhancedPastProject, Location, InvalidDateException
+from A3.periods import parse_period, split_period
+
+class TestPeriodParser(unittest.TestCase):
+
+    def test_both_dashes(self):
+        """Test en dash and hyphen periods parse to the same ordinals"""
+        expected = (date(2020, 1, 1).toordinal(), date(2025, 12, 31).toordinal())
+        self.assertEqual(parse_period("01/01/2020 – 31/12/2025"), expected)
+        self.assertEqual(parse_period("01/01/2020 - 31/12/2025"), expected)
+        self.assertEqual(parse_period("01/01/2020   –  31/12/2025"), expected)
+
+    def test_rejects_bad_layout_and_dates(self):
+        """Test malformed strings and impossible dates give None"""
+        for text in ["01/01/2020–31/12/2025", "1/01/2020 – 31/12/2025", "01-01-2020 – 31-12-2025",
+                     "01/01/2020 — 31/12/2025", "01/01/2020 – 31/12/2025 extra", "", None]:
+            with self.subTest(text=text):
+                self.assertIsNone(split_period(text))
+        self.assertIsNotNone(split_period("31/02/2020 – 01/01/2021"))
+        self.assertIsNone(parse_period("31/02/2020 – 01/01/2021"))
+
+    def test_matches_strptime(self):
+        """Test the hand-rolled parser agrees with datetime.strptime"""
+        for text in ["29/02/2024 – 01/03/2024", "29/02/2023 – 01/03/2024", "15/06/2020 - 30/11/2025",
+                     "00/01/2020 – 01/02/2020", "01/13/2020 – 01/02/2021"]:
+            start, end = (part.strip() for part in text.replace('–', '-').split('-'))
+            try:
+                expected = (datetime.strptime(start, '%d/%m/%Y').toordinal(),
+                            datetime.strptime(end, '%d/%m/%Y').toordinal())
+            except ValueError:
+                expected = None
+            with self.subTest(text=text):
+                self.assertEqual(parse_period(text), expected)
+
+    def test_validator_messages(self):
+        """Test the validator still distinguishes format, value and order errors"""
+        for text, message in [("2020 – 2025", "Invalid date format"),
+                              ("31/02/2020 – 01/01/2021", "Invalid date values"),
+                              ("01/01/2025 – 01/01/2020", "Start date must be before end date")]:
+            with self.subTest(text=text):
+                with self.assertRaises(InvalidDateException) as context:
+                    InvalidDateException.validate_date_range(text)
+                self.assertIn(message, str(context.exception))
+
+class TestStoredOrdinals(unittest.TestCase):
+
+    def test_project_keeps_ordinals(self):
+        """Test projects store the parsed period and update it on edit"""
+        project = EnhancedPastProject("P", "Bioenergy", "2015", Location("Tasmania", "Hobart"),
+                                      "$1.00m", "01/01/2015 – 31/12/2018")
+        self.assertEqual(project.get_period_ordinals(),
+                         (date(2015, 1, 1).toordinal(), date(2018, 12, 31).toordinal()))
+        project.set_project_period("01/07/2016 - 30/06/2017")
+        self.assertEqual(project.get_period_ordinals()[0], date(2016, 7, 1).toordinal())
+        self.assertIsNone(EnhancedProject("Q", "Bioenergy", "2015", Location("Tasmania", "Hobart")).get_period_ordinals())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+import gc
+import os
+import tempfile
+import weakref
+from unittest.mock import patch
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from A3 import EnhancedProject, Location, generate_summary_report, generate_summary_reports
+from A3.visualization import render_bar_chart, render_charts
+
+class TestObjectOrientedRendering(unittest.TestCase):
+
+    def setUp(self):
+        """Set up projects and a scratch directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.projects = [
+            EnhancedProject(f"P{i}", "Solar energy" if i % 2 else "Wind energy", str(2015 + i),
+                            Location("Victoria", "Melbourne"))
+            for i in range(4)
+        ]
+        plt.close('all')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_reports_leave_no_pyplot_figures(self):
+        """Test repeated reports write real PNGs without using pyplot or show"""
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        try:
+            with patch('matplotlib.pyplot.show') as mock_show:
+                for _ in range(3):
+                    generate_summary_report(self.projects, "state", "Victoria")
+        finally:
+            os.chdir(cwd)
+        for kind in ("bar", "pie", "line"):
+            path = os.path.join(self.temp_dir.name, f"ARENA_report_Victoria_{kind}_chart.png")
+            with open(path, 'rb') as file:
+                self.assertEqual(file.read(8), b"\x89PNG\r\n\x1a\n")
+        self.assertEqual(plt.get_fignums(), [])
+        mock_show.assert_not_called()
+
+    def test_figure_is_released_after_saving(self):
+        """Test the renderer keeps no reference to its figure"""
+        figures = []
+        original_savefig = Figure.savefig
+
+        def savefig(figure, *args, **kwargs):
+            figures.append(weakref.ref(figure))
+            return original_savefig(figure, *args, **kwargs)
+
+        with patch.object(Figure, 'savefig', savefig):
+            render_bar_chart({"Solar energy": 2}, "Test", os.path.join(self.temp_dir.name, "test"))
+        gc.collect()
+        self.assertEqual(len(figures), 1)
+        self.assertIsNone(figures[0]())
+
+class TestParallelRendering(unittest.TestCase):
+
+    def setUp(self):
+        """Set up projects in two states"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.projects = [
+            EnhancedProject(f"P{i}", "Solar energy" if i % 2 else "Wind energy", str(2015 + i),
+                            Location("Victoria" if i < 3 else "Tasmania", "Hobart"))
+            for i in range(6)
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def run_reports(self, directory, workers):
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            generate_summary_reports(self.projects, [("state", "Victoria"), ("state", "Tasmania")], workers)
+        finally:
+            os.chdir(cwd)
+        return sorted(os.listdir(directory))
+
+    def test_pool_output_matches_serial(self):
+        """Test pooled rendering writes the same files, byte for byte, as the serial path"""
+        serial_dir = os.path.join(self.temp_dir.name, "serial")
+        pool_dir = os.path.join(self.temp_dir.name, "pool")
+        os.mkdir(serial_dir)
+        os.mkdir(pool_dir)
+        serial = self.run_reports(serial_dir, None)
+        pooled = self.run_reports(pool_dir, 2)
+
+        self.assertEqual(serial, pooled)
+        self.assertIn("ARENA_report_Tasmania_line_chart.png", pooled)
+        self.assertEqual(len(pooled), 8)
+        for name in pooled:
+            with open(os.path.join(serial_dir, name), 'rb') as a, open(os.path.join(pool_dir, name), 'rb') as b:
+                self.assertEqual(a.read(), b.read(), name)
+
+    def test_render_charts_returns_paths_in_job_order(self):
+        """Test render_charts reports the file written for each job"""
+        base = os.path.join(self.temp_dir.name, "jobs")
+        jobs = [("line", {"2020": 1}, "T", base), ("bar", {"Bioenergy": 2}, "T", base)]
+        self.assertEqual(render_charts(jobs, workers=2), [base + "_line_chart.png", base + "_bar_chart.png"])
+
+if __name__ == '__main__':
+    unittest.main()
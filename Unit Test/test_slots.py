@@ -0,0 +1,50 @@
+import unittest
+import json
+from A3 import (
+    Project, CurrentProject, EnhancedProject, EnhancedCurrentProject, EnhancedPastProject,
+    Location, Organization
+)
+
+class TestSlots(unittest.TestCase):
+
+    def test_no_instance_dict(self):
+        """Test model instances do not carry a per-instance __dict__"""
+        location = Location("Victoria", "Melbourne")
+        instances = [
+            location,
+            Organization("ARENA"),
+            Project("P", "Solar energy", "2020", location),
+            CurrentProject("C", "Solar energy", "2020", location),
+            EnhancedProject("E", "Solar energy", "2020", location),
+            EnhancedCurrentProject("EC", "Solar energy", "2020", location, "$1.00m"),
+            EnhancedPastProject("EP", "Solar energy", "2020", location, "$1.00m"),
+        ]
+        for instance in instances:
+            self.assertFalse(hasattr(instance, '__dict__'), type(instance).__name__)
+
+    def test_multiple_inheritance_initialises_all_slots(self):
+        """Test Enhanced current/past projects keep both base behaviours"""
+        project = EnhancedPastProject("Past", "Bioenergy", "2015", Location("Tasmania", "Hobart"),
+                                      "$2.00m", "01/01/2015 – 31/12/2018")
+        project.set_funding(1000)
+        project.add_organization(Organization("ARENA"))
+        self.assertEqual(project.get_budget(), "$2.00m")
+        self.assertEqual(project.get_funding(), "Funding: 1000")
+        self.assertEqual(project._PastProject__status, "Past")
+        self.assertIsInstance(project, EnhancedProject)
+
+    def test_from_dict_interns_repeated_strings(self):
+        """Test category, year, state and city are shared between loaded projects"""
+        record = {'name': 'A', 'category': 'Wind energy', 'year_started': '2021',
+                  'location': 'Geelong, Victoria', 'type': 'EnhancedProject'}
+        first, second = json.loads(json.dumps([record, dict(record, name='B')]))
+        self.assertIsNot(first['category'], second['category'])
+
+        a = EnhancedProject.from_dict(first)
+        b = EnhancedProject.from_dict(second)
+        self.assertIs(a.get_category(), b.get_category())
+        self.assertIs(a._get_year_started_value(), b._get_year_started_value())
+        self.assertIs(a._get_state_value(), b._get_state_value())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+import io
+import os
+import tempfile
+import time
+from A3 import (
+    Project, Location, ProjectManager, EnhancedProject, EnhancedCurrentProject, EnhancedPastProject
+)
+from A3.snapshot import read_snapshot, write_snapshot, SnapshotError
+
+class TestSnapshotFormat(unittest.TestCase):
+
+    def setUp(self):
+        self.projects = [
+            EnhancedCurrentProject("Café Solar", "Solar energy", "2020", Location("New South Wales", "Sydney"),
+                                   "$1.50m", "01/01/2020 – 31/12/2025"),
+            EnhancedPastProject("Wind", "Wind energy", None, Location("Victoria", "Melbourne")),
+            EnhancedProject("Plain", "Solar energy", "2020", Location("New South Wales", "Sydney")),
+        ]
+        self.projects[0].set_total_cost(1234.5)
+        self.projects[0].set_funding(1000.25)
+
+    def round_trip(self, projects):
+        buffer = io.BytesIO()
+        write_snapshot(buffer, projects)
+        return read_snapshot(io.BytesIO(buffer.getvalue()))
+
+    def test_round_trip(self):
+        """Test every field and the project type survive a round trip"""
+        restored = self.round_trip(self.projects)
+        self.assertEqual([p.to_dict() for p in restored], [p.to_dict() for p in self.projects])
+        self.assertEqual([type(p) for p in restored], [type(p) for p in self.projects])
+        self.assertIsNone(restored[1]._get_year_started_value())
+
+    def test_int_and_float_amounts_are_kept(self):
+        """Test unset (int 0) and float amounts print the same after a round trip"""
+        self.projects[2].set_funding(500)
+        restored = self.round_trip(self.projects)
+        self.assertEqual([str(p) for p in restored], [str(p) for p in self.projects])
+        self.assertIs(type(restored[1]._get_total_cost_value()), int)
+        self.assertIs(type(restored[0]._get_funding_value()), float)
+
+    def test_reads_version_1(self):
+        """Test files written before the money flags column still load, with float amounts"""
+        buffer = io.BytesIO()
+        write_snapshot(buffer, self.projects)
+        data = buffer.getvalue()
+        # Version 1 had the same layout without the trailing one-byte-per-row flags
+        old = data[:8] + b"\x01\x00" + data[10:-len(self.projects)]
+        restored = read_snapshot(io.BytesIO(old))
+        self.assertEqual([p.to_dict() for p in restored], [p.to_dict() for p in self.projects])
+        self.assertIs(type(restored[1]._get_total_cost_value()), float)
+
+    def test_shares_strings_and_locations(self):
+        """Test repeated values are stored once and shared after loading"""
+        restored = self.round_trip(self.projects)
+        self.assertIs(restored[0]._get_location_obj(), restored[2]._get_location_obj())
+        self.assertIs(restored[0].get_category(), restored[2].get_category())
+
+    def test_empty(self):
+        """Test an empty dataset round-trips"""
+        self.assertEqual(self.round_trip([]), [])
+
+    def test_rejects_bad_input(self):
+        """Test foreign, newer-version and truncated files are rejected"""
+        buffer = io.BytesIO()
+        write_snapshot(buffer, self.projects)
+        data = buffer.getvalue()
+        for bad in (b"not a snapshot at all....", data[:8] + b"\x63\x00" + data[10:], data[:-4]):
+            with self.assertRaises(SnapshotError):
+                read_snapshot(io.BytesIO(bad))
+
+class TestManagerSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        ProjectManager._instance = None
+        self.manager = ProjectManager()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.json_file = os.path.join(self.temp_dir.name, "projects.JSON")
+        self.snapshot_file = os.path.join(self.temp_dir.name, "projects.snapshot")
+        self.manager.projects = [EnhancedProject("One", "Bioenergy", "2019", Location("Tasmania", "Hobart"))]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        ProjectManager._instance = None
+        Project.projects = []
+
+    def test_snapshot_written_alongside_json(self):
+        """Test save_to_json(write_snapshot=True) writes both files"""
+        self.assertTrue(self.manager.save_to_json(self.json_file, write_snapshot=True))
+        self.assertTrue(os.path.exists(self.snapshot_file))
+
+    def test_newer_snapshot_is_preferred(self):
+        """Test the snapshot is loaded when it is newer and ignored when stale"""
+        self.manager.save_to_json(self.json_file, write_snapshot=True)
+        self.manager.rename_project(self.manager.projects[0], "From JSON")
+        self.manager.save_to_json(self.json_file)
+        old = time.time() - 60
+        os.utime(self.snapshot_file, (old, old))
+
+        self.assertTrue(self.manager.load_from_json(self.json_file, prefer_snapshot=True))
+        self.assertEqual(self.manager.projects[0].get_name(), "From JSON")
+
+        self.manager.rename_project(self.manager.projects[0], "From snapshot")
+        self.manager.save_snapshot(self.snapshot_file)
+        self.assertTrue(self.manager.load_from_json(self.json_file, prefer_snapshot=True))
+        self.assertEqual(self.manager.projects[0].get_name(), "From snapshot")
+        self.assertEqual(self.manager.search_by_name("From snapshot"), self.manager.projects)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import unittest
+import os
+import tempfile
+from unittest.mock import patch
+from A3 import (
+    Project, EnhancedProject, EnhancedPastProject, ProjectManager, Location,
+    VisualizationDecorator, InvalidBudgetException, generate_summary_report
+)
+
+class TestSQLiteStore(unittest.TestCase):
+
+    def setUp(self):
+        """Seed a database from in-memory projects"""
+        ProjectManager._instance = None
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_file = os.path.join(self.temp_dir.name, "projects.db")
+        self.manager = ProjectManager()
+        projects = [
+            EnhancedProject("Solar Farm", "Solar energy", "2020", Location("New South Wales", "Sydney"), "$1.00m"),
+            EnhancedPastProject("Wind Farm", "Wind energy", "2019", Location("South Australia", "Adelaide")),
+            EnhancedProject("Solar Farm", "Solar energy", "2021", Location("Western Australia", "Perth")),
+        ]
+        for project, funding in zip(projects, [100.0, 200.0, 300.0]):
+            project.set_funding(funding)
+        self.manager.projects = projects
+        self.store = self.manager.open_sqlite(self.db_file)
+
+    def tearDown(self):
+        self.manager.close_sqlite()
+        self.temp_dir.cleanup()
+        ProjectManager._instance = None
+        Project.projects = []
+
+    def reopen(self):
+        """Open the same database from a fresh manager with nothing loaded"""
+        self.manager.close_sqlite()
+        ProjectManager._instance = None
+        self.manager = ProjectManager()
+        self.store = self.manager.open_sqlite(self.db_file)
+
+    def test_round_trip_and_indexes(self):
+        """Test rows keep their fields and type, and filter columns are indexed"""
+        self.reopen()
+        self.assertEqual(len(self.store), 3)
+        wind = self.manager.search_by_name("Wind Farm")[0]
+        self.assertIsInstance(wind, EnhancedPastProject)
+        self.assertEqual(wind.get_location(), "Adelaide, South Australia")
+        self.assertEqual(wind._get_funding_value(), 200.0)
+
+        indexes = {row[1] for row in self.store.connection.execute("PRAGMA index_list(projects)")}
+        self.assertTrue({"idx_projects_category", "idx_projects_state", "idx_projects_year"} <= indexes)
+
+    def test_search_returns_all_matches(self):
+        """Test name search pushes down and returns every duplicate"""
+        self.reopen()
+        matches = self.manager.search_by_name("Solar Farm")
+        self.assertEqual([p._get_year_started_value() for p in matches], ["2020", "2021"])
+        self.assertIs(self.manager.search_by_name("Wind Farm")[0], self.manager.search_by_name("Wind Farm")[0])
+
+    def test_filters_and_aggregations_push_down(self):
+        """Test report selections aggregate in SQL like the in-memory visualizer"""
+        self.reopen()
+        solar = self.manager.filter_projects("category", "Solar energy")
+        self.assertEqual(len(solar), 2)
+        self.assertEqual(solar.funding_by_category(), {"Solar energy": 400.0})
+        self.assertEqual(solar.count_by_year(), {"2020": 1, "2021": 1})
+        self.assertEqual(len(self.manager.filter_projects("state", "Australia")), 0)
+
+        everything = self.store.select()
+        in_memory = VisualizationDecorator(everything.get_projects())
+        self.assertEqual(VisualizationDecorator(everything)._count_by_category(), in_memory._count_by_category())
+
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_unknown_year_is_not_charted(self, mock_savefig):
+        """Test rows without a start year are left out of the year counts and line chart"""
+        self.manager.add_project(EnhancedProject("No Year", "Wind energy", None, Location("Tasmania", "Hobart")))
+        self.manager.add_project(EnhancedProject("Dated", "Wind energy", "2022", Location("Tasmania", "Hobart")))
+        self.reopen()
+        tasmania = self.manager.filter_projects("state", "Tasmania")
+        self.assertEqual(len(tasmania), 2)
+        self.assertEqual(tasmania.count_by_year(), {"2022": 1})
+
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        try:
+            generate_summary_report(self.manager, "state", "Tasmania")
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(mock_savefig.call_count, 3)
+
+    def test_edits_are_single_row_updates(self):
+        """Test manager setters write through to the database"""
+        self.reopen()
+        wind = self.manager.search_by_name("Wind Farm")[0]
+        self.manager.set_category(wind, "Bioenergy")
+        self.manager.set_location(wind, Location("Tasmania", "Hobart"))
+        self.manager.set_budget(wind, "$2.00m")
+        with self.assertRaises(InvalidBudgetException):
+            self.manager.set_budget(wind, "lots")
+        del wind
+
+        self.reopen()
+        wind = self.manager.filter_projects("state", "Tasmania").get_projects()[0]
+        self.assertEqual(wind.get_category(), "Bioenergy")
+        self.assertEqual(wind.get_budget(), "$2.00m")
+
+    def test_seeded_and_imported_projects_are_editable(self):
+        """Test projects written by seeding or a text import write their edits through"""
+        self.manager.set_category(self.manager.projects[0], "Wind energy")
+        self.assertEqual(self.store.select("category = ?", ("Wind energy",)).count_by_category(), {"Wind energy": 2})
+
+        text_file = os.path.join(self.temp_dir.name, "import.txt")
+        Project.projects = [EnhancedProject("Imported", "Bioenergy", "2019", Location("Tasmania", "Hobart"))]
+        Project.write_project_to_file(text_file)
+        self.manager.import_from_text(text_file)
+        self.manager.set_year_started(self.manager.projects[0], "2023")
+        self.reopen()
+        self.assertEqual(self.manager.filter_projects("year", "2023").get_projects()[0].get_name(), "Imported")
+
+    def test_edit_of_unstored_project_changes_nothing(self):
+        """Test a project that is not in the database is rejected before its setter runs"""
+        stray = EnhancedProject("Stray", "Solar energy", "2020", Location("Victoria", "Melbourne"))
+        with self.assertRaises(ValueError):
+            self.manager.set_category(stray, "Wind energy")
+        self.assertEqual(stray.get_category(), "Solar energy")
+
+    def test_failed_import_keeps_rows(self):
+        """Test a text import that violates the schema leaves the database unchanged"""
+        text_file = os.path.join(self.temp_dir.name, "bad.txt")
+        with open(text_file, "w") as file:
+            file.write("Project info:\nCategory: Solar energy,\nYear Started: 2020,\n"
+                       "Location: Hobart, Tasmania,\nFunding: 0,\nTotal Cost: 0\n")
+        self.manager.import_from_text(text_file)
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(len(self.manager.search_by_name("Solar Farm")), 2)
+
+    def test_add_project_inserts_row(self):
+        """Test new projects are inserted into the database"""
+        self.manager.add_project(EnhancedProject("New", "Bioenergy", "2024", Location("Victoria", "Bendigo")))
+        self.reopen()
+        self.assertEqual(len(self.manager.search_by_name("New")), 1)
+        self.assertEqual(self.manager.projects, [])
+
+if __name__ == '__main__':
+    unittest.main()
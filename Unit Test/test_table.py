@@ -0,0 +1,101 @@
+import unittest
+import os
+import tempfile
+from unittest.mock import patch
+from A3 import (
+    Project, EnhancedProject, ProjectManager, ProjectTable, Location,
+    VisualizationDecorator, generate_summary_report
+)
+
+class TestProjectTable(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a small mixed set of projects"""
+        self.projects = [
+            EnhancedProject("Solar 1", "Solar energy", "2020", Location("New South Wales", "Sydney")),
+            EnhancedProject("Wind 1", "Wind energy", "2021", Location("Victoria", "Melbourne")),
+            EnhancedProject("Solar 2", "Solar energy", "2021", Location("Victoria", "Geelong")),
+        ]
+        for project, funding in zip(self.projects, [100000, 200000, 150000]):
+            project.set_funding(funding)
+            project.set_total_cost(funding * 2)
+        self.table = ProjectTable.from_projects(self.projects)
+
+    def test_dictionary_encoding(self):
+        """Test categories and states are stored as codes into a dictionary"""
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.categories, ["Solar energy", "Wind energy"])
+        self.assertEqual(self.table.category_codes.tolist(), [0, 1, 0])
+        self.assertEqual(self.table.states, ["New South Wales", "Victoria"])
+        self.assertEqual(self.table.years.tolist(), [2020, 2021, 2021])
+
+    def test_masks_and_select(self):
+        """Test vectorized filters select the matching rows"""
+        solar = self.table.select(self.table.category_mask("Solar energy"))
+        self.assertEqual([p.get_name() for p in solar.get_projects()], ["Solar 1", "Solar 2"])
+
+        victoria = self.table.select(self.table.state_mask("Victoria"))
+        self.assertEqual(len(victoria), 2)
+
+        # Unknown values and partial state names match nothing
+        self.assertEqual(len(self.table.select(self.table.category_mask("Bioenergy"))), 0)
+        self.assertEqual(len(self.table.select(self.table.state_mask("Vic"))), 0)
+
+    def test_aggregations(self):
+        """Test aggregations match the per-object computations"""
+        self.assertEqual(self.table.count_by_category(), {"Solar energy": 2, "Wind energy": 1})
+        self.assertEqual(self.table.funding_by_category(), {"Solar energy": 250000.0, "Wind energy": 200000.0})
+        self.assertEqual(self.table.count_by_year(), {"2020": 1, "2021": 2})
+        self.assertEqual(self.table.total_funding(), 450000.0)
+        self.assertEqual(self.table.total_costs(), 900000.0)
+
+    def test_visualizer_uses_table_aggregates(self):
+        """Test the visualizer aggregates a table the same as a project list"""
+        from_list = VisualizationDecorator(self.projects)
+        from_table = VisualizationDecorator(self.table)
+        self.assertEqual(from_list._count_by_category(), from_table._count_by_category())
+        self.assertEqual(from_list._funding_by_category(), from_table._funding_by_category())
+        self.assertEqual(from_list._count_by_year(), from_table._count_by_year())
+
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_summary_report_from_table(self, mock_savefig):
+        """Test generating a summary report from a ProjectTable"""
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                generate_summary_report(self.table, "state", "Victoria")
+                with open("ARENA_report_Victoria.txt") as file:
+                    content = file.read()
+            finally:
+                os.chdir(cwd)
+        self.assertIn("Total Projects Found: 2", content)
+        self.assertIn("Wind 1", content)
+        self.assertEqual(mock_savefig.call_count, 3)
+
+class TestProjectManagerTable(unittest.TestCase):
+
+    def setUp(self):
+        ProjectManager._instance = None
+        self.manager = ProjectManager()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.json_file = os.path.join(self.temp_dir.name, "projects.json")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        ProjectManager._instance = None
+        Project.projects = []
+
+    def test_load_from_json_builds_table(self):
+        """Test load_from_json can build the columnar table"""
+        project = EnhancedProject("Table Test", "Bioenergy", "2019", Location("Tasmania", "Hobart"))
+        project.set_funding(5000)
+        self.manager.projects = [project]
+        self.manager.save_to_json(self.json_file)
+
+        self.assertTrue(self.manager.load_from_json(self.json_file, build_table=True))
+        self.assertEqual(len(self.manager.table), 1)
+        self.assertEqual(self.manager.table.funding_by_category(), {"Bioenergy": 5000.0})
+
+if __name__ == '__main__':
+    unittest.main()
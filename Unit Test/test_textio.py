@@ -0,0 +1,158 @@
+import unittest
+import os
+import tempfile
+from unittest.mock import patch
+from A3 import Project, EnhancedProject, ProjectManager, Location
+from A3.textio import iter_records, chunk_boundaries, parse_text_file, write_text_file
+
+class TestTextParser(unittest.TestCase):
+
+    def setUp(self):
+        """Write a legacy text export with a few hundred records"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.temp_dir.name, "projects.txt")
+        Project.projects = []
+        for i in range(300):
+            project = Project(f"Project {i}", "Wind energy" if i % 2 else "Solar energy", str(2009 + i % 17),
+                              Location("Victoria", "Melbourne"))
+            project.set_funding(float(i))
+            project.set_total_cost(float(i * 2))
+            project.add_to_list()
+        Project.write_project_to_file(self.filename)
+        Project.projects = []
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        Project.projects = []
+        ProjectManager._instance = None
+
+    def test_iter_records_includes_last_record(self):
+        """Test a record without a trailing blank line is still yielded once"""
+        lines = ["", "    Project info: ", "    Name: A,", "    Category: Bioenergy,", "",
+                 "    Project info: ", "    Name: B,", "    Location: Hobart, Tasmania"]
+        records = list(iter_records(lines))
+        self.assertEqual(records, [{"Name": "A", "Category": "Bioenergy"},
+                                   {"Name": "B", "Location": "Hobart, Tasmania"}])
+
+    def test_chunks_split_at_record_boundaries(self):
+        """Test every chunk starts at a record boundary and they cover the file"""
+        boundaries = chunk_boundaries(self.filename, 7)
+        self.assertEqual(boundaries[0], 0)
+        self.assertEqual(boundaries[-1], os.path.getsize(self.filename))
+        self.assertEqual(boundaries, sorted(set(boundaries)))
+        with open(self.filename, 'rb') as file:
+            data = file.read()
+        for boundary in boundaries[1:-1]:
+            self.assertEqual(data[boundary - 2:boundary], b"\n\n")
+
+    def test_parallel_parse_matches_serial(self):
+        """Test the process-pool parser returns the same projects in file order"""
+        serial = parse_text_file(self.filename, EnhancedProject)
+        parallel = parse_text_file(self.filename, EnhancedProject, workers=2, min_chunk_bytes=2048)
+        self.assertEqual(len(serial), 300)
+        self.assertEqual([p.to_dict() for p in parallel], [p.to_dict() for p in serial])
+        self.assertEqual(serial[5]._get_funding_value(), 5.0)
+
+    def test_parallel_lines_split_like_serial(self):
+        """Test separators other than newlines stay inside a value in both modes"""
+        Project.projects = [Project(f"Grid\u2028Hub\x0c{i}", "Solar energy", "2020", Location("Victoria", "Melbourne"))
+                            for i in range(100)]
+        write_text_file(self.filename, Project.projects)
+        Project.projects = []
+        serial = parse_text_file(self.filename, EnhancedProject)
+        parallel = parse_text_file(self.filename, EnhancedProject, workers=2, min_chunk_bytes=512)
+        self.assertEqual(serial[0].get_name(), "Grid\u2028Hub\x0c0")
+        self.assertEqual([p.get_name() for p in parallel], [p.get_name() for p in serial])
+
+    def test_import_does_not_touch_global_list_twice(self):
+        """Test import_from_text replaces the manager projects with the file contents"""
+        manager = ProjectManager()
+        manager.projects = [EnhancedProject("Old", "Bioenergy", "2010", Location("Tasmania", "Hobart"))]
+        manager.import_from_text(self.filename, workers=2)
+        self.assertEqual(len(manager.projects), 300)
+        self.assertIs(Project.projects, manager.projects)
+        self.assertEqual(manager.search_by_name("Old"), [])
+
+    def test_load_projects_from_file_appends(self):
+        """Test the legacy loader still appends plain Projects to Project.projects"""
+        Project.load_projects_from_file(self.filename)
+        self.assertEqual(len(Project.projects), 300)
+        self.assertEqual(type(Project.projects[0]), Project)
+        self.assertEqual(Project.projects[299].get_name(), "Project 299")
+
+class TestTextWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.projects = []
+        for i in range(50):
+            project = EnhancedProject(f"Project {i}", "Hydrogen", "2015", Location("Queensland", "Cairns"))
+            if i % 3:
+                project.set_funding(i * 1.5)
+            self.projects.append(project)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_bytes_match_per_project_writes(self):
+        """Test the buffered writer produces the same bytes as str(project) + newline"""
+        filename = os.path.join(self.temp_dir.name, "bulk.txt")
+        count = write_text_file(filename, self.projects, batch_size=7)
+        self.assertEqual(count, 50)
+        with open(filename) as file:
+            self.assertEqual(file.read(), "".join(str(p) + "\n" for p in self.projects))
+
+    def test_writes_from_generator_and_round_trips(self):
+        """Test a generator can be written and parsed back unchanged"""
+        filename = os.path.join(self.temp_dir.name, "generated.txt")
+        write_text_file(filename, (p for p in self.projects))
+        loaded = parse_text_file(filename, EnhancedProject)
+        self.assertEqual([p.get_name() for p in loaded], [p.get_name() for p in self.projects])
+        self.assertEqual([p.to_dict() for p in loaded], [p.to_dict() for p in self.projects])
+        self.assertEqual(loaded[4]._get_funding_value(), 6.0)
+
+class TestDirectoryImport(unittest.TestCase):
+
+    def setUp(self):
+        """Write three regional exports and one unreadable file"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        ProjectManager._instance = None
+        self.manager = ProjectManager()
+        for region, state in [("b_vic", "Victoria"), ("a_nsw", "New South Wales"), ("c_qld", "Queensland")]:
+            projects = [EnhancedProject(f"{region} {i}", "Solar energy", "2020", Location(state, "City"))
+                        for i in range(20)]
+            write_text_file(os.path.join(self.temp_dir.name, region + ".txt"), projects)
+        with open(os.path.join(self.temp_dir.name, "bad.txt"), 'wb') as file:
+            file.write(b"\xff\xfe\x00 not text")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        ProjectManager._instance = None
+        Project.projects = []
+
+    def test_directory_import_merges_in_filename_order(self):
+        """Test files are merged in sorted order and a bad file doesn't stop the batch"""
+        existing = EnhancedProject("Existing", "Hydrogen", "2018", Location("Tasmania", "Hobart"))
+        self.manager.projects = [existing]
+        with patch('locale.getpreferredencoding', return_value='utf-8'):
+            report = self.manager.import_from_files(self.temp_dir.name, workers=2)
+
+        self.assertEqual([os.path.basename(entry[0]) for entry in report],
+                         ["a_nsw.txt", "b_vic.txt", "bad.txt", "c_qld.txt"])
+        self.assertEqual([entry[1] for entry in report], [20, 20, 0, 20])
+        self.assertIsNotNone(report[2][3])
+        self.assertEqual(len(self.manager.projects), 61)
+        self.assertIs(self.manager.projects[0], existing)
+        self.assertEqual(self.manager.projects[1].get_name(), "a_nsw 0")
+        self.assertEqual(self.manager.projects[-1].get_name(), "c_qld 19")
+        self.assertEqual(len(self.manager.filter_projects("state", "Victoria")), 20)
+        self.assertTrue(self.manager.dirty)
+
+    def test_glob_pattern(self):
+        """Test a glob pattern selects only the matching files"""
+        report = self.manager.import_from_files(os.path.join(self.temp_dir.name, "[ab]_*.txt"), workers=1)
+        self.assertEqual(len(report), 2)
+        self.assertEqual(len(self.manager.projects), 40)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from A3 import (
+    EnhancedProject, Location, InvalidBudgetException, InvalidDateException,
+    ValidationReport, validate_column, validate_records
+)
+
+class TestBatchValidation(unittest.TestCase):
+
+    def setUp(self):
+        """Set up one valid record in the to_dict() format"""
+        self.valid = EnhancedProject.from_dict({
+            'name': "Solar Farm", 'category': "Solar energy", 'year_started': "2020",
+            'location': "Sydney, New South Wales", 'total_cost': 1000.0, 'funding': 500.0,
+            'budget': "$4.81m", 'project_period': "01/01/2020 – 31/12/2025",
+            'type': "EnhancedCurrentProject",
+        }).to_dict()
+
+    def test_valid_records_have_no_errors(self):
+        """Test a clean batch produces an empty report"""
+        report = validate_records([self.valid] * 5)
+        self.assertTrue(report.is_valid())
+        self.assertEqual(report.rows, 5)
+
+    def test_unset_budget_and_period_are_valid(self):
+        """Test to_dict() output of a project without budget or period passes"""
+        record = EnhancedProject("Wind Farm", "Wind energy", "2019", Location("Victoria", "Melbourne")).to_dict()
+        self.assertEqual((record['budget'], record['project_period']), ('', ''))
+        self.assertTrue(validate_records([record]).is_valid())
+
+    def test_errors_are_reported_per_row(self):
+        """Test every failing field is reported with its row instead of raising"""
+        bad = dict(self.valid, category="Nuclear", year_started="2030", budget="4.81m")
+        missing = {'name': "No Location", 'category': "Bioenergy", 'year_started': "2015"}
+        report = validate_records([self.valid, bad, missing, self.valid])
+
+        self.assertEqual(report.rows, 4)
+        self.assertEqual(report.invalid_rows(), [1, 2])
+        self.assertEqual([error.field for error in report.errors_for(1)], ["category", "year_started", "budget"])
+        self.assertEqual(report.errors_for(1)[0].message, "Invalid category: Nuclear")
+        self.assertEqual(report.errors_for(2)[0].message, "Missing field: location")
+        self.assertEqual(report.counts_by_field(), {"category": 1, "year_started": 1, "budget": 1, "location": 1})
+
+    def test_reports_accumulate_across_batches(self):
+        """Test row numbers continue when a report is reused for the next batch"""
+        report = validate_records([self.valid, self.valid])
+        validate_records([dict(self.valid, type="Other")], report)
+        self.assertIsInstance(report, ValidationReport)
+        self.assertEqual(report.invalid_rows(), [2])
+
+    def test_location_state_must_be_valid(self):
+        """Test locations are checked on their state part"""
+        report = validate_column('location', ["Perth, Western Australia", "Perth", "Perth, Atlantis"])
+        self.assertEqual(report.invalid_rows(), [1, 2])
+
+    def test_matches_single_value_validators(self):
+        """Test budget and period checks agree with the raising validators"""
+        budgets = ["$4.81m", "$500k", "$500K", "$4.8m", "4.81m", "$m"]
+        periods = ["01/01/2020 – 31/12/2025", "01/01/2020 - 31/12/2025", "31/12/2025 – 01/01/2020",
+                   "31/02/2020 – 01/01/2021", "01/01/2020–31/12/2025", "01/01/2020 – 01/01/2020"]
+        for field, values, validator, exception in [
+            ('budget', budgets, InvalidBudgetException.validate_budget, InvalidBudgetException),
+            ('project_period', periods, InvalidDateException.validate_date_range, InvalidDateException),
+        ]:
+            expected = []
+            for row, value in enumerate(values):
+                try:
+                    validator(value)
+                except exception:
+                    expected.append(row)
+            with self.subTest(field=field):
+                self.assertEqual(validate_column(field, values).invalid_rows(), expected)
+
+if __name__ == '__main__':
+    unittest.main()
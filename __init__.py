@@ -26,10 +26,13 @@ from .exceptions import (
     InvalidDateException,
     InvalidStateAddressException,
 )
+from .cube import AggregateCube
 from .manager import ProjectManager
-from .visualization import VisualizationDecorator
-from .reporting import generate_summary_report
-from .cli import create_enhanced_project, main
+from .table import ProjectTable
+from .validation import ValidationReport, validate_column, validate_records
+from .visualization import ChartAggregate, ChartCache, VisualizationDecorator
+from .reporting import generate_summary_report, generate_summary_reports, generate_all_reports
+from .cli import create_enhanced_project, main, run_cli
 
 __all__ = [
     # models
@@ -52,11 +55,22 @@ __all__ = [
     "InvalidBudgetException",
     "InvalidDateException",
     "InvalidStateAddressException",
-    # manager/visualization
+    # manager/table/visualization
     "ProjectManager",
+    "ProjectTable",
+    "AggregateCube",
     "VisualizationDecorator",
+    "ChartAggregate",
+    "ChartCache",
+    # batch validation
+    "ValidationReport",
+    "validate_column",
+    "validate_records",
     # functions
     "generate_summary_report",
+    "generate_summary_reports",
+    "generate_all_reports",
     "create_enhanced_project",
     "main",
+    "run_cli",
 ]
@@ -0,0 +1,9 @@
+import sys
+
+from .cli import main, run_cli
+
+if __name__ == "__main__":
+    # With arguments, run one scripted command; without, start the menu
+    if len(sys.argv) > 1:
+        sys.exit(run_cli())
+    main()
@@ -0,0 +1,5 @@
+"""Benchmarks for the A3 package.
+
+Run a benchmark as a module from the directory that contains the package,
+for example ``python -m A3.benchmarks.bench_memory``.
+"""
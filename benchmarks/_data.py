@@ -0,0 +1,34 @@
+import json
+import random
+
+from ..exceptions import InvalidCategoryException, InvalidStateException, InvalidCityException
+
+TYPES = ["EnhancedProject", "EnhancedCurrentProject", "EnhancedPastProject"]
+
+
+def make_records(count, seed=0):
+    """Return ``count`` synthetic project dicts in the to_dict() format"""
+    rng = random.Random(seed)
+    categories = InvalidCategoryException.valid_category
+    states = InvalidStateException.valid_state
+    cities = InvalidCityException.valid_city
+    records = []
+    for i in range(count):
+        cost = round(rng.uniform(1e5, 5e7), 2)
+        records.append({
+            'name': f"Project {i}",
+            'category': rng.choice(categories),
+            'year_started': str(rng.randint(2009, 2025)),
+            'location': f"{rng.choice(cities)}, {rng.choice(states)}",
+            'total_cost': cost,
+            'funding': round(cost * rng.uniform(0.1, 0.9), 2),
+            'budget': f"${rng.randint(1, 99)}.{rng.randint(10, 99)}m",
+            'project_period': "01/01/2020 – 31/12/2025",
+            'type': rng.choice(TYPES),
+        })
+    return records
+
+
+def decoded_records(count, seed=0):
+    """Like make_records, but every string is a fresh object as json.load produces"""
+    return json.loads(json.dumps(make_records(count, seed)))
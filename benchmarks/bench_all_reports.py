@@ -0,0 +1,55 @@
+"""All category and state reports: one filter pass per value versus one group-by pass.
+
+    python -m A3.benchmarks.bench_all_reports [count]
+
+Times the text reports and chart aggregation (the part that scans the
+projects); chart rendering costs the same in both modes and is left out.
+"""
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+from ..exceptions import InvalidCategoryException, InvalidStateException
+from ..models import EnhancedProject
+from ..reporting import write_all_text_reports, write_text_report
+from ._data import make_records
+
+
+def looped(projects):
+    jobs = []
+    for category in InvalidCategoryException.valid_category:
+        jobs.extend(write_text_report(projects, "category", category) or [])
+    for state in InvalidStateException.valid_state:
+        jobs.extend(write_text_report(projects, "state", state) or [])
+    return jobs
+
+
+def timed(function, projects):
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            start = time.perf_counter()
+            with redirect_stdout(StringIO()):
+                jobs = function(projects)
+            return time.perf_counter() - start, len(jobs)
+        finally:
+            os.chdir(cwd)
+
+
+def main(count=100_000):
+    projects = [EnhancedProject.from_dict(record) for record in make_records(count)]
+    loop_time, loop_jobs = timed(looped, projects)
+    batch_time, batch_jobs = timed(write_all_text_reports, projects)
+    assert loop_jobs == batch_jobs
+
+    print(f"{count} projects, {loop_jobs // 3} reports")
+    print(f"one call per value  {loop_time:7.2f} s")
+    print(f"single group-by     {batch_time:7.2f} s  ({loop_time / batch_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,56 @@
+"""Per-report aggregation: a pass over the matching projects versus a cube slice.
+
+    python -m A3.benchmarks.bench_cube [count]
+
+Times the chart data and budget total of one report per state, the part
+that used to scan the projects, and the incremental cube update per edit.
+"""
+import sys
+import time
+
+from ..cube import AggregateCube
+from ..exceptions import InvalidStateException
+from ..manager import ProjectManager
+from ..models import EnhancedProject
+from ..reporting import total_budget_cents
+from ..visualization import ChartAggregate
+from ._data import make_records
+
+
+def main(count=100_000):
+    ProjectManager._instance = None
+    manager = ProjectManager()
+    manager.projects = [EnhancedProject.from_dict(record) for record in make_records(count)]
+    states = sorted(InvalidStateException.valid_state)
+
+    start = time.perf_counter()
+    scanned = []
+    for state in states:
+        filtered = manager.filter_projects("state", state)
+        scanned.append((vars(ChartAggregate.from_projects(filtered)), total_budget_cents(filtered)))
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sliced = []
+    for state in states:
+        summary = manager.cube.slice(state=state)
+        sliced.append((vars(ChartAggregate.from_projects(summary)), total_budget_cents(summary)))
+    cube_time = time.perf_counter() - start
+    assert [entry[1] for entry in scanned] == [entry[1] for entry in sliced]
+
+    projects = manager.projects[:1000]
+    start = time.perf_counter()
+    for project in projects:
+        manager.set_year_started(project, "2015")
+    edit_time = time.perf_counter() - start
+    assert manager.cube.cells == AggregateCube(manager.projects).cells
+
+    print(f"{count} projects, {len(states)} state reports, {len(manager.cube.cells)} cube cells")
+    print(f"scan the projects  {scan_time:7.3f} s")
+    print(f"slice the cube     {cube_time:7.3f} s  ({scan_time / cube_time:.1f}x)")
+    print(f"cube upkeep        {edit_time / len(projects) * 1e6:7.1f} us per edit")
+    ProjectManager._instance = None
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
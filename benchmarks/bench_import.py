@@ -0,0 +1,67 @@
+"""Import time of the package, and a check that it does not load matplotlib.
+
+    python -m A3.benchmarks.bench_import [runs]
+
+Runs ``python -X importtime -c "import A3"`` in fresh interpreters and
+reports the best total, the slowest modules, and what drawing the first
+chart adds on top. Exits with status 1 if matplotlib is imported eagerly.
+"""
+import os
+import subprocess
+import sys
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = os.path.basename(PACKAGE_DIR)
+
+# Modules that should only be imported once a chart is rendered
+DEFERRED = ('matplotlib',)
+
+
+def import_times(statement):
+    """``[(depth, module, cumulative microseconds)]`` for a fresh interpreter running ``statement``"""
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(PACKAGE_DIR))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, env=env, check=True)
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        name = module.strip()
+        # Nested imports are indented two spaces per level
+        times.append(((len(module.rstrip()) - len(name) - 1) // 2, name, int(cumulative)))
+    return times
+
+
+def total(times):
+    return sum(cumulative for depth, _, cumulative in times if depth == 0)
+
+
+def best(statement, runs):
+    samples = [import_times(statement) for _ in range(runs)]
+    return min(map(total, samples)), samples[-1]
+
+
+def main(runs=5):
+    package_time, times = best(f"import {PACKAGE}", runs)
+    eager = sorted({name for _, name, _ in times if name.split(".")[0] in DEFERRED})
+
+    print(f"import {PACKAGE}: {package_time / 1000:7.1f} ms (best of {runs})")
+    # The package's own modules and what they pull in, slowest first
+    nested = [(cumulative, name) for depth, name, cumulative in times if depth == 1]
+    for cumulative, name in sorted(nested, reverse=True)[:5]:
+        print(f"  {name:28s} {cumulative / 1000:7.1f} ms")
+
+    render = f"import {PACKAGE}; from {PACKAGE}.visualization import _new_figure; _new_figure((1, 1))"
+    render_time, _ = best(render, runs)
+    print(f"first chart adds {(render_time - package_time) / 1000:7.1f} ms of imports")
+
+    if eager:
+        print(f"FAIL: imported with the package: {', '.join(eager[:5])}")
+        return 1
+    print("ok: matplotlib is not imported until a chart is drawn")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5))
@@ -0,0 +1,49 @@
+"""Bytes per project: legacy A3.py classes versus the slotted, interned models.
+
+    python -m A3.benchmarks.bench_memory [count]
+"""
+import gc
+import importlib.util
+import os
+import sys
+import tracemalloc
+
+from ..models import EnhancedProject
+from ._data import decoded_records
+
+
+def load_legacy_module():
+    """Import the single-file A3.py (no __slots__, no interning) under another name"""
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "A3.py")
+    spec = importlib.util.spec_from_file_location("A3_legacy", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def bytes_per_project(from_dict, count):
+    """Memory retained by ``count`` projects loaded from freshly decoded JSON"""
+    gc.collect()
+    tracemalloc.start()
+    records = decoded_records(count)
+    projects = [from_dict(record) for record in records]
+    del records
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(projects) == count
+    return retained / count
+
+
+def main(count=100_000):
+    legacy = load_legacy_module()
+    before = bytes_per_project(legacy.EnhancedProject.from_dict, count)
+    after = bytes_per_project(EnhancedProject.from_dict, count)
+    print(f"{count} projects")
+    print(f"before (A3.py, __dict__ per instance): {before:8.1f} bytes/project")
+    print(f"after  (__slots__ + interned strings): {after:8.1f} bytes/project")
+    print(f"saving: {before - after:.1f} bytes/project ({(1 - after / before) * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,60 @@
+"""Project-period parsing: regex + strptime versus the hand-rolled parser.
+
+    python -m A3.benchmarks.bench_periods [count]
+"""
+import random
+import re
+import sys
+import time
+from datetime import datetime
+
+from ..periods import parse_period
+
+
+def strptime_period(text):
+    # What InvalidDateException.validate_date_range did per value before
+    if not re.match(r'^\d{2}/\d{2}/\d{4}\s+[–-]\s+\d{2}/\d{2}/\d{4}$', text):
+        return None
+    dates = text.split('–') if '–' in text else text.split('-')
+    start, end = dates[0].strip(), dates[1].strip()
+    if not re.match(r'^\d{2}/\d{2}/\d{4}$', start) or not re.match(r'^\d{2}/\d{2}/\d{4}$', end):
+        return None
+    try:
+        return (datetime.strptime(start, '%d/%m/%Y').toordinal(),
+                datetime.strptime(end, '%d/%m/%Y').toordinal())
+    except ValueError:
+        return None
+
+
+def make_periods(count, seed=0):
+    rng = random.Random(seed)
+    periods = []
+    for _ in range(count):
+        year = rng.randint(2009, 2025)
+        dash = rng.choice(['–', '-'])
+        periods.append(f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{year} {dash} "
+                       f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/{year + rng.randint(1, 5)}")
+    return periods
+
+
+def timed(function, values):
+    start = time.perf_counter()
+    results = [function(value) for value in values]
+    return time.perf_counter() - start, results
+
+
+def main(count=200_000):
+    periods = make_periods(count)
+    old, expected = timed(strptime_period, periods)
+    new, parsed = timed(parse_period.__wrapped__, periods)  # uncached: every string parsed
+    cached, _ = timed(parse_period, periods)
+    assert parsed == expected
+
+    print(f"{count} periods ({len(set(periods))} distinct)")
+    print(f"regex + strptime  {old:8.3f} s")
+    print(f"hand-rolled       {new:8.3f} s  ({old / new:.1f}x)")
+    print(f"hand-rolled+cache {cached:8.3f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
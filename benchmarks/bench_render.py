@@ -0,0 +1,46 @@
+"""Chart rendering wall-clock: serial versus a process pool.
+
+    python -m A3.benchmarks.bench_render [workers]
+
+Renders the three charts of one report per state, first serially and then
+in a pool, from the same aggregated jobs.
+"""
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+from ..models import EnhancedProject
+from ..reporting import generate_summary_reports
+from ._data import make_records
+
+
+def timed_reports(projects, searches, workers):
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            start = time.perf_counter()
+            with redirect_stdout(StringIO()):
+                generate_summary_reports(projects, searches, workers)
+            return time.perf_counter() - start
+        finally:
+            os.chdir(cwd)
+
+
+def main(workers=None):
+    workers = workers or os.cpu_count()
+    projects = [EnhancedProject.from_dict(record) for record in make_records(5000)]
+    searches = [("state", state) for state in sorted({p._get_state_value() for p in projects})]
+
+    serial = timed_reports(projects, searches, None)
+    pooled = timed_reports(projects, searches, workers)
+    print(f"{len(searches)} reports, {3 * len(searches)} charts, {os.cpu_count()} CPU(s)")
+    print(f"serial            {serial:7.2f} s")
+    print(f"pool ({workers} workers) {pooled:7.2f} s  ({serial / pooled:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else None)
@@ -0,0 +1,42 @@
+"""Memory across many generate_summary_report calls (should stay flat).
+
+    python -m A3.benchmarks.bench_report_memory [reports]
+"""
+import os
+import resource
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+from ..models import EnhancedProject
+from ..reporting import generate_summary_report
+from ._data import make_records
+
+
+def max_rss_mb():
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main(reports=300):
+    projects = [EnhancedProject.from_dict(record) for record in make_records(2000)]
+    states = sorted({project._get_state_value() for project in projects})
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            start = time.perf_counter()
+            for number in range(1, reports + 1):
+                with redirect_stdout(StringIO()):
+                    generate_summary_report(projects, "state", states[number % len(states)])
+                if number % max(1, reports // 10) == 0:
+                    print(f"{number:6d} reports  {time.perf_counter() - start:7.1f} s  max RSS {max_rss_mb():7.1f} MB")
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
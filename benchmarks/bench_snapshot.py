@@ -0,0 +1,50 @@
+"""Load/save timings: JSON versus the binary snapshot format.
+
+    python -m A3.benchmarks.bench_snapshot [count]
+"""
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+from ..manager import ProjectManager, snapshot_path
+from ..models import EnhancedProject
+from ._data import make_records
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    with redirect_stdout(StringIO()):
+        result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main(count=200_000):
+    manager = ProjectManager()
+    manager.projects = [EnhancedProject.from_dict(record) for record in make_records(count)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_file = os.path.join(directory, "projects.JSON")
+        snapshot_file = snapshot_path(json_file)
+
+        save_json, _ = timed(manager.save_to_json, json_file)
+        save_snapshot, _ = timed(manager.save_snapshot, snapshot_file)
+        load_json, ok = timed(manager.load_from_json, json_file)
+        assert ok and len(manager.projects) == count
+        load_snapshot, ok = timed(manager.load_snapshot, snapshot_file)
+        assert ok and len(manager.projects) == count
+
+        json_size = os.path.getsize(json_file)
+        snapshot_size = os.path.getsize(snapshot_file)
+
+    print(f"{count} projects")
+    print(f"{'':10}{'save (s)':>10}{'load (s)':>10}{'size (MB)':>11}")
+    print(f"{'JSON':10}{save_json:10.3f}{load_json:10.3f}{json_size / 1e6:11.1f}")
+    print(f"{'snapshot':10}{save_snapshot:10.3f}{load_snapshot:10.3f}{snapshot_size / 1e6:11.1f}")
+    print(f"load speed-up: {load_json / load_snapshot:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,53 @@
+"""Text export round trip: per-project writes versus the buffered bulk writer.
+
+    python -m A3.benchmarks.bench_textio [count]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from ..fileio import atomic_write
+from ..models import EnhancedProject
+from ..textio import parse_text_file, write_text_file
+from ._data import make_records
+
+
+def write_per_project(filename, projects):
+    # What Project.write_project_to_file did before the bulk writer
+    with atomic_write(filename) as file:
+        for project in projects:
+            file.write(str(project))
+            file.write("\n")
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main(count=200_000):
+    projects = [EnhancedProject.from_dict(record) for record in make_records(count)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        old_file = os.path.join(directory, "per_project.txt")
+        new_file = os.path.join(directory, "bulk.txt")
+
+        write_old, _ = timed(write_per_project, old_file, projects)
+        write_new, _ = timed(write_text_file, new_file, iter(projects))
+        with open(old_file, 'rb') as old, open(new_file, 'rb') as new:
+            assert old.read() == new.read()
+        read_back, loaded = timed(parse_text_file, new_file, EnhancedProject)
+        assert len(loaded) == count
+        size = os.path.getsize(new_file)
+
+    print(f"{count} projects, {size / 1e6:.1f} MB")
+    print(f"per-project writes {write_old:8.3f} s  ({size / write_old / 1e6:6.1f} MB/s)")
+    print(f"bulk writer        {write_new:8.3f} s  ({size / write_new / 1e6:6.1f} MB/s)")
+    print(f"parse back         {read_back:8.3f} s  ({size / read_back / 1e6:6.1f} MB/s)")
+    print(f"write speed-up: {write_old / write_new:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -1,3 +1,11 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from contextlib import nullcontext, redirect_stdout
+
 from .exceptions import (
     InvalidChoiceException,
     InvalidCategoryException,
@@ -7,9 +15,14 @@ from .exceptions import (
     InvalidBudgetException,
     InvalidDateException,
 )
+from .fileio import atomic_write
+from .jsonstream import iter_json_lines, write_json_array, write_json_lines
 from .manager import ProjectManager
-from .models import Location, EnhancedCurrentProject, EnhancedPastProject, Project
-from .reporting import generate_summary_report
+from .models import Location, EnhancedProject, EnhancedCurrentProject, EnhancedPastProject, Project
+from .reporting import generate_all_reports, generate_summary_report, write_all_text_reports, write_text_report
+from .textio import write_text_file
+from .validation import validate_records
+from .visualization import ChartCache, render_charts
 
 
 def create_enhanced_project():
@@ -120,13 +133,36 @@ def create_enhanced_project():
     return project
 
 
-def main():
-    """Main program with menu system"""
+def open_manager(json_filename="ARENA_projects.JSON", db_filename="ARENA_projects.db", journal=True):
+    """Load the projects into the ProjectManager the way the program starts up.
+
+    With ``journal`` False (read-only commands) the change journal is not
+    opened, so nothing is written next to the data files.
+    """
     manager = ProjectManager()
+    if os.path.exists(db_filename):
+        # SQLite store: edits are written straight to the database
+        manager.open_sqlite(db_filename)
+        print(f"Projects opened from {db_filename}")
+    else:
+        # Try to load from JSON first, otherwise load from text file
+        base = os.path.splitext(json_filename)[0]
+        manager.write_snapshots = True
+        if not manager.load_from_json(json_filename, prefer_snapshot=True):
+            manager.import_from_text(f"{base}.txt")
+        if journal:
+            # Replay changes journaled since the last snapshot (e.g. before a crash)
+            replayed = manager.open_journal(f"{base}.journal", json_filename)
+            if replayed:
+                print(f"Recovered {replayed} unsaved change(s) from the journal.")
+    return manager
+
 
-    # Try to load from JSON first, otherwise load from text file
-    if not manager.load_from_json():
-        manager.import_from_text()
+def main():
+    """Main program with menu system"""
+    manager = open_manager()
+    # Reports asked for again with unchanged data reuse their rendered charts
+    chart_cache = ChartCache()
 
     while True:
         print("\n" + "=" * 60)
@@ -148,42 +184,66 @@ def main():
             continue
 
         if choice.upper() == 'X':
-            # Save to both formats before exiting
-            Project.write_project_to_file("ARENA_projects.txt")
-            manager.save_to_json()
-            print("Data saved successfully. Goodbye!")
+            # Save to both formats before exiting, only if something changed
+            if manager.store is not None:
+                manager.close_sqlite()
+                print("All changes are stored in ARENA_projects.db. Goodbye!")
+            elif manager.dirty:
+                Project.write_project_to_file("ARENA_projects.txt")
+                manager.checkpoint()
+                print("Data saved successfully. Goodbye!")
+            else:
+                print("No changes to save. Goodbye!")
             break
 
         elif choice == '1':
-            Project.print_all_projects()
+            if manager.store is None:
+                Project.print_all_projects()
+            else:
+                printed = False
+                for project in manager.iter_projects():
+                    print(project)
+                    printed = True
+                if not printed:
+                    print("No projects available.")
 
         elif choice == '2':
             project = create_enhanced_project()
-            manager.projects.append(project)
-            Project.projects = manager.projects
+            manager.add_project(project)
             print("Project created successfully!")
 
         elif choice == '3':
             name = input("Please enter the project name you want to search/edit: ")
-            edit_project = Project.search_by_name(name)
+            matches = manager.search_by_name(name)
 
-            if edit_project is None:
+            if not matches:
                 print("Project not found.")
                 continue
 
+            edit_project = matches[0]
+            if len(matches) > 1:
+                print(f"\n{len(matches)} projects are named {name}:")
+                for number, match in enumerate(matches, 1):
+                    print(f"{number}. {match.get_name()} ({match.get_category()}, {match.get_location()})")
+                selection = input(f"Which project? (1-{len(matches)}): ").strip()
+                if not selection.isdigit() or not 1 <= int(selection) <= len(matches):
+                    print("Invalid selection.")
+                    continue
+                edit_project = matches[int(selection) - 1]
+
             print("\nProject found:")
             print(edit_project)
 
             edit_choice = input("Do you want to edit this project? (y/n): ").lower()
             if edit_choice == 'y':
-                attr_choice = input("Which attribute to edit? (1: category, 2: year, 3: budget, 4: period): ")
+                attr_choice = input("Which attribute to edit? (1: category, 2: year, 3: budget, 4: period, 5: name): ")
 
                 if attr_choice == "1":
                     while True:
                         try:
                             new_category = input("Please enter the new category: ")
                             InvalidCategoryException.validate_category(new_category)
-                            edit_project.set_category(new_category)
+                            manager.set_category(edit_project, new_category)
                             print("Category updated successfully!")
                             break
                         except InvalidCategoryException as e:
@@ -194,7 +254,7 @@ def main():
                         try:
                             new_year = input("Please enter the new start year: ")
                             InvalidYearException.validate_year(new_year)
-                            edit_project.set_year_started(new_year)
+                            manager.set_year_started(edit_project, new_year)
                             print("Year updated successfully!")
                             break
                         except InvalidYearException as e:
@@ -204,7 +264,7 @@ def main():
                     while True:
                         budget_input = input("Please enter the new budget (e.g., $4.81m): ")
                         try:
-                            edit_project.set_budget(budget_input)
+                            manager.set_budget(edit_project, budget_input)
                             print("Budget updated successfully!")
                             break
                         except InvalidBudgetException as e:
@@ -214,28 +274,235 @@ def main():
                     while True:
                         period_input = input("Please enter the new project period (DD/MM/YYYY – DD/MM/YYYY): ")
                         try:
-                            edit_project.set_project_period(period_input)
+                            manager.set_project_period(edit_project, period_input)
                             print("Project period updated successfully!")
                             break
                         except InvalidDateException as e:
                             print(e)
 
+                elif attr_choice == "5":
+                    new_name = input("Please enter the new project name: ")
+                    manager.rename_project(edit_project, new_name)
+                    print("Name updated successfully!")
+
         elif choice == '4':
-            search_type = input("Generate report by (1) category or (2) state: ")
+            search_type = input("Generate report by (1) category, (2) state, (3) active date or (4) all categories and states: ")
 
             if search_type in ['1', 'category']:
                 category = input("Please enter the category: ")
-                generate_summary_report(manager.projects, "category", category)
+                generate_summary_report(manager, "category", category, cache=chart_cache)
 
             elif search_type in ['2', 'state']:
                 state = input("Please enter the state name: ")
-                generate_summary_report(manager.projects, "state", state)
+                generate_summary_report(manager, "state", state, cache=chart_cache)
+
+            elif search_type in ['3', 'active']:
+                when = input("Please enter a date (DD/MM/YYYY) or period (DD/MM/YYYY – DD/MM/YYYY): ").strip()
+                generate_summary_report(manager, "active", when, cache=chart_cache)
+
+            elif search_type in ['4', 'all']:
+                start = time.perf_counter()
+                count = generate_all_reports(manager, workers=os.cpu_count(), cache=chart_cache)
+                print(f"Generated {count} reports in {time.perf_counter() - start:.1f}s")
 
             else:
-                print("Invalid choice. Please enter 1, 2, 'category', or 'state'.")
+                print("Invalid choice. Please enter 1, 2, 3, 4, 'category', 'state', 'active' or 'all'.")
 
         elif choice == '5':
-            filename = input("Please enter the text file name (default: ARENA_projects.txt): ").strip()
+            filename = input("Please enter a text file, directory or glob pattern (default: ARENA_projects.txt): ").strip()
             if not filename:
                 filename = "ARENA_projects.txt"
-            manager.import_from_text(filename)
+            if os.path.isdir(filename) or glob.has_magic(filename):
+                manager.import_from_files(filename)
+            else:
+                manager.import_from_text(filename)
+
+
+# Non-interactive commands: python -m A3 <command> ...
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m A3",
+        description="Run one ARENA project command without prompts. Results are written "
+                    "to stdout as JSON Lines; messages go to stderr.",
+    )
+    parser.add_argument("--json", default="ARENA_projects.JSON",
+                        help="JSON data file (default: %(default)s)")
+    parser.add_argument("--db", default="ARENA_projects.db",
+                        help="SQLite database, used instead of the JSON file if it exists (default: %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="print every project")
+
+    search = commands.add_parser("search", help="print the projects matching a name, category, state or date")
+    field = search.add_mutually_exclusive_group(required=True)
+    field.add_argument("--name")
+    field.add_argument("--category")
+    field.add_argument("--state")
+    field.add_argument("--active", metavar="WHEN", help="DD/MM/YYYY date or DD/MM/YYYY – DD/MM/YYYY period")
+
+    report = commands.add_parser("report", help="write summary reports and charts")
+    report.add_argument("search_type", choices=["category", "state", "active", "all"])
+    report.add_argument("search_value", nargs="?", help="required unless search_type is 'all'")
+    report.add_argument("--workers", type=int, help="render charts in this many processes")
+    report.add_argument("--no-cache", action="store_true", help="do not reuse previously rendered charts")
+
+    imports = commands.add_parser("import", help="add the projects from a text file, directory or glob")
+    imports.add_argument("source")
+    imports.add_argument("--workers", type=int, help="parse files in this many processes")
+
+    export = commands.add_parser("export", help="write every project to a file")
+    export.add_argument("filename", help="'-' streams JSON Lines to stdout")
+    export.add_argument("--format", choices=["jsonl", "json", "text"], default="jsonl")
+
+    create = commands.add_parser("create", help="add projects from JSON Lines records (as printed by list)")
+    create.add_argument("--from-jsonl", required=True, metavar="FILE", help="'-' reads stdin")
+    return parser
+
+
+def run_cli(argv=None):
+    """Run one non-interactive command and return its exit status (0 on success).
+
+    Every result is one JSON object per line on stdout. Messages from loading,
+    saving and rendering are sent to stderr, so the output can be piped
+    straight into another program.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "report" and args.search_type != "all" and args.search_value is None:
+        parser.error(f"report {args.search_type} needs a search value")
+    if args.command == "export" and args.filename == "-" and args.format != "jsonl":
+        parser.error("only --format jsonl can be written to stdout")
+
+    out = sys.stdout
+    with redirect_stdout(sys.stderr):
+        manager = open_manager(args.json, args.db, journal=args.command in _MUTATING_COMMANDS)
+        try:
+            return _COMMANDS[args.command](manager, args, out)
+        finally:
+            if manager.store is not None:
+                manager.close_sqlite()
+
+
+def _emit(out, record):
+    out.write(json.dumps(record, separators=(',', ':')) + "\n")
+
+
+def _save(manager, args):
+    # Same as leaving the menu; the SQLite store is already up to date
+    if manager.store is None and manager.dirty:
+        Project.write_project_to_file(f"{os.path.splitext(args.json)[0]}.txt")
+        manager.checkpoint()
+
+
+def _list_command(manager, args, out):
+    write_json_lines(out, (project.to_dict() for project in manager.iter_projects()))
+    return 0
+
+
+def _search_command(manager, args, out):
+    if args.name is not None:
+        matches = manager.search_by_name(args.name)
+    else:
+        search_type = next(field for field in ("category", "state", "active") if getattr(args, field) is not None)
+        try:
+            matches = manager.filter_projects(search_type, getattr(args, search_type))
+        except ValueError as e:
+            print(e)
+            return 1
+    write_json_lines(out, (project.to_dict() for project in matches))
+    return 0
+
+
+def _report_command(manager, args, out):
+    if args.search_type == "all":
+        jobs = write_all_text_reports(manager)
+    else:
+        jobs = write_text_report(manager, args.search_type, args.search_value)
+        if not jobs:
+            _emit(out, {'search_type': args.search_type, 'search_value': args.search_value,
+                        'report': None, 'charts': []})
+            return 1
+    paths = render_charts(jobs, args.workers, None if args.no_cache else ChartCache())
+
+    # Each report's three chart jobs share its filename base
+    reports = {}
+    for job, path in zip(jobs, paths):
+        reports.setdefault(job[3], []).append(path)
+    write_json_lines(out, ({'report': f"{base}.txt", 'charts': charts} for base, charts in reports.items()))
+    return 0
+
+
+def _import_command(manager, args, out):
+    results = manager.import_from_files(args.source, args.workers)
+    write_json_lines(out, ({'file': filename, 'count': count, 'seconds': round(seconds, 3), 'error': error}
+                           for filename, count, seconds, error in results))
+    _save(manager, args)
+    return 0 if results and all(error is None for *_, error in results) else 1
+
+
+def _export_command(manager, args, out):
+    records = (project.to_dict() for project in manager.iter_projects())
+    if args.filename == "-":
+        write_json_lines(out, records)
+        return 0
+    try:
+        if args.format == "text":
+            count = write_text_file(args.filename, manager.iter_projects())
+        else:
+            with atomic_write(args.filename, encoding='utf-8') as file:
+                if args.format == "jsonl":
+                    count = write_json_lines(file, records)
+                else:
+                    count = write_json_array(file, records, indent=2)
+    except OSError as e:
+        print(f"Error exporting projects: {e}")
+        return 1
+    _emit(out, {'file': args.filename, 'format': args.format, 'count': count})
+    return 0
+
+
+def _create_command(manager, args, out):
+    try:
+        source = nullcontext(sys.stdin) if args.from_jsonl == "-" else open(args.from_jsonl, encoding='utf-8')
+    except OSError as e:
+        print(f"Cannot read {args.from_jsonl}: {e}")
+        return 1
+
+    # The batch is checkpointed once at the end instead of journaling
+    # (and fsync'ing) every created project
+    journal, manager.journal = manager.journal, None
+    failed = 0
+    try:
+        with source as file:
+            for number, record, error in iter_json_lines(file):
+                if error is not None:
+                    errors = [error]
+                elif not isinstance(record, dict):
+                    errors = ["Expected a JSON object"]
+                else:
+                    errors = [row_error.message for row_error in validate_records([record]).errors]
+                if errors:
+                    failed += 1
+                    _emit(out, {'line': number, 'errors': errors})
+                    continue
+                project = EnhancedProject.from_dict(record)
+                manager.add_project(project)
+                _emit(out, {'line': number, 'name': project.get_name()})
+    finally:
+        manager.journal = journal
+    _save(manager, args)
+    return 1 if failed else 0
+
+
+# Commands that change the projects and so need the change journal
+_MUTATING_COMMANDS = ('import', 'create')
+
+_COMMANDS = {
+    'list': _list_command,
+    'search': _search_command,
+    'report': _report_command,
+    'import': _import_command,
+    'export': _export_command,
+    'create': _create_command,
+}
@@ -0,0 +1,178 @@
+import json
+import mmap
+import struct
+
+import numpy as np
+
+from .fileio import atomic_write
+from .models import EnhancedProject, EnhancedCurrentProject, EnhancedPastProject, Location, _intern
+from .table import ProjectTable
+
+MAGIC = b"ARENACOL"
+VERSION = 2
+
+# magic, version, length of the JSON column directory that follows
+_HEADER = struct.Struct("<8sHxxxxxxQ")
+_ALIGNMENT = 8
+
+_TYPES = [EnhancedProject, EnhancedCurrentProject, EnhancedPastProject]
+_TYPE_CODES = {cls.__name__: code for code, cls in enumerate(_TYPES)}
+
+_NUMERIC_COLUMNS = {
+    'category_codes': '<i4',
+    'state_codes': '<i4',
+    'years': '<i4',
+    'total_cost': '<f8',
+    'funding': '<f8',
+    'budget_cents': '<i8',
+    'types': '<u1',
+}
+_STRING_COLUMNS = ('name', 'city', 'budget', 'project_period')
+
+
+class ColumnarFormatError(Exception):
+    pass
+
+
+def write_columnar(filename, projects):
+    """Write projects as a columnar dataset file.
+
+    Layout: header, a JSON directory (row count, category/state
+    dictionaries and each column's offset from the start of the data
+    section), then the data section of 8-byte aligned columns. Numeric columns are fixed-width little-endian arrays; string
+    columns are a uint64 offsets array (count + 1 entries) plus a UTF-8 blob.
+    """
+    projects = list(projects)
+    table = ProjectTable.from_projects(projects)
+    columns = {
+        'category_codes': table.category_codes,
+        'state_codes': table.state_codes,
+        'years': table.years,
+        'total_cost': table.total_cost,
+        'funding': table.funding,
+        'budget_cents': table.budget_cents,
+        'types': np.array([_TYPE_CODES.get(type(p).__name__, 0) for p in projects], dtype=np.uint8),
+    }
+    payloads = [(name, np.ascontiguousarray(columns[name], dtype=dtype).tobytes())
+                for name, dtype in _NUMERIC_COLUMNS.items()]
+    for name in _STRING_COLUMNS:
+        encoded = [value.encode('utf-8') for value in _string_values(projects, name)]
+        offsets = np.zeros(len(encoded) + 1, dtype='<u8')
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        payloads.append((f"{name}.offsets", offsets.tobytes()))
+        payloads.append((f"{name}.data", b"".join(encoded)))
+
+    offsets = {}
+    position = 0
+    for name, payload in payloads:
+        offsets[name] = [position, len(payload)]
+        position = _align(position + len(payload))
+    directory = json.dumps({
+        'count': len(projects),
+        'categories': table.categories,
+        'states': table.states,
+        'columns': offsets,
+    }).encode('utf-8')
+    header = _HEADER.pack(MAGIC, VERSION, len(directory)) + directory
+
+    with atomic_write(filename, 'wb') as file:
+        file.write(header.ljust(_align(len(header)), b"\x00"))
+        for name, payload in payloads:
+            file.write(payload.ljust(_align(len(payload)), b"\x00"))
+    return len(projects)
+
+
+def open_columnar(filename):
+    """Memory-map a columnar dataset file and return a read-only ProjectTable.
+
+    The table's arrays are zero-copy views of the mapping, so processes that
+    open the same file share one copy in the page cache. Project objects are
+    only built for the rows a caller asks for (``get_projects``).
+    """
+    with open(filename, 'rb') as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mapping) < _HEADER.size:
+        raise ColumnarFormatError("Columnar file is truncated")
+    magic, version, directory_size = _HEADER.unpack_from(mapping)
+    if magic != MAGIC:
+        raise ColumnarFormatError("Not an ARENA columnar file")
+    if version != VERSION:
+        raise ColumnarFormatError(f"Unsupported columnar file version {version}")
+    directory = json.loads(mapping[_HEADER.size:_HEADER.size + directory_size])
+    data_start = _align(_HEADER.size + directory_size)
+
+    count = directory['count']
+    columns = {}
+    for name, (offset, size) in directory['columns'].items():
+        offset += data_start
+        if offset + size > len(mapping):
+            raise ColumnarFormatError("Columnar file is truncated")
+        if name in _NUMERIC_COLUMNS:
+            columns[name] = np.frombuffer(mapping, dtype=_NUMERIC_COLUMNS[name], count=count, offset=offset)
+        elif name.endswith('.offsets'):
+            columns[name] = np.frombuffer(mapping, dtype='<u8', count=count + 1, offset=offset)
+        else:
+            columns[name] = (offset, size)
+
+    rows = MappedRows(mapping, directory, columns)
+    return ProjectTable(
+        directory['categories'], columns['category_codes'],
+        directory['states'], columns['state_codes'],
+        columns['years'], columns['total_cost'], columns['funding'], columns['budget_cents'],
+        projects=rows,
+    )
+
+
+class MappedRows:
+    """Sequence that builds EnhancedProject objects from mapped columns on access"""
+
+    def __init__(self, mapping, directory, columns):
+        self.mapping = mapping
+        self.categories = [_intern(value) for value in directory['categories']]
+        self.states = [_intern(value) for value in directory['states']]
+        self.columns = columns
+        self.count = directory['count']
+
+    def __len__(self):
+        return self.count
+
+    def text(self, name, index):
+        offsets = self.columns[f"{name}.offsets"]
+        start = self.columns[f"{name}.data"][0]
+        return self.mapping[start + int(offsets[index]):start + int(offsets[index + 1])].decode('utf-8')
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        columns = self.columns
+        year = int(columns['years'][index])
+        location = Location(self.states[columns['state_codes'][index]], _intern(self.text('city', index)))
+        project = _TYPES[columns['types'][index]](
+            self.text('name', index),
+            self.categories[columns['category_codes'][index]],
+            _intern(str(year)) if year else None,
+            location,
+            self.text('budget', index),
+            self.text('project_period', index),
+        )
+        project.set_total_cost(float(columns['total_cost'][index]))
+        project.set_funding(float(columns['funding'][index]))
+        return project
+
+
+def _string_values(projects, name):
+    for project in projects:
+        if name == 'name':
+            value = project.get_name()
+        elif name == 'city':
+            location = project._get_location_obj()
+            value = location.get_city() if hasattr(location, 'get_city') else str(location)
+        elif name == 'budget':
+            value = project.get_budget() if hasattr(project, 'get_budget') else ''
+        else:
+            value = project.get_project_period() if hasattr(project, 'get_project_period') else ''
+        yield value or ''
+
+
+def _align(position):
+    return (position + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
@@ -0,0 +1,104 @@
+DIMENSIONS = ('category', 'state', 'year')
+
+
+class AggregateCube:
+    """Project counts and money sums by category, state and year.
+
+    Each cell, keyed by ``(category, state, year)``, holds ``[count,
+    total_cost_cents, funding_cents, budget_cents]``. Sums are integer
+    cents, so adding and removing projects as they are edited never
+    accumulates float error. Roll-ups, slices and the chart aggregations
+    walk the cells, costing O(groups) however many projects there are.
+    Projects must be removed before an edit and added back after it.
+    """
+
+    def __init__(self, projects=(), cells=None):
+        self.cells = {} if cells is None else cells
+        for project in projects:
+            self.add(project)
+
+    def __len__(self):
+        return sum(cell[0] for cell in self.cells.values())
+
+    def add(self, project):
+        self._apply(project, 1)
+
+    def remove(self, project):
+        self._apply(project, -1)
+
+    def _apply(self, project, sign):
+        key = _cell_key(project)
+        cell = self.cells.get(key)
+        if cell is None:
+            cell = self.cells[key] = [0, 0, 0, 0]
+        for i, value in enumerate(_measures(project)):
+            cell[i] += sign * value
+        if cell[0] == 0:
+            del self.cells[key]
+
+    def slice(self, category=None, state=None, year=None):
+        """A new cube holding only the cells that match every given value"""
+        wanted = [(i, value) for i, value in enumerate((category, state, year)) if value is not None]
+        return AggregateCube(cells={
+            key: list(cell) for key, cell in self.cells.items()
+            if all(key[i] == value for i, value in wanted)
+        })
+
+    def split(self, dimension):
+        """``{value: cube}`` with one slice per value of a dimension, in one pass"""
+        axis = DIMENSIONS.index(dimension)
+        slices = {}
+        for key, cell in self.cells.items():
+            slices.setdefault(key[axis], AggregateCube()).cells[key] = list(cell)
+        return slices
+
+    def rollup(self, *dimensions):
+        """Sum the cells over every dimension not named.
+
+        Returns ``{value: cell}`` for one dimension, ``{(value, ...): cell}``
+        for several, and the grand total cell when none are named.
+        """
+        axes = [DIMENSIONS.index(dimension) for dimension in dimensions]
+        totals = {}
+        for key, cell in self.cells.items():
+            group = tuple(key[axis] for axis in axes)
+            if len(group) == 1:
+                group = group[0]
+            total = totals.get(group)
+            if total is None:
+                totals[group] = list(cell)
+            else:
+                for i, value in enumerate(cell):
+                    total[i] += value
+        if not axes:
+            return totals.get((), [0, 0, 0, 0])
+        return totals
+
+    # Same interface as ProjectTable, so charts and report totals read the cube directly
+
+    def count_by_category(self):
+        return {category: cell[0] for category, cell in self.rollup('category').items()}
+
+    def funding_by_category(self):
+        return {category: cell[2] / 100 for category, cell in self.rollup('category').items()}
+
+    def count_by_year(self):
+        return {year: cell[0] for year, cell in self.rollup('year').items() if year is not None}
+
+    def total_cost_cents(self):
+        return self.rollup()[1]
+
+    def total_funding_cents(self):
+        return self.rollup()[2]
+
+    def total_budget_cents(self):
+        return self.rollup()[3]
+
+
+def _cell_key(project):
+    return project.get_category(), project._get_state_value(), project._get_year_started_value()
+
+
+def _measures(project):
+    budget = project.get_budget_cents() if hasattr(project, 'get_budget_cents') else None
+    return 1, project.get_total_cost_cents(), project.get_funding_cents(), budget or 0
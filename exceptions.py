@@ -1,5 +1,10 @@
 import re
-from datetime import datetime
+from datetime import date
+
+from .periods import split_period
+
+# $dollars[.hundredths] followed by k (thousands) or m (millions)
+BUDGET_PATTERN = re.compile(r'^\$(\d+)(?:\.(\d{2}))?([mk])$', re.IGNORECASE)
 
 
 class InvalidChoiceException(Exception):
@@ -95,15 +100,14 @@ class InvalidStatusException(Exception):
 class InvalidReportTypeException(Exception):
     @staticmethod
     def validate_type(type):
-        if type not in ["1", "2", "category", "state"]:
+        if type not in ["1", "2", "3", "4", "category", "state", "active", "all"]:
             raise InvalidReportTypeException(f"Invalid report type: {type}")
 
 
 class InvalidBudgetException(Exception):
     @staticmethod
     def validate_budget(budget_str):
-        pattern = r'^\$\d+(\.\d{2})?[mk]$'
-        if not re.match(pattern, budget_str, re.IGNORECASE):
+        if not BUDGET_PATTERN.match(budget_str):
             raise InvalidBudgetException(
                 f"Invalid budget format: {budget_str}. Use format like $4.81m or $500k"
             )
@@ -112,39 +116,21 @@ class InvalidBudgetException(Exception):
 class InvalidDateException(Exception):
     @staticmethod
     def validate_date_range(date_range):
-        # Pattern for date range: DD/MM/YYYY – DD/MM/YYYY (requires spaces around dash)
-        pattern = r'^\d{2}/\d{2}/\d{4}\s+[\u2013-]\s+\d{2}/\d{2}/\d{4}$'
-        if not re.match(pattern, date_range):
+        # DD/MM/YYYY – DD/MM/YYYY (either dash, spaces around it)
+        dates = split_period(date_range)
+        if dates is None:
             raise InvalidDateException(
                 f"Invalid date format: {date_range}. Use format: DD/MM/YYYY – DD/MM/YYYY"
             )
 
-        # Validate actual dates - handle both dash types
         try:
-            # Split on either type of dash
-            if '\u2013' in date_range:
-                dates = date_range.split('\u2013')
-            else:
-                dates = date_range.split('-')
-
-            start_date_str = dates[0].strip()
-            end_date_str = dates[1].strip()
-
-            # Validate date format more strictly
-            if not re.match(r'^\d{2}/\d{2}/\d{4}$', start_date_str) or not re.match(
-                r'^\d{2}/\d{2}/\d{4}$', end_date_str
-            ):
-                raise InvalidDateException(f"Invalid date format in: {date_range}")
-
-            start_date = datetime.strptime(start_date_str, '%d/%m/%Y')
-            end_date = datetime.strptime(end_date_str, '%d/%m/%Y')
-
-            if start_date >= end_date:
-                raise InvalidDateException("Start date must be before end date")
-
+            start_date, end_date = (date(year, month, day) for day, month, year in dates)
         except ValueError:
             raise InvalidDateException(f"Invalid date values in: {date_range}")
 
+        if start_date >= end_date:
+            raise InvalidDateException("Start date must be before end date")
+
 
 class InvalidStateAddressException(Exception):
     valid_states = [
@@ -0,0 +1,124 @@
+class IntervalIndex:
+    """Interval index over closed ``[start, end]`` integer intervals keyed by id.
+
+    Intervals live in centered interval trees arranged as a binary counter
+    (level i holds at most 2**i intervals): adding an interval merges full
+    levels into the next free one, so updates cost amortised O(log^2 n) and
+    never rebuild the whole index. A query walks each level's tree, which
+    is O(log^2 n + k) overall. Replaced or removed intervals stay in their
+    tree until the next merge and are skipped by queries.
+    """
+
+    def __init__(self, intervals=()):
+        self._current = {}   # key -> its live (start, end, key) entry
+        for key, start, end in intervals:
+            self._current[key] = (start, end, key)
+        self._dead = 0
+        self._place(list(self._current.values()))
+
+    def __len__(self):
+        return len(self._current)
+
+    def get(self, key):
+        entry = self._current.get(key)
+        return None if entry is None else entry[:2]
+
+    def add(self, key, start, end):
+        """Add an interval, replacing any existing one with the same key"""
+        if key in self._current:
+            self._dead += 1
+        entry = self._current[key] = (start, end, key)
+        if self._dead > max(64, len(self._current)):
+            self._place(list(self._current.values()))
+            return
+
+        carry = [entry]
+        levels = self._levels
+        i = 0
+        while True:
+            if i == len(levels):
+                levels.append(None)
+            if levels[i] is None and len(carry) <= 1 << i:
+                levels[i] = _build_level(carry)
+                return
+            if levels[i] is not None:
+                carry.extend(self._live(levels[i][1]))
+                levels[i] = None
+            i += 1
+
+    def remove(self, key):
+        if self._current.pop(key, None) is not None:
+            self._dead += 1
+            if self._dead > max(64, len(self._current)):
+                self._place(list(self._current.values()))
+
+    def overlapping(self, start, end=None):
+        """Sorted keys of intervals that share at least one point with [start, end].
+
+        With only ``start``, the keys of intervals containing that point.
+        """
+        if end is None:
+            end = start
+        current = self._current
+        keys = []
+        stack = [level[0] for level in self._levels if level is not None]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            center, by_start, by_end, left, right = node
+            if end < center:
+                # Every interval here contains center, so it only has to start in time
+                for entry in by_start:
+                    if entry[0] > end:
+                        break
+                    if current.get(entry[2]) is entry:
+                        keys.append(entry[2])
+                stack.append(left)
+            elif start > center:
+                for entry in by_end:
+                    if entry[1] < start:
+                        break
+                    if current.get(entry[2]) is entry:
+                        keys.append(entry[2])
+                stack.append(right)
+            else:
+                keys.extend(entry[2] for entry in by_start if current.get(entry[2]) is entry)
+                stack.append(left)
+                stack.append(right)
+        keys.sort()
+        return keys
+
+    def _live(self, entries):
+        live = [entry for entry in entries if self._current.get(entry[2]) is entry]
+        self._dead -= len(entries) - len(live)
+        return live
+
+    def _place(self, entries):
+        # Put every entry into one level large enough to hold them
+        self._dead = 0
+        self._levels = [None] * max(1, (len(entries) - 1).bit_length() + 1)
+        if entries:
+            self._levels[-1] = _build_level(entries)
+
+
+def _build_level(entries):
+    entries = sorted(entries)
+    return _build_node(entries), entries
+
+
+def _build_node(entries):
+    """Build a centered subtree from (start, end, key) entries sorted by start"""
+    if not entries:
+        return None
+    center = entries[len(entries) // 2][0]
+    left, here, right = [], [], []
+    for entry in entries:
+        if entry[1] < center:
+            left.append(entry)
+        elif entry[0] > center:
+            right.append(entry)
+        else:
+            here.append(entry)
+    by_end = sorted(here, key=lambda entry: entry[1], reverse=True)
+    return center, here, by_end, _build_node(left), _build_node(right)
@@ -0,0 +1,82 @@
+import json
+import os
+
+from .fileio import atomic_write
+
+
+class ChangeJournal:
+    """Append-only log of project create/edit operations, one JSON object per line.
+
+    The first line records which snapshot the journal applies to (see
+    ``file_stamp``), so entries already folded into a newer snapshot are
+    never replayed twice. Each entry is flushed and fsync'ed before
+    ``append`` returns, and a torn final line left by a crash is dropped.
+    """
+
+    def __init__(self, filename="ARENA_projects.journal"):
+        self.filename = filename
+        self.snapshot_stamp = None
+        self._started = False
+        self._count = self._recover()
+
+    def __len__(self):
+        return self._count
+
+    def _recover(self):
+        """Read the header, count complete entries and cut off a torn final line"""
+        count = end = 0
+        try:
+            with open(self.filename, 'rb+') as file:
+                for line in file:
+                    if not line.endswith(b"\n"):
+                        break
+                    if end == 0:
+                        self.snapshot_stamp = json.loads(line).get('snapshot')
+                        self._started = True
+                    else:
+                        count += 1
+                    end += len(line)
+                file.truncate(end)
+        except FileNotFoundError:
+            pass
+        return count
+
+    def is_started(self):
+        return self._started
+
+    def start(self, snapshot_stamp):
+        """Replace the journal with an empty one for the given snapshot"""
+        with atomic_write(self.filename, encoding='utf-8') as file:
+            file.write(json.dumps({'op': 'begin', 'snapshot': snapshot_stamp}) + "\n")
+        self.snapshot_stamp = snapshot_stamp
+        self._started = True
+        self._count = 0
+
+    def append(self, entry):
+        line = json.dumps(entry, separators=(',', ':')) + "\n"
+        with open(self.filename, 'a', encoding='utf-8') as file:
+            file.write(line)
+            file.flush()
+            os.fsync(file.fileno())
+        self._count += 1
+
+    def entries(self):
+        """Yield the journaled entries in the order they were appended"""
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as file:
+                next(file, None)  # header
+                for line in file:
+                    if not line.endswith("\n"):
+                        break
+                    yield json.loads(line)
+        except FileNotFoundError:
+            return
+
+
+def file_stamp(filename):
+    """Identify one version of a snapshot file by its size and modification time"""
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
@@ -0,0 +1,154 @@
+import json
+
+_WHITESPACE = ' \t\n\r'
+
+
+def iter_json_array(file, chunk_size=1 << 16):
+    """Yield the elements of a top-level JSON array one at a time.
+
+    The file is read in ``chunk_size`` pieces and each element is decoded as
+    soon as it is complete, so memory is bounded by the largest single
+    element rather than the whole document.
+    """
+    decoder = json.JSONDecoder()
+    reader = _ChunkReader(file, chunk_size)
+
+    if reader.next_char() != '[':
+        raise json.JSONDecodeError("Expecting '['", reader.buffer, reader.pos)
+    reader.pos += 1
+
+    if reader.next_char() == ']':
+        return
+    while True:
+        yield reader.decode(decoder)
+        char = reader.next_char()
+        if char == ']':
+            return
+        if char != ',':
+            raise json.JSONDecodeError("Expecting ',' delimiter", reader.buffer, reader.pos)
+        reader.pos += 1
+        reader.next_char()
+
+
+class _ChunkReader:
+    def __init__(self, file, chunk_size):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop what has already been consumed before growing the buffer
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def next_char(self):
+        """Skip whitespace and return the next character ('' at end of input)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def decode(self, decoder):
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof or not self._fill():
+                    raise
+                continue
+            # An array element is followed by ',' or ']'. Anything else, or nothing
+            # yet, means a number may have been cut at the chunk edge (e.g. "1.|25"),
+            # so read more and decode it again
+            follow = end
+            while follow < len(self.buffer) and self.buffer[follow] in _WHITESPACE:
+                follow += 1
+            if (follow == len(self.buffer) or self.buffer[follow] not in ',]') and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def write_json_array(file, items, indent=None, chunk_size=1000):
+    """Serialise ``items`` as a JSON array, writing ``chunk_size`` elements at a time.
+
+    With ``indent`` the output is identical to ``json.dump(list(items), file,
+    indent=indent)``; without it the array is written compactly. ``items`` may
+    be any iterable, so the full list never has to be built. Returns the
+    number of elements written.
+    """
+    if indent is None:
+        encode = json.JSONEncoder(separators=(',', ':')).encode
+        opening, separator, closing = '[', ',', ']'
+    else:
+        encode = _indented_encoder(indent)
+        opening, separator, closing = '[\n', ',\n', '\n]'
+
+    chunk = []
+    count = 0
+    for item in items:
+        chunk.append(encode(item))
+        count += 1
+        if len(chunk) >= chunk_size:
+            file.write((opening if count == len(chunk) else separator) + separator.join(chunk))
+            chunk = []
+    if count == 0:
+        file.write('[]')
+        return 0
+    if chunk:
+        file.write((opening if count == len(chunk) else separator) + separator.join(chunk))
+    file.write(closing)
+    return count
+
+
+def write_json_lines(file, items, chunk_size=1000):
+    """Write ``items`` as JSON Lines, one compact value per line, ``chunk_size`` at a time.
+
+    Returns the number of values written.
+    """
+    encode = json.JSONEncoder(separators=(',', ':')).encode
+    chunk = []
+    count = 0
+    for item in items:
+        chunk.append(encode(item) + '\n')
+        count += 1
+        if len(chunk) >= chunk_size:
+            file.write(''.join(chunk))
+            chunk = []
+    file.write(''.join(chunk))
+    return count
+
+
+def iter_json_lines(file):
+    """Yield ``(line_number, value, error)`` for each non-blank line of a JSON Lines stream.
+
+    A line that is not valid JSON gives value None and the decoder's message
+    as ``error``, so one bad line does not stop the rest of the stream.
+    """
+    for number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            yield number, json.loads(line), None
+        except json.JSONDecodeError as e:
+            yield number, None, str(e)
+
+
+def _indented_encoder(indent):
+    encode = json.JSONEncoder(indent=indent).encode
+    prefix = ' ' * indent
+
+    def encode_element(item):
+        # Nest each element one level inside the array, as json.dump does
+        return prefix + encode(item).replace('\n', '\n' + prefix)
+
+    return encode_element
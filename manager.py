@@ -1,6 +1,28 @@
-import json
+import os
+import sqlite3
 
-from .models import Project, EnhancedProject
+from .columnar import open_columnar, write_columnar
+from .cube import AggregateCube
+from .fileio import atomic_write
+from .intervals import IntervalIndex
+from .journal import ChangeJournal, file_stamp
+from .jsonstream import iter_json_array, write_json_array
+from .models import Project, EnhancedProject, Location
+from .periods import parse_window
+from .snapshot import read_snapshot, write_snapshot
+from .sqlite_store import SQLiteProjectStore
+from .table import ProjectTable
+from .textio import find_text_files, parse_text_file, parse_text_files
+
+# Journal edit attribute -> ProjectManager method that applies it
+_EDITORS = {
+    'name': 'rename_project',
+    'category': 'set_category',
+    'year_started': 'set_year_started',
+    'location': 'set_location',
+    'budget': 'set_budget',
+    'project_period': 'set_project_period',
+}
 
 
 class ProjectManager:
@@ -9,19 +31,318 @@ class ProjectManager:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(ProjectManager, cls).__new__(cls)
+            cls._instance._name_index = {}
+            cls._instance._category_index = {}
+            cls._instance._state_index = {}
+            cls._instance._ids = {}
+            cls._instance._period_index = None
+            cls._instance.cube = AggregateCube()
+            cls._instance.table = None
+            cls._instance.journal = None
+            cls._instance.snapshot_filename = "ARENA_projects.JSON"
+            cls._instance.compact_every = 1000
+            cls._instance.dirty = False
+            cls._instance._replaying = False
+            cls._instance.store = None
+            cls._instance.write_snapshots = False
             cls._instance.projects = []
         return cls._instance
 
-    def load_from_json(self, filename="ARENA_projects.JSON"):
-        """Load projects from JSON file"""
+    @property
+    def projects(self):
+        return self._projects
+
+    @projects.setter
+    def projects(self, projects):
+        # Replacing the whole list (load/import/tests) rebuilds every index
+        self._projects = projects
+        self._rebuild_indexes()
+        if self.journal is not None and not self._replaying:
+            # Journaled ids are positions in the old list, so start over from a snapshot of the new one
+            self.checkpoint()
+
+    def _rebuild_indexes(self):
+        self._name_index = {}
+        self._category_index = {}
+        self._state_index = {}
+        self._ids = {}
+        self._period_index = None  # rebuilt on the next period query
+        self.cube = AggregateCube()
+        for project_id, project in enumerate(self._projects):
+            self._index_project(project_id, project)
+
+    def _index_project(self, project_id, project):
+        # Ids are positions in self.projects; projects are only ever appended
+        self._ids[id(project)] = project_id
+        self._name_index.setdefault(project.get_name(), []).append(project)
+        self._category_index.setdefault(project.get_category(), set()).add(project_id)
+        self._state_index.setdefault(project._get_state_value(), set()).add(project_id)
+        self.cube.add(project)
+        if self._period_index is not None:
+            period = _period_of(project)
+            if period is not None:
+                self._period_index.add(project_id, *period)
+
+    def add_project(self, project):
+        """Append a project and keep the indexes up to date"""
+        if self.store is not None:
+            self.store.insert(project)
+            return
+        self._projects.append(project)
+        self._index_project(len(self._projects) - 1, project)
+        Project.projects = self._projects
+        self._record('create', project=project)
+
+    def get_id(self, project):
+        """Return the id (position) of a managed project"""
+        return self._ids[id(project)]
+
+    def set_category(self, project, category):
+        """Change a project's category and move it in the category index"""
+        if self.store is not None:
+            return self._store_edit(project, 'category', category, project.set_category)
+        project_id = self.get_id(project)
+        _move(self._category_index, project.get_category(), category, project_id)
+        self._edit_cell(project, project.set_category, category)
+        self._record_edit(project_id, 'category', category)
+
+    def set_location(self, project, location):
+        """Change a project's location and move it in the state index"""
+        if self.store is not None:
+            return self._store_edit(project, 'location', location, project.set_location)
+        project_id = self.get_id(project)
+        old_state = project._get_state_value()
+        self._edit_cell(project, project.set_location, location)
+        _move(self._state_index, old_state, project._get_state_value(), project_id)
+        self._record_edit(project_id, 'location', str(location))
+
+    def set_year_started(self, project, year):
+        if self.store is not None:
+            return self._store_edit(project, 'year_started', year, project.set_year_started)
+        self._edit_cell(project, project.set_year_started, year)
+        self._record_edit(self.get_id(project), 'year_started', year)
+
+    def set_budget(self, project, budget):
+        """Validate and set a budget (raises InvalidBudgetException)"""
+        if self.store is not None:
+            return self._store_edit(project, 'budget', budget, project.set_budget)
+        self._edit_cell(project, project.set_budget, budget)
+        self._record_edit(self.get_id(project), 'budget', budget)
+
+    def _edit_cell(self, project, setter, value):
+        # Move the project to the aggregate cube cell it belongs to after the edit
+        self.cube.remove(project)
         try:
-            with open(filename, 'r') as file:
-                data = json.load(file)
-                self.projects = []
-                for project_data in data:
-                    project = EnhancedProject.from_dict(project_data)
-                    self.projects.append(project)
-                Project.projects = self.projects
+            setter(value)
+        finally:
+            self.cube.add(project)
+
+    def set_project_period(self, project, period):
+        """Validate and set a project period (raises InvalidDateException)"""
+        if self.store is not None:
+            return self._store_edit(project, 'project_period', period, project.set_project_period)
+        project.set_project_period(period)
+        project_id = self.get_id(project)
+        if self._period_index is not None:
+            self._period_index.add(project_id, *project.get_period_ordinals())
+        self._record_edit(project_id, 'project_period', period)
+
+    def ids_for_category(self, category):
+        return sorted(self._category_index.get(category, ()))
+
+    def ids_for_state(self, state):
+        return sorted(self._state_index.get(state, ()))
+
+    def ids_active_between(self, start, end=None):
+        """Ids of projects whose period overlaps [start, end] (day ordinals), in order"""
+        if self._period_index is None:
+            self._period_index = IntervalIndex(
+                (project_id, *period) for project_id, period in
+                enumerate(map(_period_of, self._projects)) if period is not None
+            )
+        return self._period_index.overlapping(start, end)
+
+    def projects_active_between(self, start, end=None):
+        """Projects running at any point in [start, end], or on ``start`` alone.
+
+        ``start`` and ``end`` are day ordinals (see periods.parse_period).
+        """
+        if end is None:
+            end = start
+        if self.store is not None:
+            # The store has no period columns; check each row's parsed period
+            return [project for project in self.store.iter_projects()
+                    if _overlaps(_period_of(project), start, end)]
+        return [self._projects[project_id] for project_id in self.ids_active_between(start, end)]
+
+    def filter_projects(self, search_type, search_value):
+        """Return projects matching a category, exact state or active date via the indexes.
+
+        For ``"active"`` the value is a DD/MM/YYYY date or a period (ValueError
+        if it is neither).
+        """
+        if search_type == "active":
+            return self.projects_active_between(*parse_window(search_value))
+        if self.store is not None:
+            return self.store.filter_projects(search_type, search_value)
+        if search_type == "category":
+            ids = self.ids_for_category(search_value)
+        else:  # state
+            ids = self.ids_for_state(search_value)
+        return [self._projects[project_id] for project_id in ids]
+
+    def search_by_name(self, name):
+        """Return every project with exactly this name (empty list if none)"""
+        if self.store is not None:
+            return self.store.search_by_name(name)
+        return list(self._name_index.get(name, ()))
+
+    def rename_project(self, project, new_name):
+        """Rename a project and move it to its new name bucket"""
+        if self.store is not None:
+            return self._store_edit(project, 'name', new_name, project.set_name)
+        old_name = project.get_name()
+        bucket = self._name_index.get(old_name, [])
+        if project in bucket:
+            bucket.remove(project)
+            if not bucket:
+                del self._name_index[old_name]
+        project.set_name(new_name)
+        self._name_index.setdefault(new_name, []).append(project)
+        self._record_edit(self.get_id(project), 'name', new_name)
+
+    def open_sqlite(self, filename="ARENA_projects.db"):
+        """Back the manager with an SQLite database.
+
+        Searches, report filters, chart aggregations and edits then run as SQL
+        against the database instead of the in-memory list. An empty database
+        is seeded with the currently loaded projects.
+        """
+        self.store = SQLiteProjectStore(filename)
+        if not len(self.store) and self._projects:
+            self.store.insert_many(self._projects)
+        return self.store
+
+    def close_sqlite(self):
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
+    def iter_projects(self):
+        """Iterate over every project, from the database when one is open"""
+        if self.store is not None:
+            return self.store.iter_projects()
+        return iter(self._projects)
+
+    def _store_edit(self, project, attribute, value, setter):
+        # Find the row, then let the setter validate; the row is only updated if it accepts the value
+        self.store.row_id(project)
+        setter(value)
+        self.store.update(project, attribute, value)
+
+    def _record_edit(self, project_id, attribute, value):
+        self._record('edit', id=project_id, attribute=attribute, value=value)
+
+    def _record(self, op, **fields):
+        self.dirty = True
+        if self.journal is None or self._replaying:
+            return
+        if op == 'create':
+            fields['project'] = fields['project'].to_dict()
+        self.journal.append({'op': op, **fields})
+        if len(self.journal) >= self.compact_every:
+            self.checkpoint()
+
+    def open_journal(self, filename="ARENA_projects.journal", snapshot_filename="ARENA_projects.JSON",
+                     compact_every=1000):
+        """Start journaling changes, first replaying any left over from the last session.
+
+        Returns the number of replayed entries. A journal written against an
+        older snapshot (its changes were already compacted) is discarded.
+        """
+        self.journal = ChangeJournal(filename)
+        self.snapshot_filename = snapshot_filename
+        self.compact_every = compact_every
+        replayed = 0
+        if self.journal.is_started() and self.journal.snapshot_stamp == file_stamp(snapshot_filename):
+            replayed = self.replay_journal()
+        else:
+            self.journal.start(file_stamp(snapshot_filename))
+        return replayed
+
+    def replay_journal(self):
+        """Apply the journaled operations on top of the loaded snapshot"""
+        self._replaying = True
+        replayed = 0
+        try:
+            for entry in self.journal.entries():
+                if entry['op'] == 'create':
+                    self.add_project(EnhancedProject.from_dict(entry['project']))
+                elif not 0 <= entry['id'] < len(self._projects):
+                    print(f"Skipping journal entry for unknown project id {entry['id']}.")
+                    continue
+                else:
+                    project = self._projects[entry['id']]
+                    value = entry['value']
+                    if entry['attribute'] == 'location':
+                        value = Location.from_string(value)
+                    getattr(self, _EDITORS[entry['attribute']])(project, value)
+                replayed += 1
+        finally:
+            self._replaying = False
+        return replayed
+
+    def checkpoint(self):
+        """Write a full snapshot atomically and start a fresh journal against it"""
+        if not self.save_to_json(self.snapshot_filename, write_snapshot=self.write_snapshots):
+            return False
+        if self.journal is not None:
+            self.journal.start(file_stamp(self.snapshot_filename))
+        self.dirty = False
+        return True
+
+    def build_table(self):
+        """Build the columnar ProjectTable for the current projects"""
+        self.table = ProjectTable.from_projects(self.projects)
+        return self.table
+
+    def save_columnar(self, filename="ARENA_projects.columns"):
+        """Save projects as a memory-mappable columnar dataset file"""
+        try:
+            write_columnar(filename, self.projects)
+            print(f"Columnar dataset successfully saved to {filename}")
+            return True
+        except Exception as e:
+            print(f"Error saving columnar dataset: {e}")
+            return False
+
+    def open_columnar(self, filename="ARENA_projects.columns"):
+        """Memory-map a columnar dataset as the (read-only) ProjectTable.
+
+        Nothing is loaded into Python objects up front; pass manager.table to
+        generate_summary_report or VisualizationDecorator to aggregate over it.
+        """
+        self.table = open_columnar(filename)
+        return self.table
+
+    def load_from_json(self, filename="ARENA_projects.JSON", build_table=False, prefer_snapshot=False):
+        """Load projects from JSON file, optionally building the ProjectTable.
+
+        With prefer_snapshot, the binary snapshot written alongside the JSON
+        is loaded instead when it is at least as new as the JSON file.
+        """
+        if prefer_snapshot and _is_newer(snapshot_path(filename), filename):
+            if self.load_snapshot(snapshot_path(filename)):
+                if build_table:
+                    self.build_table()
+                return True
+        try:
+            # Only swap the list in once every record has parsed successfully
+            self.projects = list(self.iter_from_json(filename))
+            Project.projects = self.projects
+            self.dirty = False
+            if build_table:
+                self.build_table()
             print(f"Projects successfully loaded from {filename}")
             return True
         except FileNotFoundError:
@@ -31,30 +352,149 @@ class ProjectManager:
             print(f"Error loading from JSON: {e}")
             return False
 
-    def save_to_json(self, filename="ARENA_projects.JSON"):
-        """Save projects to JSON file"""
+    def iter_from_json(self, filename="ARENA_projects.JSON"):
+        """Yield projects from a JSON file, decoding one record at a time"""
+        with open(filename, 'r') as file:
+            for project_data in iter_json_array(file):
+                yield EnhancedProject.from_dict(project_data)
+
+    def save_to_json(self, filename="ARENA_projects.JSON", compact=False, write_snapshot=False):
+        """Save projects to JSON file, streaming records in chunks (compact drops indentation).
+
+        The file is replaced atomically, so a crash mid-save keeps the previous
+        version. With write_snapshot a binary snapshot is saved next to it.
+        """
         try:
-            data = [project.to_dict() for project in self.projects]
-            with open(filename, 'w') as file:
-                json.dump(data, file, indent=2)
+            records = (project.to_dict() for project in self.projects)
+            with atomic_write(filename) as file:
+                write_json_array(file, records, indent=None if compact else 2)
             print(f"Projects successfully saved to {filename}")
         except Exception as e:
             print(f"Error saving to JSON: {e}")
+            return False
+        if write_snapshot:
+            # Written after the JSON so it is never older than the file it mirrors
+            self.save_snapshot(snapshot_path(filename))
+        return True
 
-    def import_from_text(self, filename="ARENA_projects.txt"):
-        """Import projects from text file and convert to enhanced projects"""
-        Project.load_projects_from_file(filename)
-        enhanced_projects = []
-        for project in Project.projects:
-            enhanced_project = EnhancedProject(
-                project.get_name(),
-                project.get_category(),
-                project._get_year_started_value(),
-                project._get_location_obj(),
-            )
-            enhanced_project.set_total_cost(project._get_total_cost_value())
-            enhanced_project.set_funding(project._get_funding_value())
-            enhanced_projects.append(enhanced_project)
+    def save_snapshot(self, filename="ARENA_projects.snapshot"):
+        """Save projects in the binary snapshot format"""
+        try:
+            with atomic_write(filename, 'wb') as file:
+                write_snapshot(file, self.projects)
+            print(f"Snapshot successfully saved to {filename}")
+            return True
+        except Exception as e:
+            print(f"Error saving snapshot: {e}")
+            return False
+
+    def load_snapshot(self, filename="ARENA_projects.snapshot"):
+        """Load projects from a binary snapshot"""
+        try:
+            with open(filename, 'rb') as file:
+                self.projects = read_snapshot(file)
+            Project.projects = self.projects
+            self.dirty = False
+            print(f"Projects successfully loaded from {filename}")
+            return True
+        except FileNotFoundError:
+            print(f"Snapshot file {filename} not found.")
+            return False
+        except Exception as e:
+            print(f"Error loading snapshot: {e}")
+            return False
+
+    def import_from_text(self, filename="ARENA_projects.txt", workers=None):
+        """Import projects from text file as enhanced projects.
+
+        With workers > 1, large files are split at record boundaries and
+        parsed in a process pool.
+        """
+        try:
+            enhanced_projects = parse_text_file(filename, EnhancedProject, workers)
+        except FileNotFoundError:
+            print(f"File {filename} not found.")
+            return
+        except Exception as e:
+            print(f"An error occurred while loading projects: {e}")
+            return
+        if self.store is not None:
+            try:
+                self.store.replace_all(enhanced_projects)
+            except sqlite3.Error as e:
+                print(f"Could not store the projects from {filename}: {e}")
+                return
+        print(f"Projects successfully loaded from {filename}")
 
         self.projects = enhanced_projects
         Project.projects = self.projects
+        if self.store is None:
+            self.dirty = True
+
+    def import_from_files(self, source, workers=None):
+        """Add the projects from every text export in a directory or glob.
+
+        Files are parsed in a process pool and appended in sorted filename
+        order, so the result does not depend on which worker finishes first.
+        A file that fails is reported and skipped. Returns one
+        ``(filename, count, seconds, error)`` tuple per file.
+        """
+        filenames = find_text_files(source)
+        if not filenames:
+            print(f"No text files found for {source}.")
+            return []
+
+        report = []
+        imported = []
+        for filename, projects, seconds, error in parse_text_files(filenames, EnhancedProject, workers):
+            if error is None:
+                print(f"  {filename}: {len(projects)} project(s) in {seconds:.3f}s")
+                imported.extend(projects)
+                report.append((filename, len(projects), seconds, None))
+            else:
+                print(f"  {filename}: failed after {seconds:.3f}s: {error}")
+                report.append((filename, 0, seconds, error))
+        loaded = sum(1 for entry in report if entry[3] is None)
+        print(f"Imported {len(imported)} project(s) from {loaded} of {len(filenames)} file(s).")
+
+        if self.store is not None:
+            self.store.insert_many(imported)
+        elif imported:
+            for project in imported:
+                self._projects.append(project)
+                self._index_project(len(self._projects) - 1, project)
+            Project.projects = self._projects
+            self.dirty = True
+            if self.journal is not None:
+                # One snapshot for the batch, so later edits of these projects replay by id
+                self.checkpoint()
+        return report
+
+
+def _period_of(project):
+    return project.get_period_ordinals() if hasattr(project, 'get_period_ordinals') else None
+
+
+def _overlaps(period, start, end):
+    return period is not None and period[0] <= end and period[1] >= start
+
+
+def _move(index, old_key, new_key, project_id):
+    ids = index.get(old_key)
+    if ids is not None:
+        ids.discard(project_id)
+        if not ids:
+            del index[old_key]
+    index.setdefault(new_key, set()).add(project_id)
+
+
+def snapshot_path(json_filename):
+    """Binary snapshot kept alongside a JSON file (ARENA_projects.JSON -> ARENA_projects.snapshot)"""
+    return os.path.splitext(json_filename)[0] + ".snapshot"
+
+
+def _is_newer(filename, other):
+    try:
+        return os.stat(filename).st_mtime_ns >= os.stat(other).st_mtime_ns
+    except FileNotFoundError:
+        return os.path.exists(filename)
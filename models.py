@@ -1,17 +1,29 @@
+import sys
 from typing import List
 
 from .exceptions import InvalidBudgetException, InvalidDateException
+from .money import parse_budget_cents, to_cents
+from .periods import parse_period
+from .textio import iter_projects, write_text_file
+
+
+def _intern(value):
+    """Intern repeated strings (category, state, city, year) while loading"""
+    return sys.intern(value) if type(value) is str else value
 
 
 class Project:
     projects: List["Project"] = []
+    # Private names in __slots__ are mangled like attributes (_Project__name, ...)
+    __slots__ = ('__name', '__category', '__year_started', '__location',
+                 '__organization', '__total_cost', '__funding')
 
     def __init__(self, name: str, category: str, year_started: str, location):
         self.__name = name
         self.__category = category
         self.__year_started = year_started
         self.__location = location
-        self.__organization = []
+        self.__organization = None  # created on first add_organization
         self.__total_cost = 0
         self.__funding = 0
 
@@ -47,10 +59,7 @@ class Project:
     @staticmethod
     def write_project_to_file(filename):
         try:
-            with open(filename, 'w') as file:
-                for project in Project.projects:
-                    file.write(str(project))
-                    file.write("\n")
+            write_text_file(filename, Project.projects)
             print(f"Projects have been successfully written to {filename}")
         except IOError as e:
             print(f"An I/O error occurred: {e}")
@@ -58,81 +67,48 @@ class Project:
     @staticmethod
     def load_projects_from_file(filename):
         try:
-            with open(filename, 'r') as file:
-                project_data = {}
-                for line in file:
-                    line = line.strip()
-                    if line:
-                        if line.startswith("Project info"):
-                            continue  # skip the header
-                        if ": " in line:
-                            key, value = line.split(": ", 1)
-                            project_data[key.strip().rstrip(',')] = value.strip().rstrip(',')
-                    else:
-                        if project_data:
-                            # Create location object
-                            location_str = project_data.get('Location', '')
-                            if ', ' in location_str:
-                                city, state = location_str.split(', ', 1)
-                                location = Location(state, city)
-                            else:
-                                location = Location("Unknown", location_str)
-
-                            project = Project(
-                                project_data.get('Name'),
-                                project_data.get('Category'),
-                                project_data.get('Year Started'),
-                                location
-                            )
-                            # Handle funding/cost
-                            if 'Funding' in project_data:
-                                try:
-                                    project.set_funding(float(project_data['Funding']))
-                                except ValueError:
-                                    pass
-                            if 'Total Cost' in project_data:
-                                try:
-                                    project.set_total_cost(float(project_data['Total Cost']))
-                                except ValueError:
-                                    pass
-                            Project.projects.append(project)
-                            project_data = {}
-
-                # Add last project if file doesn't end with a blank line
-                if project_data:
-                    location_str = project_data.get('Location', '')
-                    if ', ' in location_str:
-                        city, state = location_str.split(', ', 1)
-                        location = Location(state, city)
-                    else:
-                        location = Location("Unknown", location_str)
-
-                    project = Project(
-                        project_data.get('Name'),
-                        project_data.get('Category'),
-                        project_data.get('Year Started'),
-                        location
-                    )
-                    if 'Funding' in project_data:
-                        try:
-                            project.set_funding(float(project_data['Funding']))
-                        except ValueError:
-                            pass
-                    if 'Total Cost' in project_data:
-                        try:
-                            project.set_total_cost(float(project_data['Total Cost']))
-                        except ValueError:
-                            pass
-                    Project.projects.append(project)
+            Project.projects.extend(iter_projects(filename, Project))
             print(f"Projects successfully loaded from {filename}")
         except FileNotFoundError:
             print(f"File {filename} not found.")
         except Exception as e:
             print(f"An error occurred while loading projects: {e}")
 
+    @classmethod
+    def from_record(cls, record):
+        """Create a project from a text-export record (see textio.iter_records)"""
+        location_str = record.get('Location', '')
+        if ', ' in location_str:
+            city, state = location_str.split(', ', 1)
+            location = Location(_intern(state), _intern(city))
+        else:
+            location = Location("Unknown", _intern(location_str))
+
+        project = cls(
+            record.get('Name'),
+            _intern(record.get('Category')),
+            _intern(record.get('Year Started')),
+            location
+        )
+        # Handle funding/cost
+        if 'Funding' in record:
+            try:
+                project.set_funding(float(record['Funding']))
+            except ValueError:
+                pass
+        if 'Total Cost' in record:
+            try:
+                project.set_total_cost(float(record['Total Cost']))
+            except ValueError:
+                pass
+        return project
+
     def get_name(self):
         return self.__name
 
+    def set_name(self, name):
+        self.__name = name
+
     def get_category(self):
         return self.__category
 
@@ -163,7 +139,15 @@ class Project:
     def get_funding(self):
         return f"Funding: {self.__funding}"
 
+    def get_total_cost_cents(self):
+        return to_cents(self.__total_cost)
+
+    def get_funding_cents(self):
+        return to_cents(self.__funding)
+
     def add_organization(self, organization):
+        if self.__organization is None:
+            self.__organization = []
         self.__organization.append(organization)
 
     # Internal helpers for derived classes/utilities (avoid name-mangling from outside)
@@ -179,20 +163,26 @@ class Project:
     def _get_location_obj(self):
         return self.__location
 
+    def _get_state_value(self) -> str:
+        location = self.__location
+        return location.get_state() if hasattr(location, 'get_state') else "Unknown"
+
 
 class CurrentProject(Project):
-    def __init__(self, name: str, category: str, year_started: str, location):
-        super().__init__(name, category, year_started, location)
-        self.__status = "Current"
+    # Status is fixed per class, so it lives on the class rather than in a slot.
+    # Empty slots here keep the Enhanced* multiple inheritance layout-compatible.
+    __slots__ = ()
+    __status = "Current"
 
 
 class PastProject(Project):
-    def __init__(self, name: str, category: str, year_started: str, location):
-        super().__init__(name, category, year_started, location)
-        self.__status = "Past"
+    __slots__ = ()
+    __status = "Past"
 
 
 class Location:
+    __slots__ = ('__state', '__city')
+
     def __init__(self, state, city):
         self.__state = state
         self.__city = city
@@ -200,22 +190,40 @@ class Location:
     def __str__(self):
         return f"{self.__city}, {self.__state}"
 
+    @classmethod
+    def from_string(cls, text):
+        """Parse a "City, State" string as written by __str__"""
+        location_parts = text.split(', ')
+        if len(location_parts) >= 2:
+            return cls(_intern(location_parts[1]), _intern(location_parts[0]))
+        return cls("Unknown", _intern(text))
+
     def get_state(self):
         return self.__state
 
+    def get_city(self):
+        return self.__city
+
 
 class Organization:
+    __slots__ = ('__name', '__involved_projects')
+
     def __init__(self, name):
         self.__name = name
         self.__involved_projects = []
 
 
 class EnhancedProject(Project):
+    # __weakref__ lets stores cache materialised rows without keeping them alive;
+    # __period holds the parsed (start, end) day ordinals of __project_period
+    __slots__ = ('__budget', '__project_period', '__period', '__weakref__')
+
     def __init__(self, name: str, category: str, year_started: str, location,
                  budget: str = "", project_period: str = ""):
         super().__init__(name, category, year_started, location)
         self.__budget = budget
         self.__project_period = project_period
+        self.__period = parse_period(project_period) if project_period else None
 
     def set_budget(self, budget: str):
         InvalidBudgetException.validate_budget(budget)
@@ -224,13 +232,22 @@ class EnhancedProject(Project):
     def get_budget(self):
         return self.__budget
 
+    def get_budget_cents(self):
+        """The budget as exact integer cents, or None when it isn't set"""
+        return parse_budget_cents(self.__budget)
+
     def set_project_period(self, period: str):
         InvalidDateException.validate_date_range(period)
         self.__project_period = period
+        self.__period = parse_period(period)
 
     def get_project_period(self):
         return self.__project_period
 
+    def get_period_ordinals(self):
+        """(start, end) of the project period as date.toordinal() days, or None"""
+        return self.__period
+
     def to_dict(self):
         """Convert project to dictionary for JSON serialization"""
         return {
@@ -248,32 +265,28 @@ class EnhancedProject(Project):
     @classmethod
     def from_dict(cls, data):
         """Create project from dictionary for JSON deserialization"""
-        location_parts = data['location'].split(', ')
-        if len(location_parts) >= 2:
-            city = location_parts[0]
-            state = location_parts[1]
-            location = Location(state, city)
-        else:
-            location = Location("Unknown", data['location'])
+        location = Location.from_string(data['location'])
 
         project_type = data.get('type', 'EnhancedProject')
+        category = _intern(data['category'])
+        year_started = _intern(data['year_started'])
 
         if project_type == 'EnhancedCurrentProject':
             project = EnhancedCurrentProject(
-                data['name'], data['category'],
-                data['year_started'], location,
+                data['name'], category,
+                year_started, location,
                 data.get('budget', ''), data.get('project_period', '')
             )
         elif project_type == 'EnhancedPastProject':
             project = EnhancedPastProject(
-                data['name'], data['category'],
-                data['year_started'], location,
+                data['name'], category,
+                year_started, location,
                 data.get('budget', ''), data.get('project_period', '')
             )
         else:
             project = cls(
-                data['name'], data['category'],
-                data['year_started'], location,
+                data['name'], category,
+                year_started, location,
                 data.get('budget', ''), data.get('project_period', '')
             )
 
@@ -283,15 +296,12 @@ class EnhancedProject(Project):
         return project
 
 
+# EnhancedProject.__init__ reaches Project.__init__ once through the MRO
+# (EnhancedProject -> CurrentProject/PastProject -> Project), so these
+# subclasses only need empty slots to stay free of a per-instance __dict__.
 class EnhancedCurrentProject(EnhancedProject, CurrentProject):
-    def __init__(self, name: str, category: str, year_started: str, location,
-                 budget: str = "", project_period: str = ""):
-        EnhancedProject.__init__(self, name, category, year_started, location, budget, project_period)
-        CurrentProject.__init__(self, name, category, year_started, location)
+    __slots__ = ()
 
 
 class EnhancedPastProject(EnhancedProject, PastProject):
-    def __init__(self, name: str, category: str, year_started: str, location,
-                 budget: str = "", project_period: str = ""):
-        EnhancedProject.__init__(self, name, category, year_started, location, budget, project_period)
-        PastProject.__init__(self, name, category, year_started, location)
+    __slots__ = ()
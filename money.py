@@ -0,0 +1,32 @@
+from functools import lru_cache
+
+from .exceptions import BUDGET_PATTERN
+
+_UNITS = {'k': 1_000, 'm': 1_000_000}
+
+
+@lru_cache(maxsize=65536)
+def parse_budget_cents(budget):
+    """Exact cents for a budget string like "$4.81m", or None if it isn't one.
+
+    Cached, as the same budget strings recur across many projects.
+    """
+    match = BUDGET_PATTERN.match(budget) if isinstance(budget, str) else None
+    if match is None:
+        return None
+    dollars, hundredths, unit = match.groups()
+    return (int(dollars) * 100 + int(hundredths or 0)) * _UNITS[unit.lower()]
+
+
+def to_cents(amount):
+    """Exact cents for a money amount stored as a float (None counts as 0)"""
+    if not amount:
+        return 0
+    return int(round(amount * 100))
+
+
+def format_cents(cents):
+    """Format integer cents as dollars, e.g. 481000000 -> $4,810,000.00"""
+    sign = "-" if cents < 0 else ""
+    dollars, cents = divmod(abs(cents), 100)
+    return f"{sign}${dollars:,}.{cents:02d}"
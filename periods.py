@@ -0,0 +1,80 @@
+from datetime import date
+from functools import lru_cache
+
+_DASHES = ('-', '–')
+
+
+def split_period(text):
+    """Split "DD/MM/YYYY – DD/MM/YYYY" into two (day, month, year) tuples.
+
+    Accepts the same strings as the old validation regex: either dash, with
+    whitespace on both sides. Returns None when the layout doesn't match;
+    the numbers themselves are not range-checked here.
+    """
+    if not isinstance(text, str):
+        return None
+    if text.endswith("\n"):
+        text = text[:-1]
+    if len(text) < 23:
+        return None
+    start = _split_date(text, 0)
+    end = _split_date(text, len(text) - 10)
+    middle = text[10:-10]
+    if (start is None or end is None or not middle[0].isspace() or not middle[-1].isspace()
+            or middle.strip() not in _DASHES):
+        return None
+    return start, end
+
+
+@lru_cache(maxsize=4096)
+def parse_period(text):
+    """(start, end) day ordinals (date.toordinal) of a project period, or None.
+
+    None also covers impossible dates such as 31/02. Cached, so projects
+    sharing a period string also share the tuple.
+    """
+    dates = split_period(text)
+    if dates is None:
+        return None
+    (day, month, year), (end_day, end_month, end_year) = dates
+    try:
+        return date(year, month, day).toordinal(), date(end_year, end_month, end_day).toordinal()
+    except ValueError:
+        return None
+
+
+def parse_date(text):
+    """Day ordinal of a single DD/MM/YYYY date, or None"""
+    text = text.strip() if isinstance(text, str) else ''
+    parts = _split_date(text, 0) if len(text) == 10 else None
+    if parts is None:
+        return None
+    day, month, year = parts
+    try:
+        return date(year, month, day).toordinal()
+    except ValueError:
+        return None
+
+
+def parse_window(text):
+    """(start, end) ordinals for a "DD/MM/YYYY" day or a "DD/MM/YYYY – DD/MM/YYYY" range.
+
+    Raises ValueError when the text is neither.
+    """
+    day = parse_date(text)
+    if day is not None:
+        return day, day
+    window = parse_period(text.strip()) if isinstance(text, str) else None
+    if window is None:
+        raise ValueError(f"Invalid date or period: {text}. Use DD/MM/YYYY or DD/MM/YYYY – DD/MM/YYYY")
+    return window
+
+
+def _split_date(text, i):
+    # DD/MM/YYYY starting at text[i]
+    if text[i + 2] != '/' or text[i + 5] != '/':
+        return None
+    day, month, year = text[i:i + 2], text[i + 3:i + 5], text[i + 6:i + 10]
+    if not (day.isdecimal() and month.isdecimal() and year.isdecimal()):
+        return None
+    return int(day), int(month), int(year)
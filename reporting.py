@@ -1,19 +1,115 @@
-from .visualization import VisualizationDecorator
+from .money import format_cents
+from .periods import parse_window
+from .visualization import ChartAggregate, VisualizationDecorator, render_charts
 
 
-def generate_summary_report(projects, search_type, search_value):
-    """Generate textual summary report and visualizations"""
-    if search_type == "category":
+def generate_summary_report(projects, search_type, search_value, workers=None, cache=None):
+    """Generate textual summary report and visualizations.
+
+    ``search_type`` is "category", "state" or "active" (projects running on
+    a DD/MM/YYYY date or during a DD/MM/YYYY – DD/MM/YYYY period). With
+    ``workers`` > 1 the three charts are rendered in a process pool, and
+    with a visualization.ChartCache unchanged charts are reused.
+    """
+    jobs = write_text_report(projects, search_type, search_value)
+    if jobs:
+        render_charts(jobs, workers, cache)
+
+
+def generate_summary_reports(projects, searches, workers=None, cache=None):
+    """Generate one report per ``(search_type, search_value)`` pair.
+
+    The text reports are written first; the charts of every report are
+    then rendered together, in a single process pool when ``workers`` > 1.
+    """
+    jobs = []
+    for search_type, search_value in searches:
+        jobs.extend(write_text_report(projects, search_type, search_value) or [])
+    render_charts(jobs, workers, cache)
+
+
+def write_text_report(projects, search_type, search_value):
+    """Write the text report and return its chart jobs (None if nothing matched)"""
+    summary = None
+    if search_type == "active":
+        try:
+            filtered_projects = active_projects(projects, search_value)
+        except ValueError as e:
+            print(e)
+            return None
+        filename_base = f"ARENA_report_active_{search_value.replace(' ', '_').replace('/', '-')}"
+    elif hasattr(projects, 'category_mask'):
+        # Columnar ProjectTable: filter with a vectorized mask
+        if search_type == "category":
+            filtered_projects = projects.select(projects.category_mask(search_value))
+        else:  # state
+            filtered_projects = projects.select(projects.state_mask(search_value))
+        filename_base = f"ARENA_report_{search_value.replace(' ', '_')}"
+    elif hasattr(projects, 'filter_projects'):
+        # ProjectManager: look the rows up in its inverted indexes
+        filtered_projects = projects.filter_projects(search_type, search_value)
+        filename_base = f"ARENA_report_{search_value.replace(' ', '_')}"
+        if projects.store is None:
+            # Totals and charts come from the manager's aggregate cube
+            summary = projects.cube.slice(**{search_type: search_value})
+    elif search_type == "category":
         filtered_projects = [p for p in projects if p.get_category() == search_value]
         filename_base = f"ARENA_report_{search_value.replace(' ', '_')}"
     else:  # state
-        filtered_projects = [p for p in projects if search_value in p.get_location()]
+        filtered_projects = [p for p in projects if p._get_state_value() == search_value]
         filename_base = f"ARENA_report_{search_value.replace(' ', '_')}"
 
-    if not filtered_projects:
+    if not len(filtered_projects):
         print(f"No projects found for {search_type}: {search_value}")
-        return
+        return None
+    return _write_report(filtered_projects, search_type, search_value, filename_base, summary)
+
+
+def generate_all_reports(projects, workers=None, cache=None):
+    """Generate the report for every category and every state.
 
+    Projects are grouped by category and by state in a single pass
+    (see group_projects) instead of being filtered once per value; the
+    charts of all reports are then rendered together. Returns the number
+    of reports written.
+    """
+    jobs = write_all_text_reports(projects)
+    render_charts(jobs, workers, cache)
+    return len(jobs) // 3
+
+
+def write_all_text_reports(projects):
+    """Write every category and state text report and return their chart jobs"""
+    by_category, by_state = group_projects(projects)
+    summaries = {"category": {}, "state": {}}
+    if hasattr(projects, 'cube') and projects.store is None:
+        summaries = {"category": projects.cube.split("category"), "state": projects.cube.split("state")}
+    jobs = []
+    for search_type, groups in (("category", by_category), ("state", by_state)):
+        for search_value, group in groups.items():
+            filename_base = f"ARENA_report_{search_value.replace(' ', '_')}"
+            summary = summaries[search_type].get(search_value)
+            jobs.extend(_write_report(group, search_type, search_value, filename_base, summary))
+    return jobs
+
+
+def group_projects(projects):
+    """``({category: projects}, {state: projects})`` from one pass over the projects"""
+    if hasattr(projects, 'filter_projects'):
+        # ProjectManager: its list, or every stored row
+        projects = projects.projects if projects.store is None else projects.store.iter_projects()
+    elif hasattr(projects, 'get_projects'):
+        projects = projects.get_projects()
+    by_category, by_state = {}, {}
+    for project in projects:
+        by_category.setdefault(project.get_category(), []).append(project)
+        by_state.setdefault(project._get_state_value(), []).append(project)
+    return by_category, by_state
+
+
+def _write_report(filtered_projects, search_type, search_value, filename_base, summary=None):
+    # summary: an AggregateCube slice of the same projects, read instead of rescanning them
+    totals = filtered_projects if summary is None else summary
     # Generate text report
     try:
         with open(f"{filename_base}.txt", 'w') as file:
@@ -21,9 +117,11 @@ def generate_summary_report(projects, search_type, search_value):
             file.write(f"Search Type: {search_type.title()}\n")
             file.write(f"Search Value: {search_value}\n")
             file.write(f"Total Projects Found: {len(filtered_projects)}\n")
+            file.write(f"Total Budget: {format_cents(total_budget_cents(totals))}\n")
             file.write("="*50 + "\n\n")
 
-            for project in filtered_projects:
+            rows = filtered_projects.get_projects() if hasattr(filtered_projects, 'get_projects') else filtered_projects
+            for project in rows:
                 file.write(str(project))
                 if hasattr(project, 'get_budget') and project.get_budget():
                     file.write(f"    Budget: {project.get_budget()}\n")
@@ -35,10 +133,31 @@ def generate_summary_report(projects, search_type, search_value):
     except IOError as e:
         print(f"Error writing report: {e}")
 
-    # Generate visualizations
-    visualizer = VisualizationDecorator(filtered_projects)
+    # Aggregate for the visualizations
+    aggregate = None if summary is None else ChartAggregate.from_projects(summary)
+    visualizer = VisualizationDecorator(filtered_projects, aggregate)
     title = f"{search_value} {search_type.title()} Analysis"
+    return visualizer.chart_jobs(title, filename_base)
+
+
+def total_budget_cents(projects):
+    """Exact sum of the budgets of a table, store selection or project list, in cents"""
+    if hasattr(projects, 'total_budget_cents'):
+        return projects.total_budget_cents()
+    return sum(project.get_budget_cents() or 0 for project in projects if hasattr(project, 'get_budget_cents'))
+
 
-    visualizer.generate_bar_chart(title, filename_base)
-    visualizer.generate_pie_chart(title, filename_base)
-    visualizer.generate_line_chart(title, filename_base)
+def active_projects(projects, when):
+    """Projects whose period covers a date or overlaps a period (ValueError if ``when`` is neither)"""
+    start, end = parse_window(when)
+    if hasattr(projects, 'projects_active_between'):
+        # ProjectManager: query its interval index
+        return projects.projects_active_between(start, end)
+    if hasattr(projects, 'get_projects'):
+        projects = projects.get_projects()
+    active = []
+    for project in projects:
+        period = project.get_period_ordinals() if hasattr(project, 'get_period_ordinals') else None
+        if period is not None and period[0] <= end and period[1] >= start:
+            active.append(project)
+    return active
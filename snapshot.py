@@ -0,0 +1,139 @@
+import struct
+import sys
+from array import array
+
+from .models import EnhancedProject, EnhancedCurrentProject, EnhancedPastProject, Location
+
+MAGIC = b"ARENASNP"
+VERSION = 2  # 2 added the money flags column; version 1 files are still read
+
+# magic, version, record count, string table size in bytes
+_HEADER = struct.Struct("<8sHxxQQ")
+
+_TYPES = [EnhancedProject, EnhancedCurrentProject, EnhancedPastProject]
+_TYPE_CODES = {cls.__name__: code for code, cls in enumerate(_TYPES)}
+
+_STRING_COLUMNS = ('name', 'category', 'year_started', 'city', 'state', 'budget', 'project_period')
+
+# Money flags: which amounts were ints, so 0 comes back as 0 and not 0.0
+_COST_IS_INT = 1
+_FUNDING_IS_INT = 2
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def write_snapshot(file, projects):
+    """Write projects to a binary file opened in 'wb' mode.
+
+    Layout: header, a NUL-separated UTF-8 string table, then one packed
+    column per field (uint32 string indexes, uint8 type codes, float64 money,
+    uint8 money flags).
+    String index 0 stands for None, so table entries are numbered from 1.
+    All integers and floats are little-endian.
+    """
+    strings, lookup = [], {}
+    columns = {name: array('I') for name in _STRING_COLUMNS}
+    types = array('B')
+    total_cost = array('d')
+    funding = array('d')
+    money_flags = array('B')
+
+    def string_index(value):
+        if value is None:
+            return 0
+        index = lookup.get(value)
+        if index is None:
+            if '\x00' in value:
+                raise SnapshotError(f"Cannot store string containing NUL: {value!r}")
+            strings.append(value)
+            index = lookup[value] = len(strings)
+        return index
+
+    count = 0
+    for project in projects:
+        location = project._get_location_obj()
+        values = (
+            project.get_name(),
+            project.get_category(),
+            project._get_year_started_value(),
+            location.get_city() if hasattr(location, 'get_city') else str(location),
+            project._get_state_value(),
+            project.get_budget() if hasattr(project, 'get_budget') else '',
+            project.get_project_period() if hasattr(project, 'get_project_period') else '',
+        )
+        for name, value in zip(_STRING_COLUMNS, values):
+            columns[name].append(string_index(value))
+        types.append(_TYPE_CODES.get(type(project).__name__, 0))
+        cost = project._get_total_cost_value() or 0
+        fund = project._get_funding_value() or 0
+        total_cost.append(cost)
+        funding.append(fund)
+        money_flags.append((_COST_IS_INT if type(cost) is int else 0) |
+                           (_FUNDING_IS_INT if type(fund) is int else 0))
+        count += 1
+
+    string_table = "\x00".join(strings).encode("utf-8")
+    file.write(_HEADER.pack(MAGIC, VERSION, count, len(string_table)))
+    file.write(string_table)
+    for column in [columns[name] for name in _STRING_COLUMNS] + [types, total_cost, funding, money_flags]:
+        file.write(_little_endian(column).tobytes())
+    return count
+
+
+def read_snapshot(file):
+    """Read projects written by write_snapshot from a file opened in 'rb' mode"""
+    data = file.read()
+    if len(data) < _HEADER.size:
+        raise SnapshotError("Snapshot is truncated")
+    magic, version, count, table_size = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError("Not an ARENA snapshot")
+    if version not in (1, VERSION):
+        raise SnapshotError(f"Unsupported snapshot version {version}")
+
+    view = memoryview(data)
+    offset = _HEADER.size
+    table = bytes(view[offset:offset + table_size]).decode("utf-8")
+    strings = [None] + table.split("\x00") if count else [None]
+    offset += table_size
+
+    def read_column(typecode):
+        nonlocal offset
+        column = array(typecode)
+        size = column.itemsize * count
+        if offset + size > len(data):
+            raise SnapshotError("Snapshot is truncated")
+        column.frombytes(view[offset:offset + size])
+        offset += size
+        return _little_endian(column)
+
+    names, categories, years, cities, states, budgets, periods = [read_column('I') for _ in _STRING_COLUMNS]
+    types = read_column('B')
+    total_cost = read_column('d')
+    funding = read_column('d')
+    money_flags = read_column('B') if version >= 2 else array('B', bytes(count))
+
+    # Locations carry no setters, so identical ones are shared
+    locations = {}
+    for key in set(zip(cities, states)):
+        locations[key] = Location(strings[key[1]], strings[key[0]])
+
+    text = strings.__getitem__
+    projects = []
+    for name, category, year, location_key, budget, period, type_code, cost, fund, flags in zip(
+            map(text, names), map(text, categories), map(text, years), zip(cities, states),
+            map(text, budgets), map(text, periods), types, total_cost, funding, money_flags):
+        project = _TYPES[type_code](name, category, year, locations[location_key], budget, period)
+        project.set_total_cost(int(cost) if flags & _COST_IS_INT else cost)
+        project.set_funding(int(fund) if flags & _FUNDING_IS_INT else fund)
+        projects.append(project)
+    return projects
+
+
+def _little_endian(column):
+    # array uses native byte order; the file format is little-endian
+    if sys.byteorder == 'big':
+        column.byteswap()
+    return column
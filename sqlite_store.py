@@ -0,0 +1,247 @@
+import sqlite3
+import weakref
+
+from .models import EnhancedProject, EnhancedCurrentProject, EnhancedPastProject, Location, _intern
+from .money import parse_budget_cents
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    category TEXT,
+    year_started TEXT,
+    city TEXT,
+    state TEXT,
+    total_cost REAL NOT NULL DEFAULT 0,
+    funding REAL NOT NULL DEFAULT 0,
+    budget TEXT NOT NULL DEFAULT '',
+    budget_cents INTEGER,
+    project_period TEXT NOT NULL DEFAULT '',
+    type TEXT NOT NULL DEFAULT 'EnhancedProject'
+);
+CREATE INDEX IF NOT EXISTS idx_projects_name ON projects(name);
+CREATE INDEX IF NOT EXISTS idx_projects_category ON projects(category);
+CREATE INDEX IF NOT EXISTS idx_projects_state ON projects(state);
+CREATE INDEX IF NOT EXISTS idx_projects_year ON projects(year_started);
+"""
+
+_COLUMNS = "id, name, category, year_started, city, state, total_cost, funding, budget, project_period, type"
+# budget_cents is derived from budget, so it is written but never read back
+_INSERT = f"INSERT INTO projects ({_COLUMNS}, budget_cents) VALUES (NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+_TYPES = {
+    'EnhancedProject': EnhancedProject,
+    'EnhancedCurrentProject': EnhancedCurrentProject,
+    'EnhancedPastProject': EnhancedPastProject,
+}
+
+# Report search type -> indexed column it filters on
+_FILTER_COLUMNS = {'category': 'category', 'state': 'state', 'year': 'year_started'}
+
+# Editable attribute -> column(s) updated by SQLiteProjectStore.update
+_UPDATE_COLUMNS = {
+    'name': 'name',
+    'category': 'category',
+    'year_started': 'year_started',
+    'budget': 'budget',
+    'project_period': 'project_period',
+    'total_cost': 'total_cost',
+    'funding': 'funding',
+}
+
+
+class SQLiteProjectStore:
+    """Projects kept in an SQLite database instead of in memory.
+
+    Lookups, filters and chart aggregations run as SQL against indexed
+    columns; only the rows a query returns are turned into EnhancedProject
+    objects. Materialised projects are cached weakly so edits made through
+    their setters can be written back as single-row UPDATEs.
+    """
+
+    def __init__(self, filename="ARENA_projects.db"):
+        self.filename = filename
+        self.connection = sqlite3.connect(filename)
+        self.connection.executescript(_SCHEMA)
+        self._migrate()
+        self._cache = weakref.WeakValueDictionary()   # row id -> project
+        self._row_ids = weakref.WeakKeyDictionary()   # project -> row id
+
+    def _migrate(self):
+        # Databases created before budget_cents existed: add and fill the column
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(projects)")}
+        if 'budget_cents' not in columns:
+            self.connection.create_function('parse_budget_cents', 1, parse_budget_cents)
+            with self.connection:
+                self.connection.execute("ALTER TABLE projects ADD COLUMN budget_cents INTEGER")
+                self.connection.execute("UPDATE projects SET budget_cents = parse_budget_cents(budget)")
+
+    def close(self):
+        self.connection.close()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+
+    def insert(self, project):
+        with self.connection:
+            cursor = self.connection.execute(_INSERT, _to_row(project))
+        self._remember(cursor.lastrowid, project)
+        return cursor.lastrowid
+
+    def insert_many(self, projects):
+        """Insert projects in a single transaction; they can then be edited through the store"""
+        with self.connection:
+            inserted = self._insert_rows(projects)
+        for row_id, project in inserted:
+            self._remember(row_id, project)
+
+    def replace_all(self, projects):
+        """Replace the stored projects (e.g. after a text import) in one transaction.
+
+        If any row fails to insert, the previous rows are kept.
+        """
+        with self.connection:
+            self.connection.execute("DELETE FROM projects")
+            inserted = self._insert_rows(projects)
+        self._cache.clear()
+        self._row_ids.clear()
+        for row_id, project in inserted:
+            self._remember(row_id, project)
+
+    def _insert_rows(self, projects):
+        # One execute per row (not executemany) so each project's row id is known
+        execute = self.connection.execute
+        return [(execute(_INSERT, _to_row(project)).lastrowid, project) for project in projects]
+
+    def row_id(self, project):
+        """The row a project was read from or written to (ValueError if it has none)"""
+        try:
+            return self._row_ids[project]
+        except KeyError:
+            raise ValueError(f"Project {project.get_name()} is not stored in {self.filename}") from None
+
+    def update(self, project, attribute, value):
+        """Write one edited attribute of a materialised project back to its row"""
+        row_id = self.row_id(project)
+        if attribute == 'location':
+            assignments, params = "city = ?, state = ?", [value.get_city(), value.get_state()]
+        elif attribute == 'budget':
+            assignments, params = "budget = ?, budget_cents = ?", [value, parse_budget_cents(value)]
+        else:
+            assignments, params = f"{_UPDATE_COLUMNS[attribute]} = ?", [value]
+        with self.connection:
+            self.connection.execute(f"UPDATE projects SET {assignments} WHERE id = ?", params + [row_id])
+
+    def search_by_name(self, name):
+        return self.select("name = ?", (name,)).get_projects()
+
+    def filter_projects(self, search_type, search_value):
+        """Return a lazy selection of rows matching a category, state or year"""
+        return self.select(f"{_FILTER_COLUMNS[search_type]} = ?", (search_value,))
+
+    def select(self, where="1", params=()):
+        return StoreSelection(self, where, params)
+
+    def iter_projects(self):
+        return iter(self.select())
+
+    def _remember(self, row_id, project):
+        self._cache[row_id] = project
+        self._row_ids[project] = row_id
+
+    def _materialise(self, row):
+        project = self._cache.get(row[0])
+        if project is None:
+            project = _from_row(row)
+            self._remember(row[0], project)
+        return project
+
+
+class StoreSelection:
+    """A WHERE clause over a SQLiteProjectStore.
+
+    Offers the same len/aggregation methods as ProjectTable, so
+    generate_summary_report and VisualizationDecorator can use it directly.
+    """
+
+    def __init__(self, store, where, params):
+        self.store = store
+        self.where = where
+        self.params = tuple(params)
+
+    def _query(self, sql, extra_params=()):
+        return self.store.connection.execute(sql.format(where=self.where), self.params + tuple(extra_params))
+
+    def __len__(self):
+        return self._query("SELECT COUNT(*) FROM projects WHERE {where}").fetchone()[0]
+
+    def __iter__(self):
+        cursor = self._query(f"SELECT {_COLUMNS} FROM projects WHERE {{where}} ORDER BY id")
+        for row in cursor:
+            yield self.store._materialise(row)
+
+    def get_projects(self):
+        return list(self)
+
+    # Groups come back in order of first appearance, like the in-memory loops
+    def count_by_category(self):
+        return dict(self._query(
+            "SELECT category, COUNT(*) FROM projects WHERE {where} GROUP BY category ORDER BY MIN(id)"))
+
+    def funding_by_category(self):
+        return dict(self._query(
+            "SELECT category, SUM(funding) FROM projects WHERE {where} GROUP BY category ORDER BY MIN(id)"))
+
+    def count_by_year(self):
+        # Unknown years are left out, as in the in-memory aggregations
+        return dict(self._query(
+            "SELECT year_started, COUNT(*) FROM projects WHERE {where} AND year_started IS NOT NULL "
+            "GROUP BY year_started ORDER BY MIN(id)"))
+
+    # Exact integer cents, summed by SQLite in 64-bit integers
+    def budget_cents_by_category(self):
+        return dict(self._query(
+            "SELECT category, COALESCE(SUM(budget_cents), 0) FROM projects WHERE {where} "
+            "GROUP BY category ORDER BY MIN(id)"))
+
+    def total_budget_cents(self):
+        return self._query("SELECT COALESCE(SUM(budget_cents), 0) FROM projects WHERE {where}").fetchone()[0]
+
+    def total_funding_cents(self):
+        return self._query(
+            "SELECT COALESCE(SUM(CAST(ROUND(funding * 100) AS INTEGER)), 0) FROM projects WHERE {where}"
+        ).fetchone()[0]
+
+    def total_cost_cents(self):
+        return self._query(
+            "SELECT COALESCE(SUM(CAST(ROUND(total_cost * 100) AS INTEGER)), 0) FROM projects WHERE {where}"
+        ).fetchone()[0]
+
+
+def _to_row(project):
+    location = project._get_location_obj()
+    return (
+        project.get_name(),
+        project.get_category(),
+        project._get_year_started_value(),
+        location.get_city() if hasattr(location, 'get_city') else str(location),
+        project._get_state_value(),
+        project._get_total_cost_value() or 0,
+        project._get_funding_value() or 0,
+        project.get_budget() if hasattr(project, 'get_budget') else '',
+        project.get_project_period() if hasattr(project, 'get_project_period') else '',
+        type(project).__name__ if type(project).__name__ in _TYPES else 'EnhancedProject',
+        project.get_budget_cents() if hasattr(project, 'get_budget_cents') else None,
+    )
+
+
+def _from_row(row):
+    (_, name, category, year_started, city, state,
+     total_cost, funding, budget, project_period, project_type) = row
+    project = _TYPES.get(project_type, EnhancedProject)(
+        name, _intern(category), _intern(year_started), Location(_intern(state), _intern(city)),
+        budget, project_period,
+    )
+    project.set_total_cost(total_cost)
+    project.set_funding(funding)
+    return project
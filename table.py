@@ -0,0 +1,128 @@
+import numpy as np
+
+
+class ProjectTable:
+    """Columnar store of project data backed by NumPy arrays.
+
+    Category and state are dictionary-encoded: ``category_codes[i]`` indexes
+    into ``categories``. Years are stored as ints (0 when unknown) and money
+    columns as float64, so filters and aggregations run as array operations
+    instead of per-object accessor calls. Budgets are parsed once into int64
+    cents (0 when unset); the ``*_cents`` aggregations are exact integers.
+    """
+
+    def __init__(self, categories, category_codes, states, state_codes,
+                 years, total_cost, funding, budget_cents, projects=None, rows=None):
+        self.categories = categories
+        self.category_codes = category_codes
+        self.states = states
+        self.state_codes = state_codes
+        self.years = years
+        self.total_cost = total_cost
+        self.funding = funding
+        self.budget_cents = budget_cents
+        # Source objects and the positions of this table's rows within them
+        self.projects = projects if projects is not None else []
+        self.rows = rows if rows is not None else np.arange(len(category_codes))
+
+    @classmethod
+    def from_projects(cls, projects):
+        """Build a table from a list of Project objects"""
+        projects = list(projects)
+        n = len(projects)
+        category_lookup, state_lookup = {}, {}
+        category_codes = np.empty(n, dtype=np.int32)
+        state_codes = np.empty(n, dtype=np.int32)
+        years = np.zeros(n, dtype=np.int32)
+        total_cost = np.empty(n, dtype=np.float64)
+        funding = np.empty(n, dtype=np.float64)
+        budget_cents = np.zeros(n, dtype=np.int64)
+
+        for i, project in enumerate(projects):
+            category_codes[i] = category_lookup.setdefault(project.get_category(), len(category_lookup))
+            state_codes[i] = state_lookup.setdefault(project._get_state_value(), len(state_lookup))
+            year = project._get_year_started_value()
+            if year and str(year).isdigit():
+                years[i] = int(year)
+            total_cost[i] = project._get_total_cost_value() or 0
+            funding[i] = project._get_funding_value() or 0
+            if hasattr(project, 'get_budget_cents'):
+                budget_cents[i] = project.get_budget_cents() or 0
+
+        return cls(list(category_lookup), category_codes, list(state_lookup), state_codes,
+                   years, total_cost, funding, budget_cents, projects)
+
+    def __len__(self):
+        return len(self.category_codes)
+
+    def category_mask(self, category):
+        """Boolean mask of rows in the given category"""
+        return _code_mask(self.categories, self.category_codes, category)
+
+    def state_mask(self, state):
+        """Boolean mask of rows located in the given state (exact match)"""
+        return _code_mask(self.states, self.state_codes, state)
+
+    def select(self, mask):
+        """Return a new table holding only the rows where ``mask`` is true"""
+        return ProjectTable(
+            self.categories, self.category_codes[mask],
+            self.states, self.state_codes[mask],
+            self.years[mask], self.total_cost[mask], self.funding[mask],
+            self.budget_cents[mask], self.projects, self.rows[mask],
+        )
+
+    def get_projects(self):
+        """Materialise the Project objects behind this table's rows"""
+        return [self.projects[i] for i in self.rows.tolist()]
+
+    def count_by_category(self):
+        counts = np.bincount(self.category_codes, minlength=len(self.categories))
+        return _decode(self.categories, counts)
+
+    def funding_by_category(self):
+        sums = np.bincount(self.category_codes, weights=self.funding, minlength=len(self.categories))
+        return _decode(self.categories, sums)
+
+    def count_by_year(self):
+        known = self.years[self.years > 0]
+        values, counts = np.unique(known, return_counts=True)
+        return {str(year): int(count) for year, count in zip(values.tolist(), counts.tolist())}
+
+    def total_funding(self):
+        return float(self.funding.sum())
+
+    def total_costs(self):
+        return float(self.total_cost.sum())
+
+    def budget_cents_by_category(self):
+        sums = np.zeros(len(self.categories), dtype=np.int64)
+        np.add.at(sums, self.category_codes, self.budget_cents)
+        return _decode(self.categories, sums)
+
+    def total_budget_cents(self):
+        return int(self.budget_cents.sum())
+
+    def total_funding_cents(self):
+        return int(_to_cents(self.funding).sum())
+
+    def total_cost_cents(self):
+        return int(_to_cents(self.total_cost).sum())
+
+
+def _code_mask(dictionary, codes, value):
+    try:
+        code = dictionary.index(value)
+    except ValueError:
+        return np.zeros(len(codes), dtype=bool)
+    return codes == code
+
+
+def _to_cents(amounts):
+    # Same rounding as money.to_cents, for a whole column
+    return np.rint(amounts * 100).astype(np.int64)
+
+
+def _decode(dictionary, values):
+    # Drop dictionary entries that have no rows in this (possibly filtered) table
+    return {dictionary[code]: value.item() for code, value in enumerate(values) if value}
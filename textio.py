@@ -0,0 +1,157 @@
+import glob
+import io
+import locale
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .fileio import atomic_write
+
+
+def iter_records(lines):
+    """Yield one ``{field: value}`` dict per project record in a single pass.
+
+    Records are the blocks written by Project.__str__: "Key: value," lines
+    separated by blank lines. The "Project info" header line is skipped.
+    """
+    record = {}
+    for line in lines:
+        line = line.strip()
+        if not line:
+            if record:
+                yield record
+                record = {}
+        elif ": " in line and not line.startswith("Project info"):
+            key, value = line.split(": ", 1)
+            record[key.strip().rstrip(',')] = value.strip().rstrip(',')
+    # The last record when the file doesn't end with a blank line
+    if record:
+        yield record
+
+
+def iter_projects(filename, cls):
+    """Yield ``cls.from_record`` projects from a text export, one at a time"""
+    with open(filename, 'r') as file:
+        for record in iter_records(file):
+            yield cls.from_record(record)
+
+
+def parse_text_file(filename, cls, workers=None, min_chunk_bytes=1 << 20):
+    """Parse a text export into a list of ``cls`` projects.
+
+    With ``workers`` > 1 and a large enough file, the file is split at record
+    boundaries (blank lines) and the chunks are parsed in a process pool;
+    the result keeps the file's record order. Workers send back plain record
+    dicts (cheap to pickle) and the projects are built in this process.
+    """
+    size = os.path.getsize(filename)
+    if not workers or workers < 2 or size < 2 * min_chunk_bytes:
+        return list(iter_projects(filename, cls))
+
+    parts = min(workers * 4, max(2, size // min_chunk_bytes))
+    boundaries = chunk_boundaries(filename, parts)
+    encoding = locale.getpreferredencoding(False)
+    chunk_count = len(boundaries) - 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = executor.map(
+            _parse_chunk,
+            [filename] * chunk_count, boundaries[:-1], boundaries[1:], [encoding] * chunk_count,
+        )
+        from_record = cls.from_record
+        return [from_record(record) for chunk in chunks for record in chunk]
+
+
+def find_text_files(source):
+    """Sorted text exports named by a directory (its *.txt files) or a glob pattern"""
+    if os.path.isdir(source):
+        source = os.path.join(source, "*.txt")
+    return sorted(glob.glob(source))
+
+
+def parse_text_files(filenames, cls, workers=None):
+    """Parse several text exports concurrently, one file per pool task.
+
+    Returns a ``(filename, projects, seconds, error)`` tuple per file in the
+    order given. A file that cannot be read or parsed gets ``projects`` None
+    and the error message instead of stopping the batch.
+    """
+    filenames = list(filenames)
+    encodings = [locale.getpreferredencoding(False)] * len(filenames)
+    if workers == 1 or len(filenames) < 2:
+        parsed = list(map(_parse_file, filenames, encodings))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = list(executor.map(_parse_file, filenames, encodings))
+
+    results = []
+    from_record = cls.from_record
+    for filename, (records, seconds, error) in zip(filenames, parsed):
+        projects = None
+        if records is not None:
+            start = time.perf_counter()
+            projects = [from_record(record) for record in records]
+            seconds += time.perf_counter() - start
+        results.append((filename, projects, seconds, error))
+    return results
+
+
+def _parse_file(filename, encoding):
+    # Runs in a worker: return records, not projects, as they pickle much faster
+    start = time.perf_counter()
+    try:
+        with open(filename, 'r', encoding=encoding) as file:
+            records = list(iter_records(file))
+    except Exception as e:
+        return None, time.perf_counter() - start, str(e)
+    return records, time.perf_counter() - start, None
+
+
+def chunk_boundaries(filename, parts):
+    """Byte offsets splitting a text export into about ``parts`` chunks of whole records"""
+    size = os.path.getsize(filename)
+    boundaries = [0]
+    with open(filename, 'rb') as file:
+        for part in range(1, parts):
+            target = max(size * part // parts, boundaries[-1])
+            file.seek(target)
+            if target:
+                file.readline()  # finish the partial line we landed in
+            # Advance to just after the next blank line, where a record ends
+            while True:
+                line = file.readline()
+                if not line or not line.strip():
+                    break
+            position = file.tell()
+            if position > boundaries[-1] and position < size:
+                boundaries.append(position)
+    boundaries.append(size)
+    return boundaries
+
+
+def _parse_chunk(filename, start, end, encoding):
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode(encoding)
+    # Split lines exactly as reading the file in text mode does (str.splitlines
+    # would also break on \x0b, \x0c, \x1c-\x1e, \x85, \u2028 and \u2029)
+    return list(iter_records(io.StringIO(text, newline=None)))
+
+
+def write_text_file(filename, projects, batch_size=2000):
+    """Write projects (any iterable, e.g. a generator) as a text export.
+
+    The output is byte-for-byte what writing ``str(project)`` plus a newline
+    per project gives, but records are joined ``batch_size`` at a time and
+    written with one call per batch. Returns the number of projects written.
+    """
+    count = 0
+    projects = iter(projects)
+    with atomic_write(filename) as file:
+        while True:
+            batch = list(islice(projects, batch_size))
+            if not batch:
+                break
+            file.write("\n".join(map(str, batch)) + "\n")
+            count += len(batch)
+    return count
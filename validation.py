@@ -0,0 +1,153 @@
+from collections import namedtuple
+
+from .exceptions import (
+    BUDGET_PATTERN,
+    InvalidCategoryException,
+    InvalidStateException,
+    InvalidYearException,
+)
+from .periods import parse_period, split_period
+
+VALID_CATEGORIES = frozenset(InvalidCategoryException.valid_category)
+VALID_STATES = frozenset(InvalidStateException.valid_state)
+VALID_YEARS = frozenset(InvalidYearException.valid_year)
+VALID_TYPES = frozenset(["EnhancedProject", "EnhancedCurrentProject", "EnhancedPastProject"])
+
+RowError = namedtuple('RowError', ['row', 'field', 'value', 'message'])
+
+
+class ValidationReport:
+    """Errors found while validating a batch of rows, in row order"""
+
+    def __init__(self, rows=0, errors=None):
+        self.rows = rows
+        self.errors = errors if errors is not None else []
+
+    def is_valid(self):
+        return not self.errors
+
+    def invalid_rows(self):
+        """Sorted row numbers that have at least one error"""
+        return sorted({error.row for error in self.errors})
+
+    def errors_for(self, row):
+        return [error for error in self.errors if error.row == row]
+
+    def counts_by_field(self):
+        counts = {}
+        for error in self.errors:
+            counts[error.field] = counts.get(error.field, 0) + 1
+        return counts
+
+
+def check_category(value):
+    if not isinstance(value, str) or value not in VALID_CATEGORIES:
+        return f"Invalid category: {value}"
+
+
+def check_year(value):
+    if not isinstance(value, str) or value not in VALID_YEARS:
+        return f"Invalid year: {value}"
+
+
+def check_state(value):
+    if not isinstance(value, str) or value not in VALID_STATES:
+        return f"Invalid state: {value}"
+
+
+def check_location(value):
+    """A "City, State" string whose state is one of the valid states"""
+    if not isinstance(value, str) or ', ' not in value:
+        return f"Invalid location: {value}"
+    return check_state(value.split(', ', 1)[1])
+
+
+def check_amount(value):
+    if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+        return f"Invalid amount: {value}"
+
+
+# '' is how to_dict() writes an unset budget or period, so it is skipped like None
+
+def check_budget(value):
+    if value not in (None, '') and not (isinstance(value, str) and BUDGET_PATTERN.match(value)):
+        return f"Invalid budget format: {value}. Use format like $4.81m or $500k"
+
+
+def check_project_period(value):
+    """Same rules as InvalidDateException.validate_date_range, without raising"""
+    if value in (None, ''):
+        return None
+    ordinals = parse_period(value) if isinstance(value, str) else None
+    if ordinals is None:
+        if split_period(value) is None:
+            return f"Invalid date format: {value}. Use format: DD/MM/YYYY – DD/MM/YYYY"
+        return f"Invalid date values in: {value}"
+    if ordinals[0] >= ordinals[1]:
+        return "Start date must be before end date"
+
+
+def check_type(value):
+    if not isinstance(value, str) or value not in VALID_TYPES:
+        return f"Invalid project type: {value}"
+
+
+def check_name(value):
+    if not isinstance(value, str) or not value.strip():
+        return f"Invalid name: {value}"
+
+
+# Field of a to_dict() record -> check returning an error message or None
+RECORD_CHECKS = {
+    'name': check_name,
+    'category': check_category,
+    'year_started': check_year,
+    'location': check_location,
+    'total_cost': check_amount,
+    'funding': check_amount,
+    'budget': check_budget,
+    'project_period': check_project_period,
+    'type': check_type,
+}
+# Fields EnhancedProject.from_dict cannot do without
+REQUIRED_FIELDS = ('name', 'category', 'year_started', 'location')
+
+
+def validate_column(field, values):
+    """Check every value of one column and return a report of the failing rows"""
+    check = RECORD_CHECKS[field]
+    errors = []
+    rows = 0
+    for row, value in enumerate(values):
+        message = check(value)
+        if message is not None:
+            errors.append(RowError(row, field, value, message))
+        rows += 1
+    return ValidationReport(rows, errors)
+
+
+def validate_records(records, report=None):
+    """Check a stream of to_dict() records in one pass.
+
+    Records are only read, never converted, so this can run over a million-row
+    import before any of it reaches EnhancedProject.from_dict. Missing
+    required fields and every failing check are recorded per row; nothing
+    is raised. Pass ``report`` to accumulate across several batches.
+    """
+    if report is None:
+        report = ValidationReport()
+    errors = report.errors
+    checks = list(RECORD_CHECKS.items())
+    row = report.rows
+    for record in records:
+        for field in REQUIRED_FIELDS:
+            if field not in record:
+                errors.append(RowError(row, field, None, f"Missing field: {field}"))
+        for field, check in checks:
+            if field in record:
+                message = check(record[field])
+                if message is not None:
+                    errors.append(RowError(row, field, record[field], message))
+        row += 1
+    report.rows = row
+    return report
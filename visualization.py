@@ -1,75 +1,292 @@
-import matplotlib
-matplotlib.use('Agg')  # ensure tests run without GUI
-import matplotlib.pyplot as plt
+import hashlib
+import json
+import os
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+# matplotlib is imported only when a chart is drawn (see _new_figure), so
+# importing the package, listing, searching and editing never load it.
+
+# Everything besides data and title that changes a chart's pixels; part of
+# the ChartCache key, so bump it along with any drawing change below.
+CHART_STYLE = {
+    'version': 1,
+    'bar': {'figsize': (12, 6), 'rotation': 45},
+    'pie': {'figsize': (10, 8), 'autopct': '%1.1f%%'},
+    'line': {'figsize': (10, 6), 'marker': 'o'},
+}
+
+
+@lru_cache(maxsize=None)
+def _matplotlib_version():
+    """Installed matplotlib version, read from package metadata without importing it"""
+    from importlib.metadata import version
+    return version('matplotlib')
+
+
+class ChartAggregate:
+    """What the three charts plot, computed in one pass over the projects.
+
+    ``count_by_category`` feeds the bar chart, ``funding_by_category`` the
+    pie chart and ``count_by_year`` the line chart. Sources that aggregate
+    themselves (ProjectTable, SQLite selections, AggregateCube) are asked
+    directly.
+    """
+
+    def __init__(self, count_by_category, funding_by_category, count_by_year):
+        self.count_by_category = count_by_category
+        self.funding_by_category = funding_by_category
+        self.count_by_year = count_by_year
+
+    @classmethod
+    def from_projects(cls, projects):
+        # Columnar sources (ProjectTable) aggregate with array operations
+        if hasattr(projects, 'count_by_category'):
+            return cls(projects.count_by_category(), projects.funding_by_category(), projects.count_by_year())
+        categories, total_funding, years = {}, {}, {}
+        for project in projects:
+            cat = project.get_category()
+            categories[cat] = categories.get(cat, 0) + 1
+            total_funding[cat] = total_funding.get(cat, 0) + (project._get_funding_value() or 0)
+            year = project._get_year_started_value()
+            if year is not None:
+                years[year] = years.get(year, 0) + 1
+        return cls(categories, total_funding, years)
+
+    def pie_data(self):
+        """Funding per category, or project counts when nothing is funded"""
+        # Filter out categories with zero funding
+        filtered_funding = {k: v for k, v in self.funding_by_category.items() if v > 0}
+        return filtered_funding or self.count_by_category
 
 
 class VisualizationDecorator:
-    def __init__(self, projects):
+    def __init__(self, projects, aggregate=None):
         self.projects = projects
+        self._aggregate = aggregate
+
+    def aggregate(self):
+        """The ChartAggregate of the projects, computed on first use and then shared"""
+        if self._aggregate is None:
+            self._aggregate = ChartAggregate.from_projects(self.projects)
+        return self._aggregate
+
+    def _count_by_category(self):
+        return self.aggregate().count_by_category
+
+    def _funding_by_category(self):
+        return self.aggregate().funding_by_category
+
+    def _count_by_year(self):
+        return self.aggregate().count_by_year
+
+    def bar_chart_job(self, title, filename):
+        return 'bar', self._count_by_category(), title, filename
+
+    def pie_chart_job(self, title, filename):
+        return 'pie', self.aggregate().pie_data(), title, filename
+
+    def line_chart_job(self, title, filename):
+        return 'line', self._count_by_year(), title, filename
+
+    def chart_jobs(self, title, filename):
+        """The (kind, data, title, filename) jobs for all three charts; see render_charts"""
+        return [self.bar_chart_job(title, filename), self.pie_chart_job(title, filename),
+                self.line_chart_job(title, filename)]
 
     def generate_bar_chart(self, title, filename):
         """Generate bar chart for project categories"""
-        categories = {}
-        for project in self.projects:
-            cat = project.get_category()
-            categories[cat] = categories.get(cat, 0) + 1
-
-        plt.figure(figsize=(12, 6))
-        plt.bar(categories.keys(), categories.values())
-        plt.title(f'{title} - Projects by Category')
-        plt.xlabel('Category')
-        plt.ylabel('Number of Projects')
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        plt.savefig(f'{filename}_bar_chart.png')
-        plt.show()
-        print(f"Bar chart saved as {filename}_bar_chart.png")
+        render_charts([self.bar_chart_job(title, filename)])
 
     def generate_pie_chart(self, title, filename):
         """Generate pie chart for funding distribution"""
-        total_funding = {}
-        for project in self.projects:
-            cat = project.get_category()
-            # Prefer internal accessor when available
-            funding = getattr(project, '_get_funding_value', lambda: 0)()
-            total_funding[cat] = total_funding.get(cat, 0) + (funding or 0)
-
-        # Filter out categories with zero funding
-        filtered_funding = {k: v for k, v in total_funding.items() if v > 0}
-
-        if not filtered_funding:
-            # If no funding data, show project count instead
-            categories = {}
-            for project in self.projects:
-                cat = project.get_category()
-                categories[cat] = categories.get(cat, 0) + 1
-            filtered_funding = categories
-
-        plt.figure(figsize=(10, 8))
-        plt.pie(filtered_funding.values(), labels=filtered_funding.keys(), autopct='%1.1f%%')
-        plt.title(f'{title} - Funding Distribution by Category')
-        plt.tight_layout()
-        plt.savefig(f'{filename}_pie_chart.png')
-        plt.show()
-        print(f"Pie chart saved as {filename}_pie_chart.png")
+        render_charts([self.pie_chart_job(title, filename)])
 
     def generate_line_chart(self, title, filename):
         """Generate line chart for projects over years"""
-        years = {}
-        for project in self.projects:
-            year = getattr(project, '_get_year_started_value', lambda: None)()
-            if year is not None:
-                years[year] = years.get(year, 0) + 1
+        render_charts([self.line_chart_job(title, filename)])
+
+
+def render_charts(jobs, workers=None, cache=None):
+    """Render chart jobs, in a process pool when ``workers`` > 1.
+
+    A job is ``(kind, data, title, filename)`` with kind "bar", "pie" or
+    "line" and ``data`` the small aggregated dict the chart plots, so only
+    that is pickled to the workers. Files are named
+    ``{filename}_{kind}_chart.png`` either way. With a ChartCache, charts
+    whose inputs were rendered before are reused instead of drawn again.
+    """
+    jobs = list(jobs)
+    paths = [chart_path(job) for job in jobs]
+    cached = [False] * len(jobs)
+    if cache is not None:
+        keys = [cache.key(job) for job in jobs]
+        cached = [cache.fetch(key, path) for key, path in zip(keys, paths)]
+    misses = [job for job, hit in zip(jobs, cached) if not hit]
+
+    if workers and workers > 1 and len(misses) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(misses))) as executor:
+            list(executor.map(render_chart, misses))
+    else:
+        for job in misses:
+            render_chart(job)
+
+    for index, (job, path) in enumerate(zip(jobs, paths)):
+        if cache is not None and not cached[index]:
+            cache.store(keys[index], path)
+        source = " (cached)" if cached[index] else ""
+        print(f"{job[0].title()} chart saved as {path}{source}")
+    return paths
+
+
+def chart_path(job):
+    kind, _, _, filename = job
+    return f"{filename}_{kind}_chart.png"
+
+
+def render_chart(job):
+    kind, data, title, filename = job
+    _RENDERERS[kind](data, title, filename)
+    return chart_path(job)
+
+
+class ChartCache:
+    """Rendered chart PNGs kept under a hash of everything that shapes them.
+
+    The key covers the chart kind, its aggregated data (in plotting order),
+    the title and CHART_STYLE, but not the output filename, so the same
+    chart requested under another report name is reused too. At most
+    ``max_entries`` PNGs are kept; the least recently used is evicted
+    first. Hits are copied to the requested path, or hard-linked with
+    ``hardlink=True`` (then the reused files must not be edited in place).
+    """
+
+    def __init__(self, directory=".chart_cache", max_entries=256, hardlink=False):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.hardlink = hardlink
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> cached file, least recently used first; earlier runs' files
+        # are picked up in modification time order
+        self._entries = OrderedDict()
+        if os.path.isdir(directory):
+            files = [entry for entry in os.scandir(directory) if entry.name.endswith('.png')]
+            for entry in sorted(files, key=lambda entry: entry.stat().st_mtime_ns):
+                self._entries[entry.name[:-4]] = entry.path
+            self._evict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, job):
+        kind, data, title, _ = job
+        payload = json.dumps([kind, list(data.items()), title, CHART_STYLE[kind],
+                              CHART_STYLE['version'], _matplotlib_version()], default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def fetch(self, key, path):
+        """Put the cached chart for ``key`` at ``path``; False on a miss"""
+        cached = self._entries.get(key)
+        if cached is None or not os.path.exists(cached):
+            self._entries.pop(key, None)
+            self.misses += 1
+            if self.hardlink and os.path.lexists(path):
+                # Don't let the re-render write through a link into the cache
+                os.remove(path)
+            return False
+        if os.path.abspath(cached) != os.path.abspath(path):
+            if os.path.lexists(path):
+                os.remove(path)
+            if self.hardlink:
+                try:
+                    os.link(cached, path)
+                except OSError:
+                    shutil.copyfile(cached, path)
+            else:
+                shutil.copyfile(cached, path)
+        os.utime(cached)
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True
+
+    def store(self, key, path):
+        """Keep a copy of a freshly rendered chart"""
+        if not os.path.exists(path):
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        cached = os.path.join(self.directory, key + ".png")
+        temp = cached + ".tmp"
+        shutil.copyfile(path, temp)
+        os.replace(temp, cached)
+        self._entries[key] = cached
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'entries': len(self._entries)}
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            _, cached = self._entries.popitem(last=False)
+            try:
+                os.remove(cached)
+            except FileNotFoundError:
+                pass
+            self.evictions += 1
+
+
+# The renderers below take only aggregated data and draw on their own
+# Figure/FigureCanvasAgg pair: nothing is registered with pyplot, so each
+# figure is freed once it has been saved and rendering is safe off the
+# main thread.
+
+def _new_figure(figsize):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    return figure, figure.add_subplot()
+
+
+def render_bar_chart(categories, title, filename):
+    style = CHART_STYLE['bar']
+    figure, axes = _new_figure(style['figsize'])
+    axes.bar(list(categories.keys()), list(categories.values()))
+    axes.set_title(f'{title} - Projects by Category')
+    axes.set_xlabel('Category')
+    axes.set_ylabel('Number of Projects')
+    axes.tick_params(axis='x', labelrotation=style['rotation'])
+    for label in axes.get_xticklabels():
+        label.set_horizontalalignment('right')
+    figure.tight_layout()
+    figure.savefig(f'{filename}_bar_chart.png')
+
+
+def render_pie_chart(funding, title, filename):
+    style = CHART_STYLE['pie']
+    figure, axes = _new_figure(style['figsize'])
+    axes.pie(list(funding.values()), labels=list(funding.keys()), autopct=style['autopct'])
+    axes.set_title(f'{title} - Funding Distribution by Category')
+    figure.tight_layout()
+    figure.savefig(f'{filename}_pie_chart.png')
+
+
+def render_line_chart(years, title, filename):
+    sorted_years = sorted(years.items())
+    style = CHART_STYLE['line']
+    figure, axes = _new_figure(style['figsize'])
+    axes.plot([item[0] for item in sorted_years], [item[1] for item in sorted_years], marker=style['marker'])
+    axes.set_title(f'{title} - Projects Started by Year')
+    axes.set_xlabel('Year')
+    axes.set_ylabel('Number of Projects')
+    axes.grid(True)
+    figure.tight_layout()
+    figure.savefig(f'{filename}_line_chart.png')
+
 
-        sorted_years = sorted(years.items())
-
-        plt.figure(figsize=(10, 6))
-        plt.plot([item[0] for item in sorted_years], [item[1] for item in sorted_years], marker='o')
-        plt.title(f'{title} - Projects Started by Year')
-        plt.xlabel('Year')
-        plt.ylabel('Number of Projects')
-        plt.grid(True)
-        plt.tight_layout()
-        plt.savefig(f'{filename}_line_chart.png')
-        plt.show()
-        print(f"Line chart saved as {filename}_line_chart.png")
+_RENDERERS = {'bar': render_bar_chart, 'pie': render_pie_chart, 'line': render_line_chart}